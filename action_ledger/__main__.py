@@ -7,6 +7,7 @@
     python -m action_ledger sequence close --session S42 [--outcome "..."]
     python -m action_ledger sequence intent --session S42 "the intent"
     python -m action_ledger params
+    python -m action_ledger storage import|export|compact
 """
 
 from __future__ import annotations
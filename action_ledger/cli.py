@@ -47,6 +47,7 @@ def register_ledger_commands(
     show.add_argument("--target", default="", help="Filter by target (substring)")
     show.add_argument("--origin", default="", help="Filter by origin (manual, emitted)")
     show.add_argument("--routes", action="store_true", help="Show routes")
+    show.add_argument("--limit", type=int, default=0, help="Show only the N most recent")
     show.set_defaults(func=_cmd_show)
 
     # --- sequence ---
@@ -123,6 +124,28 @@ def register_ledger_commands(
     cycles_cmd.add_argument("--type", default="", help="Filter by cycle type (verb_sequence, trajectory, intent, stall)")
     cycles_cmd.set_defaults(func=_cmd_cycles)
 
+    # --- storage ---
+    storage_cmd = subparsers.add_parser(
+        f"{prefix}storage",
+        help="Action stream storage backend",
+    )
+    storage_sub = storage_cmd.add_subparsers(dest="storage_command")
+
+    storage_import = storage_sub.add_parser(
+        "import", help="Switch to the journal backend, seeding it from YAML",
+    )
+    storage_import.add_argument("--input", default="", help="YAML file (default: actions.yaml)")
+    storage_import.set_defaults(func=_cmd_storage_import)
+
+    storage_export = storage_sub.add_parser("export", help="Write the journal out as YAML")
+    storage_export.add_argument("--output", default="", help="YAML file (default: actions.yaml)")
+    storage_export.set_defaults(func=_cmd_storage_export)
+
+    storage_compact = storage_sub.add_parser("compact", help="Fold the journal into its snapshot")
+    storage_compact.set_defaults(func=_cmd_storage_compact)
+
+    storage_cmd.set_defaults(func=lambda args: storage_cmd.print_help())
+
     # --- params ---
     params = subparsers.add_parser(
         f"{prefix}params",
@@ -185,38 +208,22 @@ def _parse_routes(raw: list[str]) -> list[dict[str, str | float]]:
 # ---------------------------------------------------------------------------
 
 def _cmd_record(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import (
-        load_actions,
-        load_param_registry,
-        load_sequences,
-        record,
-        save_actions,
-        save_param_registry,
-        save_sequences,
-    )
-
-    actions = load_actions()
-    sequences = load_sequences()
-    registry = load_param_registry()
+    from action_ledger.ledger import ledger_session
 
     params = _parse_params(args.param)
     produced = _parse_produced(args.produced)
     routes = _parse_routes(args.route)
 
-    action = record(
-        actions, sequences, registry,
-        session=args.session,
-        verb=args.verb,
-        target=args.target,
-        context=args.context,
-        params=params,
-        produced=produced,
-        routes=routes,
-    )
-
-    save_actions(actions)
-    save_sequences(sequences)
-    save_param_registry(registry)
+    with ledger_session() as ledger:
+        action = ledger.record(
+            session=args.session,
+            verb=args.verb,
+            target=args.target,
+            context=args.context,
+            params=params,
+            produced=produced,
+            routes=routes,
+        )
 
     param_str = " ".join(f"{k}={v}" for k, v in action.params.items()) if action.params else ""
     print(f"Recorded: {action.id} [{action.verb}] {action.target}")
@@ -226,19 +233,20 @@ def _cmd_record(args: argparse.Namespace) -> None:
 
 
 def _cmd_show(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import load_actions
-
-    index = load_actions()
-    actions = index.actions
-
-    if args.session:
-        actions = [a for a in actions if a.session == args.session]
-    if args.verb:
-        actions = [a for a in actions if a.verb == args.verb]
-    if args.target:
-        actions = [a for a in actions if args.target in a.target]
-    if args.origin:
-        actions = [a for a in actions if a.origin == args.origin]
+    from action_ledger.columnar import load_columns
+
+    # Filter on the columnar sidecar, then materialize only the matching rows
+    with load_columns() as columns:
+        rows = columns.select(
+            session=args.session or None,
+            verb=args.verb or None,
+            origin=args.origin or None,
+        )
+        if args.target:
+            rows = [r for r in rows if args.target in columns.value("target", r)]
+        if args.limit:
+            rows = rows[-args.limit:]
+        actions = columns.actions(rows)
 
     if not actions:
         print("No actions found.")
@@ -282,24 +290,23 @@ def _cmd_sequence_show(args: argparse.Namespace) -> None:
 
 
 def _cmd_sequence_close(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import close_sequence, load_sequences, save_sequences
+    from action_ledger.ledger import close_sequence, ledger_session
 
-    index = load_sequences()
-    seq = close_sequence(index, args.session, outcome=args.outcome)
+    # The close emission joins the session, so it lands with the close itself
+    with ledger_session() as ledger:
+        seq = close_sequence(ledger.sequences, args.session, outcome=args.outcome)
     if seq:
-        save_sequences(index)
         print(f"Closed: {seq.id}")
     else:
         print(f"No active sequence for session {args.session}")
 
 
 def _cmd_sequence_intent(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import load_sequences, save_sequences, set_sequence_intent
+    from action_ledger.ledger import ledger_session, set_sequence_intent
 
-    index = load_sequences()
-    seq = set_sequence_intent(index, args.session, args.intent)
+    with ledger_session() as ledger:
+        seq = set_sequence_intent(ledger.sequences, args.session, args.intent)
     if seq:
-        save_sequences(index)
         print(f"Intent set on {seq.id}: {args.intent}")
     else:
         print(f"No active sequence for session {args.session}")
@@ -331,29 +338,18 @@ def _cmd_chain_show(args: argparse.Namespace) -> None:
 
 
 def _cmd_chain_close_session(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import (
-        close_session,
-        emit_session_closed,
-        load_chains,
-        load_sequences,
-        save_chains,
-        save_sequences,
-    )
+    from action_ledger.ledger import close_session, emit_session_closed, ledger_session
 
-    sequences = load_sequences()
-    chains = load_chains()
-
-    chain = close_session(
-        sequences, chains, args.session,
-        prompt_essence=args.essence,
-        produced_artifacts=args.artifact,
-    )
+    with ledger_session() as ledger:
+        chain = close_session(
+            ledger.sequences, ledger.chains, args.session,
+            prompt_essence=args.essence,
+            produced_artifacts=args.artifact,
+        )
+        if chain:
+            emit_session_closed(args.session, chain)
 
     if chain:
-        # Persist BEFORE emitting — avoids stale-read race in emit_state_change
-        save_sequences(sequences)
-        save_chains(chains)
-        emit_session_closed(args.session, chain)
         print(f"Session closed: {chain.id}")
         if chain.arc:
             for axis, trajectory in chain.arc.items():
@@ -363,10 +359,9 @@ def _cmd_chain_close_session(args: argparse.Namespace) -> None:
 
 
 def _cmd_routes_from(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import load_actions
-    from action_ledger.routes import build_route_graph, routes_from
+    from action_ledger.routes import load_route_store, routes_from
 
-    graph = build_route_graph(load_actions())
+    graph = load_route_store()
     resolved = routes_from(graph, args.action_id)
     if not resolved:
         print(f"No routes from {args.action_id}")
@@ -376,10 +371,9 @@ def _cmd_routes_from(args: argparse.Namespace) -> None:
 
 
 def _cmd_routes_to(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import load_actions
-    from action_ledger.routes import build_route_graph, routes_to
+    from action_ledger.routes import load_route_store, routes_to
 
-    graph = build_route_graph(load_actions())
+    graph = load_route_store()
     resolved = routes_to(graph, args.target)
     if not resolved:
         print(f"No routes to {args.target}")
@@ -389,10 +383,9 @@ def _cmd_routes_to(args: argparse.Namespace) -> None:
 
 
 def _cmd_routes_lineage(args: argparse.Namespace) -> None:
-    from action_ledger.ledger import load_actions
-    from action_ledger.routes import build_route_graph, trace_lineage
+    from action_ledger.routes import load_route_store, trace_lineage
 
-    graph = build_route_graph(load_actions())
+    graph = load_route_store()
     layers = trace_lineage(graph, args.action_id, depth=args.depth)
     if not layers:
         print(f"No lineage found for {args.action_id}")
@@ -404,17 +397,17 @@ def _cmd_routes_lineage(args: argparse.Namespace) -> None:
 
 
 def _cmd_cycles(args: argparse.Namespace) -> None:
+    from action_ledger.columnar import load_columns
     from action_ledger.cycles import detect_all_cycles
-    from action_ledger.ledger import load_actions, load_sequences
+    from action_ledger.ledger import load_sequences
 
-    actions = load_actions()
     sequences = load_sequences()
-
-    cycles = detect_all_cycles(
-        actions, sequences,
-        min_recurrence=args.min_recurrence,
-        verb_window=args.verb_window,
-    )
+    with load_columns() as actions:
+        cycles = detect_all_cycles(
+            actions, sequences,
+            min_recurrence=args.min_recurrence,
+            verb_window=args.verb_window,
+        )
 
     if args.type:
         cycles = [c for c in cycles if c.cycle_type == args.type]
@@ -431,6 +424,55 @@ def _cmd_cycles(args: argparse.Namespace) -> None:
         print()
 
 
+def _cmd_storage_import(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from action_ledger import ledger
+    from action_ledger.columnar import build_columns
+    from action_ledger.counters import COUNTERS_NAME, IdCounters
+    from action_ledger.routes import ROUTES_NAME
+    from action_ledger.storage import import_yaml
+
+    source = Path(args.input) if args.input else ledger.DATA_DIR / "actions.yaml"
+    store = import_yaml(source, ledger.DATA_DIR)
+    # The imported stream may be ahead of the counters — rebuild on next record
+    IdCounters(ledger.DATA_DIR / COUNTERS_NAME).reset()
+    # ...and holds other routes — rebuilt from the stream on next query
+    (ledger.DATA_DIR / ROUTES_NAME).unlink(missing_ok=True)
+    build_columns(ledger.DATA_DIR)
+    count = len(store.load().actions)
+    print(f"Imported {count} actions from {source} into {store.snapshot_path}")
+
+
+def _cmd_storage_export(args: argparse.Namespace) -> None:
+    from pathlib import Path
+
+    from action_ledger import ledger
+    from action_ledger.storage import JournalActionStore, export_yaml
+
+    if not JournalActionStore(ledger.DATA_DIR).exists():
+        print("Journal backend not active — actions.yaml is already the store.")
+        return
+    target = Path(args.output) if args.output else ledger.DATA_DIR / "actions.yaml"
+    print(f"Exported to {export_yaml(ledger.DATA_DIR, target)}")
+
+
+def _cmd_storage_compact(args: argparse.Namespace) -> None:
+    from action_ledger import ledger
+    from action_ledger.columnar import sync_columns
+    from action_ledger.storage import JournalActionStore
+
+    store = JournalActionStore(ledger.DATA_DIR)
+    if not store.exists():
+        print("Journal backend not active — nothing to compact.")
+        return
+    index = store.load()
+    store.compact(index)
+    # Same actions, new snapshot file — only the sidecar's fingerprint moves
+    sync_columns(index.actions, ledger.DATA_DIR)
+    print(f"Compacted {len(index.actions)} actions into {store.snapshot_path}")
+
+
 def _cmd_params(args: argparse.Namespace) -> None:
     from action_ledger.ledger import load_param_registry
 
@@ -0,0 +1,545 @@
+"""Columnar sidecar index over the action stream, for analytics queries.
+
+Cycle detection, dispatch history, and `show` filters only need a few fields
+per action, yet loading the ledger parses every action into a pydantic model.
+This module keeps a compact binary sidecar next to the stream — the
+`actions.columns` directory — and memory-maps it:
+
+- fixed-width columns — timestamp (float64 epoch seconds) and uint32 codes
+  for session, verb, target, origin, and the `subsystem` param;
+- interned string tables for those codes (UTF-8 heap + uint32 offsets);
+- a record heap holding each action's JSON, addressed by an offsets array,
+  so single rows can be materialized as Actions without loading the rest.
+
+Every column, heap and offsets array is its own file, and `header.json`
+records how many bytes of each belong to the index, plus a fingerprint of
+the stream files it was built from. Only writers touch the sidecar:
+`save_actions` appends the newly saved actions to each file and then
+replaces the header, so an update costs O(new actions). Bytes past the
+header's lengths (a torn append) are ignored by readers and truncated by
+the next append. A full rebuild writes a new generation of files beside
+the old ones and switches the header to it.
+
+Readers never write. When the header's fingerprint does not match the
+stream (it was changed outside `save_actions`), `load_columns` indexes the
+raw stream in memory instead — from raw YAML/JSON, never through pydantic.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import time
+from array import array
+from collections.abc import Iterable, Mapping
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from action_ledger.concurrency import ledger_lock
+from action_ledger.schemas import Action
+from action_ledger.storage import JOURNAL_NAME, SNAPSHOT_NAME
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover — PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+COLUMNS_NAME = "actions.columns"
+HEADER_NAME = "header.json"
+_VERSION = 2
+
+# Interned string columns — each has a uint32 code column and a string table
+INTERNED = ("session", "verb", "target", "origin", "subsystem")
+# String tables: the interned values, then one entry per row
+TABLES = (*INTERNED, "id", "record")
+
+# Block file suffix → array typecode
+BLOCKS: dict[str, str] = {
+    "ts.col": "d",
+    **{f"{name}.col": "I" for name in INTERNED},
+    **{f"{table}.heap": "B" for table in TABLES},
+    **{f"{table}.offs": "I" for table in TABLES},
+}
+
+
+def _parse_ts(value: Any) -> float:
+    try:
+        return datetime.fromisoformat(str(value)).timestamp()
+    except ValueError:
+        return float("nan")
+
+
+# ---------------------------------------------------------------------------
+# Reading
+# ---------------------------------------------------------------------------
+
+class ActionColumns:
+    """Memory-mapped (or in-memory) view of a columns index.
+
+    Rows are stream positions (0 = oldest action). Query methods return
+    lists of row numbers; `ids`, `value`, and `action` resolve them. Use as
+    a context manager, or call `close()`, to release the mappings.
+    """
+
+    def __init__(
+        self,
+        header: dict[str, Any],
+        blocks: Mapping[str, Any],
+        maps: Iterable[mmap.mmap] = (),
+    ) -> None:
+        self.header = header
+        self.rows: int = header["rows"]
+        self._maps = list(maps)
+        self._views: list[memoryview] = []
+        lengths = header["lengths"]
+
+        def view(block: str) -> memoryview:
+            base = memoryview(blocks[block])
+            sliced = base[:lengths[block]]
+            typed = sliced.cast(BLOCKS[block])
+            self._views += [base, sliced, typed]
+            return typed
+
+        self._columns = {
+            name: view(f"{name}.col") for name in ("ts", *INTERNED)
+        }
+        self._tables: dict[str, tuple[memoryview, memoryview]] = {
+            table: (view(f"{table}.heap"), view(f"{table}.offs")) for table in TABLES
+        }
+        self._codes: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def open(cls, path: Path) -> ActionColumns:
+        """Map the sidecar directory at `path`.
+
+        Raises OSError or ValueError if it is missing, from another version,
+        or shorter than its header says.
+        """
+        header = _read_header(path)
+        maps: list[mmap.mmap] = []
+        blocks: dict[str, Any] = {}
+        try:
+            for block, length in header["lengths"].items():
+                if not length:
+                    blocks[block] = b""
+                    continue
+                with open(path / f"{header['generation']}.{block}", "rb") as f:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                maps.append(mm)
+                if len(mm) < length:
+                    raise ValueError(f"Truncated columns block {block} in {path}")
+                blocks[block] = mm
+            return cls(header, blocks, maps)
+        except BaseException:
+            for mm in maps:
+                mm.close()
+            raise
+
+    def __enter__(self) -> ActionColumns:
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # --- string tables ---
+
+    def _string(self, table: str, i: int) -> str:
+        heap, offsets = self._tables[table]
+        return bytes(heap[offsets[i]:offsets[i + 1]]).decode("utf-8")
+
+    def strings(self, table: str) -> list[str]:
+        """All entries of a string table, in code order."""
+        _, offsets = self._tables[table]
+        return [self._string(table, i) for i in range(len(offsets) - 1)]
+
+    def code(self, column: str, value: str) -> int | None:
+        """Interned code for a value, or None if it never occurs."""
+        if column not in self._codes:
+            self._codes[column] = {s: i for i, s in enumerate(self.strings(column))}
+        return self._codes[column].get(value)
+
+    # --- row access ---
+
+    def code_at(self, column: str, row: int) -> int:
+        """The interned code of a column at a row."""
+        return self._columns[column][row]
+
+    def value(self, column: str, row: int) -> str:
+        """The string value of an interned column at a row."""
+        return self._string(column, self._columns[column][row])
+
+    def timestamp(self, row: int) -> float:
+        return self._columns["ts"][row]
+
+    def ids(self, rows: Iterable[int]) -> list[str]:
+        return [self._string("id", r) for r in rows]
+
+    def record(self, row: int) -> dict[str, Any]:
+        """The raw (unvalidated) action data at a row."""
+        return json.loads(self._string("record", row))
+
+    def rows_with(self, column: str, codes: Iterable[int]) -> list[int]:
+        """Rows whose interned value is any of `codes`, in stream order."""
+        wanted = set(codes)
+        if not wanted:
+            return []
+        values = self._columns[column]
+        return [r for r in range(self.rows) if values[r] in wanted]
+
+    def action(self, row: int) -> Action:
+        """Materialize a single row as an Action."""
+        return Action.model_validate_json(self._string("record", row))
+
+    def actions(self, rows: Iterable[int]) -> list[Action]:
+        return [self.action(r) for r in rows]
+
+    # --- queries ---
+
+    def select(
+        self,
+        *,
+        session: str | None = None,
+        verb: str | None = None,
+        target: str | None = None,
+        origin: str | None = None,
+        subsystem: str | None = None,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        rows: Iterable[int] | None = None,
+    ) -> list[int]:
+        """Rows matching every given predicate, in stream order."""
+        selected = list(rows) if rows is not None else range(self.rows)
+        for column, wanted in (
+            ("session", session), ("verb", verb), ("target", target),
+            ("origin", origin), ("subsystem", subsystem),
+        ):
+            if wanted is None:
+                continue
+            code = self.code(column, wanted)
+            if code is None:
+                return []
+            values = self._columns[column]
+            selected = [r for r in selected if values[r] == code]
+        if since is not None or until is not None:
+            lo = since.timestamp() if since is not None else float("-inf")
+            hi = until.timestamp() if until is not None else float("inf")
+            ts = self._columns["ts"]
+            selected = [r for r in selected if lo <= ts[r] <= hi]
+        return list(selected)
+
+    def group_by(
+        self,
+        column: str,
+        rows: Iterable[int] | None = None,
+    ) -> dict[str, list[int]]:
+        """Rows grouped by an interned column's value, in first-seen order."""
+        values = self._columns[column]
+        by_code: dict[int, list[int]] = {}
+        for r in rows if rows is not None else range(self.rows):
+            by_code.setdefault(values[r], []).append(r)
+        return {self._string(column, c): group for c, group in by_code.items()}
+
+    def close(self) -> None:
+        self._columns.clear()
+        self._tables.clear()
+        # Derived views first — a mapping cannot close while views export it
+        for view in reversed(self._views):
+            view.release()
+        self._views.clear()
+        for mm in self._maps:
+            mm.close()
+        self._maps.clear()
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+class _ColumnBuilder:
+    """Accumulates rows as the bytes to add to each block.
+
+    Started from an existing index (`base`), it continues that index's
+    interned codes and heap offsets, so its blocks can be appended to the
+    index's files as they are. IDs are deduplicated among the added rows
+    only.
+    """
+
+    def __init__(self, base: ActionColumns | None = None) -> None:
+        self.rows = 0
+        self.ts = array("d")
+        self.codes = {name: array("I") for name in INTERNED}
+        self.heaps = {table: bytearray() for table in TABLES}
+        self.offsets = {table: array("I") for table in TABLES}
+        self._heap_base = dict.fromkeys(TABLES, 0)
+        self._interned: dict[str, dict[str, int]] = {name: {} for name in INTERNED}
+        self._seen: set[str] = set()
+        if base is None:
+            for table in TABLES:
+                self.offsets[table].append(0)
+            return
+        for table in TABLES:
+            self._heap_base[table] = base.header["lengths"][f"{table}.heap"]
+        for name in INTERNED:
+            self._interned[name] = {s: i for i, s in enumerate(base.strings(name))}
+
+    def _push(self, table: str, value: str) -> None:
+        heap = self.heaps[table]
+        heap += value.encode("utf-8")
+        self.offsets[table].append(self._heap_base[table] + len(heap))
+
+    def _intern(self, column: str, value: str) -> int:
+        codes = self._interned[column]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self._push(column, value)
+        return code
+
+    def add(self, raw: dict[str, Any]) -> None:
+        action_id = str(raw.get("id", ""))
+        if action_id in self._seen:
+            return
+        self._seen.add(action_id)
+        params = raw.get("params") or {}
+        self.ts.append(_parse_ts(raw.get("timestamp", "")))
+        for column, value in (
+            ("session", raw.get("session", "")),
+            ("verb", raw.get("verb", "")),
+            ("target", raw.get("target", "")),
+            ("origin", raw.get("origin", "manual")),
+            ("subsystem", params.get("subsystem", "")),
+        ):
+            self.codes[column].append(self._intern(column, str(value)))
+        self._push("id", action_id)
+        self._push("record", json.dumps(raw, separators=(",", ":"), default=str))
+        self.rows += 1
+
+    def blocks(self) -> dict[str, bytes]:
+        blocks = {"ts.col": self.ts.tobytes()}
+        for name in INTERNED:
+            blocks[f"{name}.col"] = self.codes[name].tobytes()
+        for table in TABLES:
+            blocks[f"{table}.heap"] = bytes(self.heaps[table])
+            blocks[f"{table}.offs"] = self.offsets[table].tobytes()
+        return blocks
+
+    def columns(self) -> ActionColumns:
+        """The rows added so far as an in-memory index (unbased builders only)."""
+        blocks = self.blocks()
+        return ActionColumns(_header("", self.rows, {}, blocks), blocks)
+
+
+def _header(
+    generation: str,
+    rows: int,
+    source: dict[str, Any],
+    blocks: Mapping[str, bytes],
+) -> dict[str, Any]:
+    return {
+        "version": _VERSION,
+        "generation": generation,
+        "rows": rows,
+        "source": source,
+        "lengths": {block: len(data) for block, data in blocks.items()},
+    }
+
+
+def _read_header(path: Path) -> dict[str, Any]:
+    header = json.loads((path / HEADER_NAME).read_bytes())
+    if header.get("version") != _VERSION:
+        raise ValueError(f"Unsupported action columns version in {path}")
+    return header
+
+
+def _write_header(path: Path, header: dict[str, Any]) -> None:
+    tmp = path / f"{HEADER_NAME}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(header), encoding="utf-8")
+    os.replace(tmp, path / HEADER_NAME)
+
+
+def _open_sidecar(path: Path) -> ActionColumns | None:
+    try:
+        return ActionColumns.open(path)
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def _rebuild(path: Path, builder: _ColumnBuilder, source: dict[str, Any]) -> None:
+    """Write `builder`'s rows as a new generation and switch the header to it."""
+    if path.is_file():
+        path.unlink()  # a single-file sidecar from version 1
+    path.mkdir(parents=True, exist_ok=True)
+    generation = f"{time.time_ns():x}"
+    blocks = builder.blocks()
+    for block, data in blocks.items():
+        (path / f"{generation}.{block}").write_bytes(data)
+    _write_header(path, _header(generation, builder.rows, source, blocks))
+    # Readers still mapping the old generation keep their (unlinked) files
+    for stale in path.iterdir():
+        if stale.name != HEADER_NAME and not stale.name.startswith(f"{generation}."):
+            stale.unlink(missing_ok=True)
+
+
+def _append(
+    path: Path,
+    header: dict[str, Any],
+    builder: _ColumnBuilder,
+    source: dict[str, Any],
+) -> None:
+    """Extend each block file with `builder`'s rows, then patch the header."""
+    lengths = dict(header["lengths"])
+    for block, data in builder.blocks().items():
+        with open(path / f"{header['generation']}.{block}", "r+b") as f:
+            # Drop whatever a crashed append left past the indexed length
+            f.truncate(lengths[block])
+            f.seek(lengths[block])
+            f.write(data)
+        lengths[block] += len(data)
+    _write_header(path, {
+        **header,
+        "rows": header["rows"] + builder.rows,
+        "source": source,
+        "lengths": lengths,
+    })
+
+
+# ---------------------------------------------------------------------------
+# Source tracking
+# ---------------------------------------------------------------------------
+
+def _stat(path: Path) -> list[int] | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    # Atomic rewrites replace the inode, so it catches same-size rewrites
+    # landing within one mtime tick
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
+def _source_state(directory: Path) -> dict[str, Any]:
+    """Fingerprint of the files backing the stream in `directory`."""
+    snapshot = directory / SNAPSHOT_NAME
+    if snapshot.exists():
+        journal = _stat(directory / JOURNAL_NAME)
+        return {
+            "backend": "journal",
+            "snapshot": _stat(snapshot),
+            "journal_bytes": journal[0] if journal else 0,
+        }
+    return {"backend": "yaml", "yaml": _stat(directory / "actions.yaml")}
+
+
+def _raw_yaml(path: Path) -> list[dict[str, Any]]:
+    if not path.exists():
+        return []
+    with open(path, encoding="utf-8") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    return (data or {}).get("actions") or []
+
+
+def _raw_journal(path: Path) -> list[dict[str, Any]]:
+    """Journal rows up to the last complete line; one still being written
+    is left for a later read."""
+    if not path.exists():
+        return []
+    rows = []
+    with open(path, "rb") as f:
+        for line in f:
+            if not line.endswith(b"\n"):
+                break
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                continue
+    return rows
+
+
+def _scan(directory: Path) -> _ColumnBuilder:
+    """Index the raw stream files in `directory`."""
+    builder = _ColumnBuilder()
+    if (directory / SNAPSHOT_NAME).exists():
+        with open(directory / SNAPSHOT_NAME, encoding="utf-8") as f:
+            raw_rows = json.load(f).get("actions") or []
+        raw_rows += _raw_journal(directory / JOURNAL_NAME)
+    else:
+        raw_rows = _raw_yaml(directory / "actions.yaml")
+    for raw in raw_rows:
+        builder.add(raw)
+    return builder
+
+
+# ---------------------------------------------------------------------------
+# Entry points
+# ---------------------------------------------------------------------------
+
+def sync_columns(actions: list[Action], directory: Path | None = None) -> Path:
+    """Bring the sidecar in line with a stream that was just saved.
+
+    When the sidecar's rows are a prefix of `actions` (checked by the ID at
+    its last row), only the actions past it are appended; otherwise the
+    sidecar is rebuilt from `actions`. Either way the header takes the
+    stream files' current fingerprint. Takes `ledger_lock`.
+    """
+    from action_ledger import ledger
+
+    directory = directory or ledger.DATA_DIR
+    path = directory / COLUMNS_NAME
+    with ledger_lock(directory):
+        source = _source_state(directory)
+        base = _open_sidecar(path)
+        if base is not None:
+            with base:
+                rows, header = base.rows, base.header
+                prefix = rows <= len(actions) and (
+                    rows == 0 or base.ids([rows - 1])[0] == actions[rows - 1].id
+                )
+                builder = _ColumnBuilder(base) if prefix else None
+            if builder is not None:
+                for action in actions[rows:]:
+                    builder.add(action.model_dump(mode="json"))
+                try:
+                    _append(path, header, builder, source)
+                    return path
+                except OSError:
+                    pass  # a block file went missing — rebuild below
+        builder = _ColumnBuilder()
+        for action in actions:
+            builder.add(action.model_dump(mode="json"))
+        _rebuild(path, builder, source)
+    return path
+
+
+def build_columns(directory: Path | None = None) -> Path:
+    """Rebuild the sidecar for `directory` (default: ledger DATA_DIR) from
+    its raw stream files. For writers that replace the stream wholesale."""
+    from action_ledger import ledger
+
+    directory = directory or ledger.DATA_DIR
+    path = directory / COLUMNS_NAME
+    with ledger_lock(directory):
+        source = _source_state(directory)
+        _rebuild(path, _scan(directory), source)
+    return path
+
+
+def load_columns(directory: Path | None = None) -> ActionColumns:
+    """Open the columns index for `directory` (default: ledger DATA_DIR).
+
+    Maps the sidecar when its fingerprint matches the stream files;
+    otherwise the raw stream is indexed in memory. Never writes — the
+    sidecar is kept current by `save_actions`.
+    """
+    from action_ledger import ledger
+
+    directory = directory or ledger.DATA_DIR
+    columns = _open_sidecar(directory / COLUMNS_NAME)
+    if columns is not None:
+        if columns.header.get("source") == _source_state(directory):
+            return columns
+        columns.close()
+    return _scan(directory).columns()
@@ -0,0 +1,166 @@
+"""Cross-process coordination for ledger writes.
+
+Several processes (the CLI, contrib_engine, intake_router, parallel agents)
+read-modify-write the same ledger files. Three pieces keep them from losing
+each other's writes:
+
+- `ledger_lock` — an advisory exclusive lock on the data directory, held only
+  while files are being written. Reentrant within a thread.
+- A generation number, bumped on every committed write. A LedgerSession
+  remembers the generation it loaded and compares it before saving.
+- Three-way merges. When the generation moved, the session's changes
+  (ours, relative to what it loaded — base) are replayed onto a fresh load
+  (theirs) before saving. Action, sequence, and chain IDs are unique across
+  processes (see counters.py), so merging is by ID.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — non-POSIX platforms
+    fcntl = None
+
+from action_ledger.schemas import (
+    ActionIndex,
+    ChainIndex,
+    ParamRegistry,
+    SequenceIndex,
+)
+
+LOCK_NAME = ".ledger.lock"
+GENERATION_NAME = ".ledger.generation"
+
+_held = threading.local()
+
+
+@contextmanager
+def ledger_lock(directory: Path) -> Iterator[None]:
+    """Hold the exclusive write lock for a ledger data directory."""
+    depths: dict[str, int] = _held.__dict__.setdefault("depths", {})
+    key = str(directory)
+    if depths.get(key):
+        depths[key] += 1
+        try:
+            yield
+        finally:
+            depths[key] -= 1
+        return
+
+    directory.mkdir(parents=True, exist_ok=True)
+    with open(directory / LOCK_NAME, "a", encoding="utf-8") as f:
+        if fcntl is not None:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        depths[key] = 1
+        try:
+            yield
+        finally:
+            depths[key] = 0
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+def read_generation(directory: Path) -> int:
+    """Current write generation of a data directory (0 if never written)."""
+    try:
+        return int((directory / GENERATION_NAME).read_text(encoding="utf-8").strip() or 0)
+    except (FileNotFoundError, ValueError):
+        return 0
+
+
+def bump_generation(directory: Path) -> int:
+    """Advance the write generation. Call while holding `ledger_lock`."""
+    generation = read_generation(directory) + 1
+    directory.mkdir(parents=True, exist_ok=True)
+    (directory / GENERATION_NAME).write_text(str(generation), encoding="utf-8")
+    return generation
+
+
+# ---------------------------------------------------------------------------
+# Three-way merges — replay ours-since-base onto theirs
+# ---------------------------------------------------------------------------
+
+def merge_actions(base_count: int, ours: ActionIndex, theirs: ActionIndex) -> ActionIndex:
+    """Append the actions recorded since base (ours[base_count:]) to theirs."""
+    known = {a.id for a in theirs.actions}
+    for action in ours.actions[base_count:]:
+        if action.id not in known:
+            theirs.actions.append(action)
+    return theirs
+
+
+def merge_sequences(
+    base: SequenceIndex,
+    ours: SequenceIndex,
+    theirs: SequenceIndex,
+) -> SequenceIndex:
+    """Replay new sequences, appended actions/automation, and field edits."""
+    base_by_id = {s.id: s for s in base.sequences}
+    theirs_by_id = {s.id: s for s in theirs.sequences}
+
+    for seq in ours.sequences:
+        b = base_by_id.get(seq.id)
+        t = theirs_by_id.get(seq.id)
+        if t is None:
+            theirs.sequences.append(seq)
+            continue
+        if b is None:
+            continue
+
+        for action_id in seq.action_ids[len(b.action_ids):]:
+            if action_id not in t.action_ids:
+                t.action_ids.append(action_id)
+        for axis, values in seq.automation.items():
+            added = values[len(b.automation.get(axis, [])):]
+            if added:
+                t.automation.setdefault(axis, []).extend(added)
+        for name in ("intent", "outcome", "chain_id", "closed"):
+            if getattr(seq, name) != getattr(b, name):
+                setattr(t, name, getattr(seq, name))
+
+    return theirs
+
+
+def merge_chains(base: ChainIndex, ours: ChainIndex, theirs: ChainIndex) -> ChainIndex:
+    """Replay new chains and field edits."""
+    base_by_id = {c.id: c for c in base.chains}
+    theirs_by_id = {c.id: c for c in theirs.chains}
+
+    for chain in ours.chains:
+        b = base_by_id.get(chain.id)
+        t = theirs_by_id.get(chain.id)
+        if t is None:
+            theirs.chains.append(chain)
+            continue
+        if b is None:
+            continue
+        for name in ("prompt_essence", "sequence_ids", "arc", "produced_artifacts", "routes"):
+            if getattr(chain, name) != getattr(b, name):
+                setattr(t, name, getattr(chain, name))
+
+    return theirs
+
+
+def merge_param_registry(
+    base: ParamRegistry,
+    ours: ParamRegistry,
+    theirs: ParamRegistry,
+) -> ParamRegistry:
+    """Add our frequency deltas and widen ranges to cover our values."""
+    for name, axis in ours.axes.items():
+        b = base.axes.get(name)
+        t = theirs.axes.get(name)
+        if t is None:
+            theirs.axes[name] = axis
+            continue
+        t.frequency += axis.frequency - (b.frequency if b else 0)
+        t.range = [min(t.range[0], axis.range[0]), max(t.range[1], axis.range[1])]
+        if b is not None and axis.description != b.description:
+            t.description = axis.description
+
+    return theirs
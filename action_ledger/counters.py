@@ -0,0 +1,159 @@
+"""Persisted ID counters — constant-time, cross-process ID allocation.
+
+Action, sequence, and chain IDs end in a per-prefix sequence number. Instead
+of counting matching IDs in the stream on every record, the next number is
+reserved from a small counter file:
+
+    {"actions": {"S42/0331": 4}, "sequences": {"S42": 2}, "chains": {...}}
+
+Each reservation holds an exclusive advisory lock on the file while it reads,
+increments, and writes back, so two processes recording at once never receive
+the same number. A section missing from the file (first run, deleted file,
+fresh import) is rebuilt once from the stream the caller is recording into.
+
+The file also keeps a stamp (mtime and size) of each section's stream files
+as of the last write the counters know about. Ledger writes move the stamp
+forward (`sync`); if the stream changed any other way — restored or pulled
+from git, appended by an older checkout — the stamps differ and the section
+is reconciled with the stream, keeping the higher number per key.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover — non-POSIX platforms
+    fcntl = None
+
+COUNTERS_NAME = "counters.json"
+
+# Stream files, relative to the data directory, each section's IDs live in
+STREAM_FILES: dict[str, tuple[str, ...]] = {
+    "actions": ("actions.yaml", "actions.snapshot.json", "actions.journal.jsonl"),
+    "sequences": ("sequences.yaml",),
+    "chains": ("chains.yaml",),
+}
+_STAMPS = "_stamps"
+
+
+def stream_stamp(directory: Path, kind: str) -> str:
+    """Signature of a section's stream files (empty if none exist)."""
+    parts = []
+    for name in STREAM_FILES.get(kind, ()):
+        try:
+            st = (directory / name).stat()
+        except FileNotFoundError:
+            continue
+        parts.append(f"{name}:{st.st_mtime_ns}:{st.st_size}")
+    return "|".join(parts)
+
+
+class IdCounters:
+    """Counter file for one ledger data directory."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    @contextmanager
+    def _locked(self) -> Iterator[dict[str, Any]]:
+        """The counter data under an exclusive lock, written back on exit."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a+", encoding="utf-8") as f:
+            if fcntl is not None:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                raw = f.read()
+                data: dict[str, Any] = json.loads(raw) if raw.strip() else {}
+                yield data
+                f.seek(0)
+                f.truncate()
+                f.write(json.dumps(data, sort_keys=True))
+                f.flush()
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def reserve(
+        self,
+        kind: str,
+        key: str,
+        rebuild: Callable[[], dict[str, int]],
+    ) -> int:
+        """Reserve and return the next number for `key` within `kind`.
+
+        `rebuild` returns the section's {key: highest number in use} mapping
+        from the stream; it is only called when the section is missing or
+        the stream changed outside the ledger's own writes.
+        """
+        stamp = stream_stamp(self.path.parent, kind)
+        with self._locked() as data:
+            stamps = data.setdefault(_STAMPS, {})
+            section = data.get(kind)
+            if section is None or stamps.get(kind) != stamp:
+                section = dict(section or {})
+                for k, highest in rebuild().items():
+                    section[k] = max(section.get(k, 0), highest)
+                data[kind] = section
+                stamps[kind] = stamp
+            value = section.get(key, 0) + 1
+            section[key] = value
+        return value
+
+    def sync(self, kind: str, before: str) -> None:
+        """Record a ledger write to `kind`'s stream.
+
+        `before` is the stream stamp taken just before the write. Only if
+        the counters were in step with that stream do they take the new
+        stamp; otherwise the next reservation reconciles.
+        """
+        if not self.path.exists():
+            return
+        with self._locked() as data:
+            stamps = data.setdefault(_STAMPS, {})
+            if kind in data and stamps.get(kind) == before:
+                stamps[kind] = stream_stamp(self.path.parent, kind)
+
+    def reset(self) -> None:
+        """Drop all counters; they are rebuilt from the stream on next use."""
+        if self.path.exists():
+            os.remove(self.path)
+
+
+def _tail_number(ident: str) -> int | None:
+    """Trailing sequence number of an ID like act-S42-0331-007."""
+    tail = ident.rsplit("-", 1)[-1]
+    return int(tail) if tail.isdigit() else None
+
+
+def highest_action_numbers(action_ids: list[str]) -> dict[str, int]:
+    """Map "{session}/{MMDD}" → highest sequence number in use."""
+    result: dict[str, int] = {}
+    for ident in action_ids:
+        parts = ident.rsplit("-", 2)
+        if len(parts) != 3 or not parts[0].startswith("act-"):
+            continue
+        num = _tail_number(ident)
+        if num is None:
+            continue
+        key = f"{parts[0][len('act-'):]}/{parts[1]}"
+        result[key] = max(result.get(key, 0), num)
+    return result
+
+
+def highest_session_numbers(items: list[tuple[str, str]]) -> dict[str, int]:
+    """Map session → highest sequence number, from (session, id) pairs."""
+    result: dict[str, int] = {}
+    for session, ident in items:
+        num = _tail_number(ident)
+        if num is None:
+            continue
+        result[session] = max(result.get(session, 0), num)
+    return result
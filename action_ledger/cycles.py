@@ -13,12 +13,16 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
 
 from action_ledger.schemas import (
     ActionIndex,
     SequenceIndex,
 )
 
+if TYPE_CHECKING:
+    from action_ledger.columnar import ActionColumns
+
 
 @dataclass
 class DetectedCycle:
@@ -35,31 +39,46 @@ class DetectedCycle:
 # Verb sequence matching
 # ---------------------------------------------------------------------------
 
+def _session_verbs(
+    action_index: ActionIndex | ActionColumns,
+) -> dict[str, list[tuple[str, str]]]:
+    """Group (verb, action_id) pairs by session, in stream order."""
+    by_session: dict[str, list[tuple[str, str]]] = {}
+    if isinstance(action_index, ActionIndex):
+        for a in action_index.actions:
+            by_session.setdefault(a.session, []).append((a.verb, a.id))
+        return by_session
+
+    # Columnar sidecar — read codes, never materialize actions
+    for session, rows in action_index.group_by("session").items():
+        by_session[session] = list(zip(
+            (action_index.value("verb", r) for r in rows),
+            action_index.ids(rows),
+        ))
+    return by_session
+
+
 def _extract_verb_sequences(
-    action_index: ActionIndex,
+    action_index: ActionIndex | ActionColumns,
     window: int = 3,
 ) -> dict[str, list[tuple[str, str]]]:
     """Extract verb n-grams per session.
 
     Returns {session: [(ngram_str, first_action_id), ...]}
     """
-    by_session: dict[str, list] = {}
-    for a in action_index.actions:
-        by_session.setdefault(a.session, []).append(a)
-
     result: dict[str, list[tuple[str, str]]] = {}
-    for session, actions in by_session.items():
+    for session, pairs in _session_verbs(action_index).items():
         ngrams: list[tuple[str, str]] = []
-        for i in range(len(actions) - window + 1):
-            gram = " -> ".join(a.verb for a in actions[i : i + window])
-            ngrams.append((gram, actions[i].id))
+        for i in range(len(pairs) - window + 1):
+            gram = " -> ".join(verb for verb, _ in pairs[i : i + window])
+            ngrams.append((gram, pairs[i][1]))
         result[session] = ngrams
 
     return result
 
 
 def detect_verb_cycles(
-    action_index: ActionIndex,
+    action_index: ActionIndex | ActionColumns,
     min_recurrence: int = 2,
     window: int = 3,
 ) -> list[DetectedCycle]:
@@ -254,7 +273,7 @@ def detect_stalls(
 # ---------------------------------------------------------------------------
 
 def detect_all_cycles(
-    action_index: ActionIndex,
+    action_index: ActionIndex | ActionColumns,
     sequence_index: SequenceIndex,
     min_recurrence: int = 2,
     verb_window: int = 3,
@@ -7,11 +7,17 @@
 
 Emissions never crash the caller. If the ledger is unavailable or persistence
 fails, the function returns None and logs the failure.
+
+Inside an active LedgerSession, emissions are recorded into the session and
+persisted with it. `batched_emissions()` opens such a session for callers
+that emit in a loop but do not otherwise touch the ledger.
 """
 
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
 from action_ledger.schemas import (
@@ -43,21 +49,9 @@ def emit_state_change(
     """
     # Lazy import to avoid circular dependency — emissions.py is imported
     # by ledger.py, but also calls record() from ledger.py
-    from action_ledger.ledger import (
-        load_actions,
-        load_param_registry,
-        load_sequences,
-        record,
-        save_actions,
-        save_param_registry,
-        save_sequences,
-    )
+    from action_ledger.ledger import ledger_session
 
     try:
-        action_index = load_actions()
-        sequence_index = load_sequences()
-        param_registry = load_param_registry()
-
         emission_params: dict[str, float | str] = {
             "subsystem": subsystem,
             "from_state": from_state,
@@ -73,23 +67,17 @@ def emit_state_change(
         if routes:
             emission_routes.extend(routes)
 
-        action = record(
-            action_index,
-            sequence_index,
-            param_registry,
-            session=session or _EMISSION_SESSION,
-            verb=verb,
-            target=target,
-            context=f"{subsystem}: {from_state} → {to_state}",
-            params=emission_params,
-            produced=produced,
-            routes=emission_routes,
-            origin=ActionOrigin.EMITTED,
-        )
-
-        save_actions(action_index)
-        save_sequences(sequence_index)
-        save_param_registry(param_registry)
+        with ledger_session() as ledger:
+            action = ledger.record(
+                session=session or _EMISSION_SESSION,
+                verb=verb,
+                target=target,
+                context=f"{subsystem}: {from_state} → {to_state}",
+                params=emission_params,
+                produced=produced,
+                routes=emission_routes,
+                origin=ActionOrigin.EMITTED,
+            )
 
         logger.debug(
             "Emitted state change: %s %s (%s → %s)",
@@ -103,3 +91,32 @@ def emit_state_change(
             verb, target, exc_info=True,
         )
         return None
+
+
+@contextmanager
+def batched_emissions() -> Iterator[None]:
+    """Persist every emission made inside the block with one load/save.
+
+    Joins an already-active LedgerSession. Like emit_state_change itself this
+    never raises for ledger failures: if the ledger cannot be loaded the block
+    runs with unbatched emissions, and a failed flush is logged. Emissions are
+    flushed even when the block raises — they record transitions that
+    already happened.
+    """
+    from action_ledger.ledger import ledger_session
+
+    try:
+        ledger = ledger_session()
+    except Exception:
+        logger.debug("Ledger unavailable — emissions will not be batched", exc_info=True)
+        yield
+        return
+
+    ledger.__enter__()
+    try:
+        yield
+    finally:
+        try:
+            ledger.__exit__(None, None, None)
+        except Exception:
+            logger.debug("Batched emission flush failed", exc_info=True)
@@ -8,11 +8,34 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import datetime
 from pathlib import Path
+from typing import Any
 
 import yaml
-
+from pydantic import BaseModel
+
+from action_ledger.columnar import COLUMNS_NAME, sync_columns
+from action_ledger.concurrency import (
+    bump_generation,
+    ledger_lock,
+    merge_actions,
+    merge_chains,
+    merge_param_registry,
+    merge_sequences,
+    read_generation,
+)
+from action_ledger.counters import (
+    COUNTERS_NAME,
+    IdCounters,
+    highest_action_numbers,
+    highest_session_numbers,
+    stream_stamp,
+)
+from action_ledger.routes import ROUTES_NAME, RouteStore
 from action_ledger.schemas import (
     Action,
     ActionIndex,
@@ -25,6 +48,12 @@
     Sequence,
     SequenceIndex,
 )
+from action_ledger.storage import (
+    ActionStore,
+    JournalActionStore,
+    YamlActionStore,
+    atomic_write,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -35,28 +64,107 @@
 # Persistence
 # ---------------------------------------------------------------------------
 
+@contextmanager
+def _shared_write(path: Path | None, stream: str | None = None) -> Iterator[None]:
+    """Lock DATA_DIR and bump its generation around a default-path write.
+
+    `stream` names the ID counter section the write touches, so the
+    counters can tell this write from outside changes to the file.
+    Explicit paths are import/export targets outside the shared ledger and
+    are written without coordination.
+    """
+    if path is not None:
+        yield
+        return
+    with ledger_lock(DATA_DIR):
+        before = stream_stamp(DATA_DIR, stream) if stream else ""
+        yield
+        bump_generation(DATA_DIR)
+        if stream:
+            _id_counters().sync(stream, before)
+
+
+def _dump_yaml(model: BaseModel, path: Path) -> Path:
+    """Write a model as a YAML document, atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    atomic_write(path, yaml.safe_dump(
+        model.model_dump(mode="json"),
+        default_flow_style=False, sort_keys=False,
+    ))
+    return path
+
+
+def get_action_store() -> ActionStore:
+    """Return the storage backend for the action stream in DATA_DIR.
+
+    The journal backend is used once DATA_DIR holds a journal snapshot
+    (`action_ledger storage import`); otherwise actions.yaml is used.
+    """
+    journal = JournalActionStore(DATA_DIR)
+    if journal.exists():
+        return journal
+    return YamlActionStore(DATA_DIR / "actions.yaml")
+
+
 def load_actions(path: Path | None = None) -> ActionIndex:
-    """Load the action stream from YAML."""
-    p = path or DATA_DIR / "actions.yaml"
-    if not p.exists():
-        return ActionIndex()
-    with open(p, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not data:
-        return ActionIndex()
-    return ActionIndex.model_validate(data)
+    """Load the action stream.
+
+    With an explicit path, reads that YAML file (the import/export format).
+    Otherwise loads from the active storage backend.
+    """
+    if path is not None:
+        return YamlActionStore(path).load()
+    return get_action_store().load()
 
 
 def save_actions(index: ActionIndex, path: Path | None = None) -> Path:
-    """Persist the action stream to YAML."""
-    p = path or DATA_DIR / "actions.yaml"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "w", encoding="utf-8") as f:
-        yaml.safe_dump(
-            index.model_dump(mode="json"), f,
-            default_flow_style=False, sort_keys=False,
-        )
-    return p
+    """Persist the action stream.
+
+    With an explicit path, writes that YAML file. Otherwise saves through the
+    active storage backend — for the journal, only newly recorded actions.
+    """
+    if path is not None:
+        return YamlActionStore(path).save(index)
+    with _shared_write(path, "actions"):
+        before = stream_stamp(DATA_DIR, "actions")
+        saved = get_action_store().save(index)
+        _sync_route_store(index, before)
+        _sync_columns(index)
+        return saved
+
+
+def _sync_columns(index: ActionIndex) -> None:
+    """Append the saved actions to the columnar sidecar.
+
+    The sidecar is only an index: if it cannot be written, its fingerprint
+    goes stale and readers index the stream in memory instead.
+    """
+    try:
+        sync_columns(index.actions, DATA_DIR)
+    except OSError as exc:
+        logger.warning("Could not update %s: %s", DATA_DIR / COLUMNS_NAME, exc)
+
+
+def _sync_route_store(index: ActionIndex, before: str) -> None:
+    """Append the saved actions' routes to the on-disk route graph.
+
+    Only a store that already exists is updated; one that does not is built
+    from the full stream on first query (`load_route_store`). `before` is
+    the stream's stamp ahead of this save: if the store last synced some
+    other version of the stream, it is rebuilt rather than appended to.
+    """
+    path = DATA_DIR / ROUTES_NAME
+    if not path.exists():
+        return
+    store = RouteStore(path)
+    try:
+        after = stream_stamp(DATA_DIR, "actions")
+        if store.source == before:
+            store.sync(index.actions, after)
+        else:
+            store.rebuild(index.actions, after)
+    finally:
+        store.close()
 
 
 def load_sequences(path: Path | None = None) -> SequenceIndex:
@@ -73,14 +181,8 @@ def load_sequences(path: Path | None = None) -> SequenceIndex:
 
 def save_sequences(index: SequenceIndex, path: Path | None = None) -> Path:
     """Persist sequences to YAML."""
-    p = path or DATA_DIR / "sequences.yaml"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "w", encoding="utf-8") as f:
-        yaml.safe_dump(
-            index.model_dump(mode="json"), f,
-            default_flow_style=False, sort_keys=False,
-        )
-    return p
+    with _shared_write(path, "sequences"):
+        return _dump_yaml(index, path or DATA_DIR / "sequences.yaml")
 
 
 def load_param_registry(path: Path | None = None) -> ParamRegistry:
@@ -97,33 +199,182 @@ def load_param_registry(path: Path | None = None) -> ParamRegistry:
 
 def save_param_registry(registry: ParamRegistry, path: Path | None = None) -> Path:
     """Persist the parameter registry to YAML."""
-    p = path or DATA_DIR / "param_registry.yaml"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "w", encoding="utf-8") as f:
-        yaml.safe_dump(
-            registry.model_dump(mode="json"), f,
-            default_flow_style=False, sort_keys=False,
+    with _shared_write(path):
+        return _dump_yaml(registry, path or DATA_DIR / "param_registry.yaml")
+
+
+# ---------------------------------------------------------------------------
+# Unit of work
+# ---------------------------------------------------------------------------
+
+_ACTIVE_SESSION: ContextVar[LedgerSession | None] = ContextVar(
+    "action_ledger_session", default=None,
+)
+
+# Optimistic flush attempts before rebasing under the lock
+_COMMIT_ATTEMPTS = 3
+
+
+class LedgerSession:
+    """Load the ledger indexes once, batch any number of records, flush once.
+
+    While a session is active (inside its `with` block), emit_state_change
+    records into it instead of doing its own load/save cycle, so a batch of
+    N emissions costs one disk round-trip instead of N. Entering
+    `ledger_session()` while one is already active joins the outer session;
+    only the outermost exit flushes. Nothing is flushed if the block raises.
+
+    Flushing is compare-and-swap on the data directory's write generation:
+    if another process committed since this session loaded, the session's
+    changes are merged onto a fresh load before saving, so concurrent
+    writers never drop each other's actions.
+
+    Chains are loaded lazily on first access to `chains`.
+    """
+
+    def __init__(
+        self,
+        actions: ActionIndex,
+        sequences: SequenceIndex,
+        registry: ParamRegistry,
+        generation: int = 0,
+    ) -> None:
+        self.actions = actions
+        self.sequences = sequences
+        self.registry = registry
+        self._chains: ChainIndex | None = None
+        self._generation = generation
+        self._depth = 0
+        self._token = None
+        self._mark_base()
+
+    @classmethod
+    def load(cls) -> LedgerSession:
+        generation = read_generation(DATA_DIR)
+        return cls(
+            load_actions(), load_sequences(), load_param_registry(),
+            generation=generation,
+        )
+
+    @property
+    def chains(self) -> ChainIndex:
+        if self._chains is None:
+            self._chains = load_chains()
+            self._base_chains = self._chains.model_copy(deep=True)
+        return self._chains
+
+    def record(self, **kwargs: Any) -> Action:
+        """record() against this session's indexes."""
+        return record(self.actions, self.sequences, self.registry, **kwargs)
+
+    def flush(self) -> None:
+        """Persist every changed index, merging with writes made since load."""
+        for attempt in range(_COMMIT_ATTEMPTS):
+            final = attempt == _COMMIT_ATTEMPTS - 1
+            if not final and read_generation(DATA_DIR) != self._generation:
+                self._rebase()
+            with ledger_lock(DATA_DIR):
+                if read_generation(DATA_DIR) != self._generation:
+                    if not final:
+                        continue
+                    self._rebase()
+                self._write()
+                self._generation = read_generation(DATA_DIR)
+            break
+        self._mark_base()
+
+    def _mark_base(self) -> None:
+        """Remember the loaded state so our changes can be replayed later."""
+        self._base_actions = len(self.actions.actions)
+        self._base_sequences = self.sequences.model_copy(deep=True)
+        self._base_registry = self.registry.model_copy(deep=True)
+        self._base_chains = (
+            self._chains.model_copy(deep=True) if self._chains is not None else None
+        )
+
+    def _rebase(self) -> None:
+        """Replay this session's changes onto a fresh load of the ledger."""
+        generation = read_generation(DATA_DIR)
+        self.actions = merge_actions(self._base_actions, self.actions, load_actions())
+        self.sequences = merge_sequences(
+            self._base_sequences, self.sequences, load_sequences(),
+        )
+        self.registry = merge_param_registry(
+            self._base_registry, self.registry, load_param_registry(),
         )
-    return p
+        if self._chains is not None:
+            self._chains = merge_chains(self._base_chains, self._chains, load_chains())
+        self._generation = generation
+        logger.debug("Rebased ledger session onto generation %d", generation)
+
+    def _write(self) -> None:
+        if len(self.actions.actions) != self._base_actions:
+            save_actions(self.actions)
+        if self.sequences != self._base_sequences:
+            save_sequences(self.sequences)
+        if self.registry != self._base_registry:
+            save_param_registry(self.registry)
+        if self._chains is not None and self._chains != self._base_chains:
+            save_chains(self._chains)
+
+    def __enter__(self) -> LedgerSession:
+        if self._depth == 0:
+            self._token = _ACTIVE_SESSION.set(self)
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._depth -= 1
+        if self._depth > 0:
+            return
+        _ACTIVE_SESSION.reset(self._token)
+        self._token = None
+        if exc_type is None:
+            self.flush()
+
+
+def current_ledger_session() -> LedgerSession | None:
+    """The session active in this context, if any."""
+    return _ACTIVE_SESSION.get()
+
+
+def ledger_session() -> LedgerSession:
+    """Join the active session, or load a new one.
+
+    Use as `with ledger_session() as ledger: ...`.
+    """
+    return current_ledger_session() or LedgerSession.load()
 
 
 # ---------------------------------------------------------------------------
 # ID generation
 # ---------------------------------------------------------------------------
 
+def _id_counters() -> IdCounters:
+    return IdCounters(DATA_DIR / COUNTERS_NAME)
+
+
 def _make_action_id(session: str, actions: list[Action]) -> str:
-    """Generate action ID: act-{session}-{MMDD}-{seq:03d}."""
-    now = datetime.now()
-    date_tag = now.strftime("%m%d")
-    prefix = f"act-{session}-{date_tag}-"
-    seq = sum(1 for a in actions if a.id.startswith(prefix)) + 1
-    return f"{prefix}{seq:03d}"
+    """Generate action ID: act-{session}-{MMDD}-{seq:03d}.
+
+    The sequence number is reserved from the persisted counters, so this is
+    constant time; `actions` is only scanned if the counters are missing.
+    """
+    date_tag = datetime.now().strftime("%m%d")
+    seq = _id_counters().reserve(
+        "actions", f"{session}/{date_tag}",
+        rebuild=lambda: highest_action_numbers([a.id for a in actions]),
+    )
+    return f"act-{session}-{date_tag}-{seq:03d}"
 
 
 def _make_sequence_id(session: str, sequences: list[Sequence]) -> str:
     """Generate sequence ID: seq-{session}-{seq:03d}."""
-    existing = sum(1 for s in sequences if s.session == session)
-    return f"seq-{session}-{existing + 1:03d}"
+    seq = _id_counters().reserve(
+        "sequences", session,
+        rebuild=lambda: highest_session_numbers([(s.session, s.id) for s in sequences]),
+    )
+    return f"seq-{session}-{seq:03d}"
 
 
 # ---------------------------------------------------------------------------
@@ -265,20 +516,17 @@ def load_chains(path: Path | None = None) -> ChainIndex:
 
 def save_chains(index: ChainIndex, path: Path | None = None) -> Path:
     """Persist chains to YAML."""
-    p = path or DATA_DIR / "chains.yaml"
-    p.parent.mkdir(parents=True, exist_ok=True)
-    with open(p, "w", encoding="utf-8") as f:
-        yaml.safe_dump(
-            index.model_dump(mode="json"), f,
-            default_flow_style=False, sort_keys=False,
-        )
-    return p
+    with _shared_write(path, "chains"):
+        return _dump_yaml(index, path or DATA_DIR / "chains.yaml")
 
 
 def _make_chain_id(session: str, chains: list[Chain]) -> str:
     """Generate chain ID: chain-{session}-{seq:03d}."""
-    existing = sum(1 for c in chains if c.session == session)
-    return f"chain-{session}-{existing + 1:03d}"
+    seq = _id_counters().reserve(
+        "chains", session,
+        rebuild=lambda: highest_session_numbers([(c.session, c.id) for c in chains]),
+    )
+    return f"chain-{session}-{seq:03d}"
 
 
 # ---------------------------------------------------------------------------
@@ -391,7 +639,8 @@ def close_session(
     Note: emission is deferred — the caller must save sequences/chains FIRST,
     then call emit_session_closed() if emit=True. This avoids a stale-read
     race where emit_state_change re-reads sequences.yaml from disk before
-    the caller has persisted the close mutation.
+    the caller has persisted the close mutation. Inside a LedgerSession over
+    the same indexes the emission joins the session and ordering is moot.
     """
     # Close any open sequence — suppress its emission; close_session emits instead
     close_sequence(sequence_index, session, emit=False)
@@ -6,12 +6,29 @@
 
 Provenance injection writes back-references into artifacts so the graph
 is traversable from either direction: action → artifact and artifact → action.
+
+Two graph representations answer the same queries:
+
+- RouteGraph — built in memory from a loaded ActionIndex.
+- RouteStore — a persistent SQLite adjacency store (routes.db) kept beside
+  the stream. Node names are interned to integer IDs, and each edge row
+  holds its declaring action, target, kind, and weight, indexed in both
+  directions. Edges for newly saved actions are appended by `save_actions`,
+  so lookups cost O(edges touched) regardless of stream length. The store
+  also keeps a stamp of the stream files as of its last sync; a stream
+  replaced any other way (import, git pull, restore) no longer matches it,
+  and the store is rebuilt from the stream.
 """
 
 from __future__ import annotations
 
+import sqlite3
+from collections.abc import Iterable
 from dataclasses import dataclass, field
+from pathlib import Path
 
+from action_ledger.concurrency import ledger_lock
+from action_ledger.counters import stream_stamp
 from action_ledger.schemas import (
     ROUTE_INVERSES,
     Action,
@@ -42,6 +59,36 @@ class RouteGraph:
     forward: dict[str, list[ResolvedRoute]] = field(default_factory=dict)
     reverse: dict[str, list[ResolvedRoute]] = field(default_factory=dict)
 
+    def outgoing(self, source_id: str) -> list[ResolvedRoute]:
+        return self.forward.get(source_id, [])
+
+    def incoming(self, target: str) -> list[ResolvedRoute]:
+        return self.reverse.get(target, [])
+
+
+def _resolve_pair(
+    source_id: str,
+    kind: RouteKind,
+    target: str,
+    amount: float,
+) -> tuple[ResolvedRoute, ResolvedRoute]:
+    """The forward route and its inverse for one declared route."""
+    fwd = ResolvedRoute(
+        source_id=source_id,
+        kind=kind.value,
+        target=target,
+        amount=amount,
+        inverse=False,
+    )
+    rev = ResolvedRoute(
+        source_id=source_id,
+        kind=ROUTE_INVERSES.get(kind, f"inv_{kind.value}"),
+        target=source_id,
+        amount=amount,
+        inverse=True,
+    )
+    return fwd, rev
+
 
 def build_route_graph(index: ActionIndex) -> RouteGraph:
     """Build the bidirectional route graph from an action stream.
@@ -54,46 +101,187 @@ def build_route_graph(index: ActionIndex) -> RouteGraph:
 
     for action in index.actions:
         for route in action.routes:
-            fwd = ResolvedRoute(
-                source_id=action.id,
-                kind=route.kind.value,
-                target=route.target,
-                amount=route.effective_amount(),
-                inverse=False,
+            fwd, rev = _resolve_pair(
+                action.id, route.kind, route.target, route.effective_amount(),
             )
-
             # Forward: source_id → target
             graph.forward.setdefault(action.id, []).append(fwd)
-
             # Reverse: target → source_id (with inverse kind)
-            inv_kind = ROUTE_INVERSES.get(route.kind, f"inv_{route.kind.value}")
-            rev = ResolvedRoute(
-                source_id=action.id,
-                kind=inv_kind,
-                target=action.id,
-                amount=route.effective_amount(),
-                inverse=True,
-            )
             graph.reverse.setdefault(route.target, []).append(rev)
 
     return graph
 
 
-def routes_from(graph: RouteGraph, source_id: str) -> list[ResolvedRoute]:
+# ---------------------------------------------------------------------------
+# Persistent adjacency store
+# ---------------------------------------------------------------------------
+
+ROUTES_NAME = "routes.db"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id   INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE
+);
+CREATE TABLE IF NOT EXISTS edges (
+    seq     INTEGER PRIMARY KEY,
+    source  INTEGER NOT NULL,
+    ordinal INTEGER NOT NULL,
+    target  INTEGER NOT NULL,
+    kind    TEXT NOT NULL,
+    amount  REAL NOT NULL,
+    UNIQUE (source, ordinal)
+);
+CREATE INDEX IF NOT EXISTS edges_by_target ON edges (target);
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value NOT NULL
+);
+"""
+
+
+class RouteStore:
+    """On-disk bidirectional route graph.
+
+    The store remembers how many stream actions it has indexed; `sync`
+    appends edges for actions past that mark (the stream is append-only).
+    `rebuild` starts over for a stream that was replaced.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=30)
+        self._db.executescript(_SCHEMA)
+
+    @property
+    def indexed(self) -> int | None:
+        """Number of stream actions indexed, or None if never synced."""
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'indexed'").fetchone()
+        return row[0] if row else None
+
+    @property
+    def source(self) -> str | None:
+        """Stamp of the stream files (`stream_stamp`) as of the last sync."""
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'source'").fetchone()
+        return row[0] if row else None
+
+    def _node(self, name: str) -> int:
+        self._db.execute("INSERT OR IGNORE INTO nodes (name) VALUES (?)", (name,))
+        return self._db.execute("SELECT id FROM nodes WHERE name = ?", (name,)).fetchone()[0]
+
+    def sync(self, actions: list[Action], source: str | None = None) -> int:
+        """Index edges for the actions not yet in the store. Returns edges added.
+
+        `source` is the stream's stamp after these actions were saved.
+        """
+        start = self.indexed or 0
+        with self._db:
+            if start > len(actions):
+                # The stream was replaced by a shorter one — start over
+                self._db.execute("DELETE FROM edges")
+                start = 0
+            added = self._append(actions[start:])
+            self._db.execute(
+                "INSERT OR REPLACE INTO meta (key, value) VALUES ('indexed', ?)",
+                (len(actions),),
+            )
+            if source is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('source', ?)",
+                    (source,),
+                )
+        return added
+
+    def rebuild(self, actions: list[Action], source: str | None = None) -> int:
+        """Drop every edge and index `actions` from scratch. Returns edges added."""
+        with self._db:
+            self._db.execute("DELETE FROM edges")
+            self._db.execute("DELETE FROM nodes")
+            self._db.execute("DELETE FROM meta")
+        return self.sync(actions, source)
+
+    def _append(self, actions: Iterable[Action]) -> int:
+        added = 0
+        for action in actions:
+            if not action.routes:
+                continue
+            source = self._node(action.id)
+            for ordinal, route in enumerate(action.routes):
+                cur = self._db.execute(
+                    "INSERT OR IGNORE INTO edges (source, ordinal, target, kind, amount)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (source, ordinal, self._node(route.target),
+                     route.kind.value, route.effective_amount()),
+                )
+                added += cur.rowcount
+        return added
+
+    def outgoing(self, source_id: str) -> list[ResolvedRoute]:
+        rows = self._db.execute(
+            "SELECT t.name, e.kind, e.amount FROM edges e"
+            " JOIN nodes s ON s.id = e.source JOIN nodes t ON t.id = e.target"
+            " WHERE s.name = ? ORDER BY e.seq",
+            (source_id,),
+        )
+        return [
+            _resolve_pair(source_id, RouteKind(kind), target, amount)[0]
+            for target, kind, amount in rows
+        ]
+
+    def incoming(self, target: str) -> list[ResolvedRoute]:
+        rows = self._db.execute(
+            "SELECT s.name, e.kind, e.amount FROM edges e"
+            " JOIN nodes s ON s.id = e.source JOIN nodes t ON t.id = e.target"
+            " WHERE t.name = ? ORDER BY e.seq",
+            (target,),
+        )
+        return [
+            _resolve_pair(source, RouteKind(kind), target, amount)[1]
+            for source, kind, amount in rows
+        ]
+
+    def close(self) -> None:
+        self._db.close()
+
+
+def load_route_store(directory: Path | None = None) -> RouteStore:
+    """Open the route store for a ledger data directory (default: DATA_DIR).
+
+    A store that has never been synced, or whose stream stamp no longer
+    matches the stream files, is rebuilt from the full stream.
+    """
+    from action_ledger import ledger
+
+    directory = directory or ledger.DATA_DIR
+    store = RouteStore(directory / ROUTES_NAME)
+    if store.indexed is None or store.source != stream_stamp(directory, "actions"):
+        with ledger_lock(directory):
+            source = stream_stamp(directory, "actions")
+            if store.indexed is None or store.source != source:
+                store.rebuild(ledger.load_actions().actions, source)
+    return store
+
+
+# ---------------------------------------------------------------------------
+# Queries — answered by either RouteGraph or RouteStore
+# ---------------------------------------------------------------------------
+
+def routes_from(graph: RouteGraph | RouteStore, source_id: str) -> list[ResolvedRoute]:
     """All routes originating FROM a given action."""
-    return graph.forward.get(source_id, [])
+    return graph.outgoing(source_id)
 
 
-def routes_to(graph: RouteGraph, target: str) -> list[ResolvedRoute]:
+def routes_to(graph: RouteGraph | RouteStore, target: str) -> list[ResolvedRoute]:
     """All routes pointing TO a given target (action ID, file path, URI).
 
     Returns inverse routes — e.g., if action A has a `consumed` route to
     target X, this returns a `consumed_by` route from X back to A.
     """
-    return graph.reverse.get(target, [])
+    return graph.incoming(target)
 
 
-def find_producers(graph: RouteGraph, artifact: str) -> list[ResolvedRoute]:
+def find_producers(graph: RouteGraph | RouteStore, artifact: str) -> list[ResolvedRoute]:
     """Find all actions that produced a given artifact.
 
     Filters reverse routes for `produced_by` kind specifically.
@@ -101,7 +289,7 @@ def find_producers(graph: RouteGraph, artifact: str) -> list[ResolvedRoute]:
     return [r for r in routes_to(graph, artifact) if r.kind == "produced_by"]
 
 
-def find_consumers(graph: RouteGraph, artifact: str) -> list[ResolvedRoute]:
+def find_consumers(graph: RouteGraph | RouteStore, artifact: str) -> list[ResolvedRoute]:
     """Find all actions that consumed a given artifact."""
     return [r for r in routes_to(graph, artifact) if r.kind == "consumed_by"]
 
@@ -110,7 +298,7 @@ def find_consumers(graph: RouteGraph, artifact: str) -> list[ResolvedRoute]:
 
 
 def trace_lineage(
-    graph: RouteGraph,
+    graph: RouteGraph | RouteStore,
     action_id: str,
     depth: int = 3,
 ) -> list[list[ResolvedRoute]]:
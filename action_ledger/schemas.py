@@ -9,7 +9,7 @@
 
 from enum import StrEnum
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
 
 class ActionOrigin(StrEnum):
@@ -102,6 +102,10 @@ class ActionIndex(BaseModel):
     generated: str = ""
     actions: list[Action] = Field(default_factory=list)
 
+    # How many leading actions are already persisted by the storage backend.
+    # None means unknown — the next save must write the full stream.
+    _persisted: int | None = PrivateAttr(default=None)
+
 
 class Sequence(BaseModel):
     """A group of actions sharing a common intent.
@@ -0,0 +1,196 @@
+"""Storage backends for the action stream.
+
+The action stream is append-only, so persisting it should cost O(new actions),
+not O(stream). Two backends share one interface:
+
+- YamlActionStore — the original single-document actions.yaml. Every save
+  re-serializes the whole stream. Remains the import/export format.
+- JournalActionStore — a JSON snapshot plus an append-only JSONL journal.
+  Saving appends only the actions recorded since the index was loaded (one
+  fsynced line each). When the journal grows past a threshold it is compacted
+  into a fresh snapshot.
+
+The journal backend is active for a data directory once its snapshot exists
+(see `import_yaml`); otherwise the YAML backend is used.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Protocol
+
+import yaml
+
+from action_ledger.schemas import Action, ActionIndex
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_NAME = "actions.snapshot.json"
+JOURNAL_NAME = "actions.journal.jsonl"
+
+# Compact once the journal exceeds this many bytes (~2-3k actions)
+COMPACT_THRESHOLD_BYTES = 1 << 20
+
+
+class ActionStore(Protocol):
+    """Persistence interface for the action stream."""
+
+    def load(self) -> ActionIndex: ...
+
+    def save(self, index: ActionIndex) -> Path: ...
+
+
+def atomic_write(path: Path, text: str) -> None:
+    """Write a whole file atomically: temp file, fsync, rename.
+
+    Readers never observe a partially written file.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# YAML — whole-document format
+# ---------------------------------------------------------------------------
+
+class YamlActionStore:
+    """The action stream as one YAML document (actions.yaml)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+
+    def load(self) -> ActionIndex:
+        if not self.path.exists():
+            return ActionIndex()
+        with open(self.path, encoding="utf-8") as f:
+            data = yaml.safe_load(f)
+        if not data:
+            return ActionIndex()
+        return ActionIndex.model_validate(data)
+
+    def save(self, index: ActionIndex) -> Path:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.path, yaml.safe_dump(
+            index.model_dump(mode="json"),
+            default_flow_style=False, sort_keys=False,
+        ))
+        return self.path
+
+
+# ---------------------------------------------------------------------------
+# Journal — snapshot + append-only JSONL
+# ---------------------------------------------------------------------------
+
+class JournalActionStore:
+    """The action stream as a JSON snapshot followed by a JSONL journal.
+
+    The index returned by `load()` remembers how many of its actions are
+    already on disk, so `save()` only appends the tail. An index that did not
+    come from this store (or was truncated) is written as a full snapshot.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        compact_threshold: int = COMPACT_THRESHOLD_BYTES,
+    ) -> None:
+        self.directory = directory
+        self.snapshot_path = directory / SNAPSHOT_NAME
+        self.journal_path = directory / JOURNAL_NAME
+        self.compact_threshold = compact_threshold
+
+    def exists(self) -> bool:
+        return self.snapshot_path.exists()
+
+    def load(self) -> ActionIndex:
+        if self.snapshot_path.exists():
+            with open(self.snapshot_path, encoding="utf-8") as f:
+                index = ActionIndex.model_validate(json.load(f))
+        else:
+            index = ActionIndex()
+
+        if self.journal_path.exists():
+            # A reader racing a compaction can see the new snapshot alongside
+            # the old journal — skip journal entries the snapshot already has.
+            seen = {a.id for a in index.actions}
+            with open(self.journal_path, encoding="utf-8") as f:
+                for lineno, line in enumerate(f, start=1):
+                    if not line.strip():
+                        continue
+                    try:
+                        action = Action.model_validate_json(line)
+                    except ValueError:
+                        # A torn final line from a crash mid-append is skipped;
+                        # the next compaction drops it for good.
+                        logger.warning(
+                            "Skipping unreadable journal line %d in %s",
+                            lineno, self.journal_path,
+                        )
+                        continue
+                    if action.id not in seen:
+                        seen.add(action.id)
+                        index.actions.append(action)
+
+        index._persisted = len(index.actions)
+        return index
+
+    def save(self, index: ActionIndex) -> Path:
+        mark = index._persisted
+        if mark is None or mark > len(index.actions):
+            return self.compact(index)
+
+        pending = index.actions[mark:]
+        if pending:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.journal_path, "a", encoding="utf-8") as f:
+                for action in pending:
+                    f.write(action.model_dump_json() + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            index._persisted = len(index.actions)
+
+        if (
+            self.journal_path.exists()
+            and self.journal_path.stat().st_size > self.compact_threshold
+        ):
+            return self.compact(index)
+        return self.journal_path
+
+    def compact(self, index: ActionIndex) -> Path:
+        """Fold the full index into a new snapshot and truncate the journal."""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        atomic_write(self.snapshot_path, index.model_dump_json())
+        if self.journal_path.exists():
+            self.journal_path.unlink()
+        index._persisted = len(index.actions)
+        logger.info(
+            "Compacted %d actions into %s", len(index.actions), self.snapshot_path,
+        )
+        return self.snapshot_path
+
+
+# ---------------------------------------------------------------------------
+# Import / export
+# ---------------------------------------------------------------------------
+
+def import_yaml(yaml_path: Path, directory: Path) -> JournalActionStore:
+    """Seed a journal store in `directory` from a YAML action stream.
+
+    Creating the snapshot is what switches the directory to the journal
+    backend.
+    """
+    store = JournalActionStore(directory)
+    store.compact(YamlActionStore(yaml_path).load())
+    return store
+
+
+def export_yaml(directory: Path, yaml_path: Path) -> Path:
+    """Write the journal store in `directory` out as a YAML action stream."""
+    return YamlActionStore(yaml_path).save(JournalActionStore(directory).load())
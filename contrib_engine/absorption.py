@@ -6,19 +6,27 @@
 3. Reveal independent convergence with our design choices
 
 Flagged items enter the formalization pipeline: detect → assess → formalize → deposit.
+
+Each tracked conversation keeps a cursor (absorption_cursors.yaml, next to
+tracked_conversations.yaml): the newest comment timestamp and ID seen and
+the ETag of the last fetch. A scan asks GitHub only for comments since the
+cursor, so a cycle costs one conditional request per quiet conversation.
 """
 
 from __future__ import annotations
 
 import logging
 import re
+from collections.abc import Iterable
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import yaml
 
-from contrib_engine.github_client import _run_gh
+from contrib_engine.gh_executor import default_executor
+from contrib_engine.github_client import get_issue_comments
 from contrib_engine.schemas import (
     AbsorptionIndex,
     AbsorptionItem,
@@ -35,6 +43,7 @@
 
 # --- Detection heuristics ---
 
+# Patterns are lower case; they are matched against the lower-cased comment
 EXPANSION_PATTERNS: list[tuple[str, AbsorptionTrigger, str]] = [
     # (regex, trigger type, evidence template)
     (
@@ -93,26 +102,85 @@
 MIN_COMMENT_LENGTH = 80  # Short comments rarely contain deep questions
 
 
-def detect_triggers(text: str) -> list[tuple[AbsorptionTrigger, str]]:
-    """Run expansion heuristics against a comment body.
+@dataclass(frozen=True)
+class TriggerMatch:
+    """One expansion pattern found in a comment: what it means and where."""
 
-    Returns list of (trigger_type, evidence) for all matches.
-    Returns empty list if text matches reduction patterns or is too short.
+    trigger: AbsorptionTrigger
+    evidence: str
+    span: tuple[int, int]
+
+
+class TriggerEngine:
+    """Expansion and reduction patterns, compiled once.
+
+    A comment is lower-cased once and every pattern is searched in it
+    case-sensitively, which lets re use its fast literal-prefix scan; with
+    IGNORECASE it tries every position instead. (One merged alternation of
+    all patterns has the same problem, so each pattern keeps its own regex.)
+    A text whose length changes when lower-cased, which would shift the
+    spans, is searched with the IGNORECASE compilations instead.
     """
-    if len(text) < MIN_COMMENT_LENGTH:
-        return []
 
-    # Check reduction patterns first — early exit
-    for pattern in REDUCTION_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
+    def __init__(
+        self,
+        expansion: list[tuple[str, AbsorptionTrigger, str]],
+        reduction: list[str],
+        min_length: int,
+    ) -> None:
+        self.min_length = min_length
+        self._reduction = [re.compile(p) for p in reduction]
+        self._reduction_i = [re.compile(p, re.IGNORECASE) for p in reduction]
+        self._expansion = [(re.compile(p), t, e) for p, t, e in expansion]
+        self._expansion_i = [(re.compile(p, re.IGNORECASE), t, e) for p, t, e in expansion]
+
+    def match(self, text: str) -> list[TriggerMatch]:
+        """Expansion matches in pattern order, first occurrence of each.
+
+        Empty if the text is too short or matches any reduction pattern.
+        """
+        if len(text) < self.min_length:
             return []
+        lowered = text.lower()
+        if len(lowered) == len(text):
+            text, reduction, expansion = lowered, self._reduction, self._expansion
+        else:
+            reduction, expansion = self._reduction_i, self._expansion_i
+
+        # Check reduction patterns first — early exit
+        for pattern in reduction:
+            if pattern.search(text):
+                return []
+
+        matches = []
+        for pattern, trigger, evidence in expansion:
+            m = pattern.search(text)
+            if m:
+                matches.append(TriggerMatch(trigger, evidence, m.span()))
+        return matches
 
-    triggers = []
-    for pattern, trigger_type, evidence in EXPANSION_PATTERNS:
-        if re.search(pattern, text, re.IGNORECASE):
-            triggers.append((trigger_type, evidence))
 
-    return triggers
+_ENGINE = TriggerEngine(EXPANSION_PATTERNS, REDUCTION_PATTERNS, MIN_COMMENT_LENGTH)
+
+
+def match_triggers(text: str) -> list[TriggerMatch]:
+    """Run expansion heuristics against a comment body, with match spans."""
+    return _ENGINE.match(text)
+
+
+def detect_triggers_many(texts: Iterable[str]) -> list[list[TriggerMatch]]:
+    """match_triggers over many comment bodies, e.g. to backfill absorption."""
+    match = _ENGINE.match
+    return [match(text) for text in texts]
+
+
+def detect_triggers(text: str) -> list[tuple[AbsorptionTrigger, str]]:
+    """Run expansion heuristics against a comment body.
+
+    Returns list of (trigger_type, evidence) for all matches.
+    Returns empty list if text matches reduction patterns or is too short.
+    """
+    return [(m.trigger, m.evidence) for m in _ENGINE.match(text)]
 
 
 def fetch_inbound_comments(
@@ -121,6 +189,7 @@ def fetch_inbound_comments(
     issue_number: int,
     since: str = "",
     our_username: str = "4444J99",
+    cursor: dict[str, Any] | None = None,
 ) -> list[dict[str, Any]]:
     """Fetch comments on an issue/PR from external users (not us).
 
@@ -130,20 +199,40 @@ def fetch_inbound_comments(
         issue_number: Issue or PR number.
         since: ISO date string — only return comments after this date.
         our_username: Our GitHub username to exclude.
+        cursor: This conversation's {since, last_id, etag} high-water mark.
+            Only comments past it are fetched and returned; it is advanced
+            in place.
 
     Returns:
-        List of {user, body, created_at, url} dicts.
+        List of {id, user, body, created_at, url} dicts.
     """
-    result = _run_gh([
-        "api", f"repos/{owner}/{repo}/issues/{issue_number}/comments",
-        "-q", f'[.[] | select(.user.login != "{our_username}") '
-              f'| {{user: .user.login, body: .body, '
-              f'created_at: .created_at, '
-              f'url: .html_url}}]',
-    ], timeout=15)
-
-    if not isinstance(result, list):
-        return []
+    cursor = cursor if cursor is not None else {}
+    cursor_since = cursor.get("since", "")
+    raw, etag = get_issue_comments(
+        owner, repo, issue_number,
+        since=max(cursor_since, since), etag=cursor.get("etag", ""),
+    )
+
+    # `since` matches on updated_at, so edited old comments come back too
+    last_id = cursor.get("last_id", 0)
+    new = [c for c in raw if c.get("id", 0) > last_id]
+    if raw:
+        cursor["last_id"] = max([last_id] + [c.get("id", 0) for c in raw])
+        cursor["since"] = max([cursor_since] + [c.get("updated_at") or "" for c in raw])
+    # The ETag only stands for the query it answered
+    cursor["etag"] = etag if cursor.get("since", "") == cursor_since else ""
+
+    result = [
+        {
+            "id": c.get("id", 0),
+            "user": (c.get("user") or {}).get("login", ""),
+            "body": c.get("body") or "",
+            "created_at": c.get("created_at", ""),
+            "url": c.get("html_url", ""),
+        }
+        for c in new
+        if (c.get("user") or {}).get("login") != our_username
+    ]
 
     if since:
         result = [c for c in result if c.get("created_at", "") > since]
@@ -151,9 +240,15 @@ def fetch_inbound_comments(
     return result
 
 
+def _conversation_key(conv: dict[str, Any]) -> str:
+    return f"{conv['owner']}/{conv['repo']}#{conv['issue_number']}"
+
+
 def scan_conversations(
     conversations: list[dict[str, Any]] | None = None,
     since: str = "",
+    cursors: dict[str, dict[str, Any]] | None = None,
+    existing: AbsorptionIndex | None = None,
 ) -> list[AbsorptionItem]:
     """Scan tracked conversations for expansion-worthy questions.
 
@@ -161,6 +256,12 @@ def scan_conversations(
         conversations: List of {owner, repo, issue_number} dicts.
             If None, reads from outreach.yaml to find all tracked issues/PRs.
         since: Only scan comments after this ISO date.
+        cursors: Per-conversation cursors (see load_cursors). Conversations
+            with a cursor are fetched incrementally; all cursors are
+            advanced in place. Without cursors every comment is fetched.
+        existing: The current absorption index, used to skip comments
+            already tracked. Loaded only when a conversation has no cursor
+            yet and returns comments.
 
     Returns:
         List of newly detected AbsorptionItems.
@@ -168,23 +269,37 @@ def scan_conversations(
     if conversations is None:
         conversations = _load_tracked_conversations()
 
-    existing = load_absorption()
-    existing_urls = {item.source_url for item in existing.items}
+    if cursors is None:
+        conv_cursors: list[dict[str, Any] | None] = [None] * len(conversations)
+    else:
+        conv_cursors = [cursors.setdefault(_conversation_key(c), {}) for c in conversations]
+    # Comments of conversations without history may already be in the index
+    unseen = [not (cursor or {}).get("last_id") for cursor in conv_cursors]
+    existing_urls: set[str] | None = None
 
     detected: list[AbsorptionItem] = []
 
-    for conv in conversations:
+    # Fetch every thread concurrently, then classify in conversation order
+    fetched = default_executor().map(
+        lambda pair: fetch_inbound_comments(
+            pair[0]["owner"], pair[0]["repo"], pair[0]["issue_number"],
+            since=since, cursor=pair[1],
+        ),
+        list(zip(conversations, conv_cursors, strict=True)),
+    )
+    for conv, first_scan, comments in zip(conversations, unseen, fetched, strict=True):
         owner = conv["owner"]
         repo = conv["repo"]
-        issue_number = conv["issue_number"]
         workspace = conv.get("workspace", f"contrib--{owner}-{repo}")
 
-        comments = fetch_inbound_comments(owner, repo, issue_number, since=since)
-
         for comment in comments:
             url = comment.get("url", "")
-            if url in existing_urls:
-                continue  # Already tracked
+            if first_scan:
+                if existing_urls is None:
+                    index = existing if existing is not None else load_absorption()
+                    existing_urls = {item.source_url for item in index.items}
+                if url in existing_urls:
+                    continue  # Already tracked
 
             triggers = detect_triggers(comment.get("body", ""))
             if not triggers:
@@ -278,7 +393,8 @@ def run_absorption_scan(since: str = "") -> AbsorptionIndex:
         Updated AbsorptionIndex with newly detected items appended.
     """
     index = load_absorption()
-    new_items = scan_conversations(since=since)
+    cursors = load_cursors()
+    new_items = scan_conversations(since=since, cursors=cursors, existing=index)
 
     if new_items:
         index.items.extend(new_items)
@@ -286,6 +402,7 @@ def run_absorption_scan(since: str = "") -> AbsorptionIndex:
         logger.info("Absorption scan: %d new items detected", len(new_items))
     else:
         logger.info("Absorption scan: no new items detected")
+    save_cursors(cursors)
 
     return index
 
@@ -337,6 +454,31 @@ def save_tracked_conversations_config(conversations: list[dict[str, Any]]) -> No
         yaml.safe_dump(conversations, f, default_flow_style=False, sort_keys=False)
 
 
+# --- Per-conversation scan cursors ---
+
+CURSORS_PATH = DATA_DIR / "absorption_cursors.yaml"
+
+
+def load_cursors() -> dict[str, dict[str, Any]]:
+    """Load scan cursors, keyed owner/repo#number → {since, last_id, etag}."""
+    if not CURSORS_PATH.exists():
+        return {}
+    with open(CURSORS_PATH, encoding="utf-8") as f:
+        data = yaml.safe_load(f)
+    return data if isinstance(data, dict) else {}
+
+
+def save_cursors(cursors: dict[str, dict[str, Any]]) -> None:
+    """Save scan cursors.
+
+    Save them only after the items they scanned past are saved, so a
+    failed save never skips comments.
+    """
+    CURSORS_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(CURSORS_PATH, "w", encoding="utf-8") as f:
+        yaml.safe_dump(cursors, f, default_flow_style=False, sort_keys=True)
+
+
 def add_tracked_conversation(
     owner: str, repo: str, issue_number: int, workspace: str = "", label: str = "",
 ) -> None:
@@ -761,9 +903,10 @@ def run_full_absorption_cycle(since: str = "") -> dict[str, int]:
 
     results = {"detected": 0, "formalized": 0, "deposited": 0}
 
-    # Phase 1: Detect
+    # Phase 1: Detect (only comments past each conversation's cursor)
     index = load_absorption()
-    new_items = scan_conversations(since=since)
+    cursors = load_cursors()
+    new_items = scan_conversations(since=since, cursors=cursors, existing=index)
     if new_items:
         index.items.extend(new_items)
         results["detected"] = len(new_items)
@@ -788,6 +931,7 @@ def run_full_absorption_cycle(since: str = "") -> dict[str, int]:
     # Save state
     if results["detected"] or results["formalized"]:
         save_absorption(index)
+    save_cursors(cursors)
     if results["deposited"]:
         save_backflow(backflow_index)
 
@@ -0,0 +1,192 @@
+"""Conditional-request cache for `gh api` GET calls.
+
+Scan, monitor and absorption cycles fetch the same repo metadata and
+comment threads over and over. This cache keeps each response with its
+ETag / Last-Modified and, once an entry's TTL has passed, revalidates it
+with If-None-Match / If-Modified-Since. GitHub answers an unchanged
+resource with 304, which does not count against the primary rate limit.
+
+TTLs are per endpoint family (TTL_POLICIES): repo metadata changes
+rarely and is served without any request for a day, comment threads are
+revalidated on every call. Only single-page GETs are cached — `--paginate`
+and requests with a method or fields go straight to gh.
+
+The cache is a JSON file under contrib_engine/data/ (CACHE_PATH). Requests
+go through the shared GhExecutor and the cache may be used from its worker
+threads.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+from contrib_engine import gh_executor
+
+logger = logging.getLogger(__name__)
+
+CACHE_PATH = Path(__file__).parent / "data" / "gh_cache.json"
+
+# (family, endpoint pattern, seconds an entry is served without revalidation)
+TTL_POLICIES: tuple[tuple[str, re.Pattern[str], int], ...] = (
+    ("comments", re.compile(r"/comments$"), 0),
+    ("repo", re.compile(r"^repos/[^/]+/[^/]+$"), 24 * 3600),
+    ("issue", re.compile(r"^repos/[^/]+/[^/]+/(issues|pulls)/\d+$"), 300),
+)
+DEFAULT_FAMILY = ("other", 300)
+
+# gh api flags that make a request something other than a single GET
+_UNCACHEABLE = {"--paginate", "-X", "--method", "-f", "-F", "--field", "--raw-field", "--input"}
+
+_STATUS_LINE = re.compile(r"^HTTP/[\d.]+ (\d{3})")
+_HEADER_END = re.compile(r"\r?\n\r?\n")
+
+
+def cacheable(args: list[str]) -> bool:
+    """Whether a gh invocation is a single-page `gh api` GET."""
+    return (
+        len(args) > 1
+        and args[0] == "api"
+        and args[1] != "graphql"
+        and not _UNCACHEABLE.intersection(args)
+    )
+
+
+def family(endpoint: str) -> tuple[str, int]:
+    """(family name, TTL seconds) for an API endpoint path."""
+    endpoint = endpoint.lstrip("/").split("?", 1)[0]
+    for name, pattern, ttl in TTL_POLICIES:
+        if pattern.search(endpoint):
+            return name, ttl
+    return DEFAULT_FAMILY
+
+
+def _parse_body(body: str) -> dict | list | str | None:
+    if not body.strip():
+        return None
+    try:
+        return json.loads(body)
+    except json.JSONDecodeError:
+        return body.strip()
+
+
+def split_response(stdout: str) -> tuple[int | None, dict[str, str], str]:
+    """Split `gh api --include` output into (status, headers, body)."""
+    match = _STATUS_LINE.match(stdout)
+    if not match:
+        return None, {}, stdout
+    parts = _HEADER_END.split(stdout, maxsplit=1)
+    head, body = parts[0], parts[1] if len(parts) > 1 else ""
+    headers = {}
+    for line in head.splitlines()[1:]:
+        name, sep, value = line.partition(":")
+        if sep:
+            headers[name.strip().lower()] = value.strip()
+    return int(match.group(1)), headers, body
+
+
+class ResponseCache:
+    """ETag/Last-Modified cache of `gh api` responses, persisted at `path`."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] | None = None
+        # family -> Counter of fresh / revalidated / miss / error
+        self.stats: dict[str, Counter[str]] = {}
+        # guards _entries, stats and the cache file across executor threads
+        self._lock = threading.Lock()
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        if self._entries is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._entries = json.load(f)
+            except (OSError, json.JSONDecodeError):
+                self._entries = {}
+        return self._entries
+
+    def _save(self) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._entries, f)
+            tmp.replace(self.path)
+        except OSError as e:
+            logger.warning("Could not save gh response cache: %s", e)
+
+    def _count(self, name: str, outcome: str) -> None:
+        self.stats.setdefault(name, Counter())[outcome] += 1
+
+    def summary(self) -> dict[str, dict[str, int]]:
+        """Hit/miss counters per endpoint family since this cache was created."""
+        with self._lock:
+            return {name: dict(counts) for name, counts in sorted(self.stats.items())}
+
+    def run(self, args: list[str], timeout: int = 30) -> dict | list | str | None:
+        """`gh <args>` through the cache; same return convention as _run_gh."""
+        key = json.dumps(args)
+        name, ttl = family(args[1])
+        with self._lock:
+            entry = self._load().get(key)
+            if entry is not None and time.time() - entry["fetched_at"] < ttl:
+                self._count(name, "fresh")
+                return _parse_body(entry["body"])
+            entry = dict(entry) if entry is not None else None
+
+        cmd_args = [*args, "--include"]
+        if entry is not None:
+            if entry.get("etag"):
+                cmd_args += ["-H", f"If-None-Match: {entry['etag']}"]
+            if entry.get("last_modified"):
+                cmd_args += ["-H", f"If-Modified-Since: {entry['last_modified']}"]
+        result = gh_executor.default_executor().run(cmd_args, timeout=timeout)
+        if result is None:
+            return None
+
+        # gh exits non-zero on a 304, so go by the status line
+        status, headers, body = split_response(result.stdout)
+        if status == 304 and entry is not None:
+            with self._lock:
+                self._count(name, "revalidated")
+                entry["fetched_at"] = time.time()
+                self._load()[key] = entry
+                self._save()
+            return _parse_body(entry["body"])
+        if status is None or not 200 <= status < 300 or result.returncode != 0:
+            with self._lock:
+                self._count(name, "error")
+            logger.warning(
+                "gh command failed: gh %s\nstderr: %s", " ".join(cmd_args), result.stderr
+            )
+            return None
+
+        with self._lock:
+            self._count(name, "miss")
+            if headers.get("etag") or headers.get("last-modified"):
+                self._load()[key] = {
+                    "etag": headers.get("etag", ""),
+                    "last_modified": headers.get("last-modified", ""),
+                    "body": body,
+                    "fetched_at": time.time(),
+                }
+                self._save()
+        return _parse_body(body)
+
+
+_default: ResponseCache | None = None
+
+
+def default_cache() -> ResponseCache:
+    """The process-wide cache at CACHE_PATH."""
+    global _default
+    if _default is None:
+        _default = ResponseCache(CACHE_PATH)
+    return _default
@@ -0,0 +1,233 @@
+"""Bounded, rate-limited runner for gh CLI subprocesses.
+
+Every gh call the contribution engine makes goes through one GhExecutor:
+
+- at most `max_concurrency` gh processes run at once; `map()` fans a
+  helper (get_repo_info, search_issues, ...) out over a thread pool of
+  that size
+- each call first takes a token from a per-resource token bucket
+  (RATE_LIMITS). GitHub's secondary limits cap REST traffic at roughly 900
+  points a minute and search at 30 requests a minute; the buckets stay
+  under both
+- a call that fails with a 5xx or a secondary rate limit / abuse response
+  is retried up to `max_retries` times with jittered exponential backoff.
+  A secondary limit also pauses its whole bucket, so concurrent callers
+  back off together instead of tripping it again
+- each call's wall time, attempts and outcome are kept in `metrics`
+
+Timeouts and a missing gh binary are logged and reported as None, never
+raised.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import re
+import subprocess
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MAX_CONCURRENCY = 8
+MAX_RETRIES = 3
+# Base delay in seconds before retrying a 5xx; doubles on each attempt
+BACKOFF = 1.0
+# GitHub asks clients to wait at least a minute after a secondary limit
+# response that carries no Retry-After (gh does not surface the header)
+SECONDARY_LIMIT_WAIT = 60.0
+
+# bucket -> (tokens per second, burst)
+RATE_LIMITS: dict[str, tuple[float, int]] = {
+    "core": (10.0, 10),
+    "search": (0.5, 5),
+}
+
+_SERVER_ERROR = re.compile(r"HTTP 5\d\d\b")
+_SECONDARY_LIMIT = re.compile(
+    r"secondary rate limit|abuse detection|submitted too quickly|HTTP 429", re.IGNORECASE
+)
+
+
+def bucket_for(args: list[str]) -> str:
+    """The RATE_LIMITS bucket a gh invocation draws from."""
+    if args[:1] == ["search"] or (args[:1] == ["api"] and args[1:2] and
+                                  args[1].lstrip("/").startswith("search/")):
+        return "search"
+    return "core"
+
+
+class TokenBucket:
+    """Thread-safe token bucket that can be paused for a while."""
+
+    def __init__(
+        self,
+        rate: float,
+        burst: int,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(burst)
+        self._stamp = clock()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """Take one token, blocking until one is available. Returns seconds waited."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._stamp) * self.rate)
+                self._stamp = now
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                else:
+                    delay = (1 - self._tokens) / self.rate
+            self._sleep(delay)
+            waited += delay
+
+    def pause(self, seconds: float) -> None:
+        """Hand out no tokens for the next `seconds`."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, self._clock() + seconds)
+
+
+@dataclass
+class CallMetric:
+    """Timing of one gh call, across all its attempts."""
+
+    command: str
+    seconds: float
+    attempts: int
+    ok: bool
+
+
+def retry_reason(result: subprocess.CompletedProcess[str]) -> str | None:
+    """'secondary' or 'server' when a failed call is worth retrying, else None."""
+    if result.returncode == 0:
+        return None
+    if _SECONDARY_LIMIT.search(result.stderr):
+        return "secondary"
+    if _SERVER_ERROR.search(result.stderr):
+        return "server"
+    return None
+
+
+class GhExecutor:
+    """Runs gh commands with bounded concurrency, rate limiting and retries."""
+
+    def __init__(
+        self,
+        max_concurrency: int = MAX_CONCURRENCY,
+        max_retries: int = MAX_RETRIES,
+        backoff: float = BACKOFF,
+        secondary_wait: float = SECONDARY_LIMIT_WAIT,
+        rate_limits: dict[str, tuple[float, int]] | None = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.secondary_wait = secondary_wait
+        self._sleep = sleep
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self.buckets = {
+            name: TokenBucket(rate, burst, sleep=sleep)
+            for name, (rate, burst) in (rate_limits or RATE_LIMITS).items()
+        }
+        self.metrics: list[CallMetric] = []
+        self._metrics_lock = threading.Lock()
+
+    def _record(self, args: list[str], start: float, attempts: int, ok: bool) -> None:
+        metric = CallMetric(" ".join(args[:2]), time.monotonic() - start, attempts, ok)
+        with self._metrics_lock:
+            self.metrics.append(metric)
+
+    def _delay(self, reason: str, attempt: int) -> float:
+        base = self.secondary_wait if reason == "secondary" else self.backoff
+        return base * 2 ** attempt * random.uniform(0.5, 1.5)
+
+    def run(self, args: list[str], timeout: int = 30) -> subprocess.CompletedProcess[str] | None:
+        """Run `gh <args>`; the last attempt's result, or None if gh never finished."""
+        cmd = ["gh", *args]
+        bucket = self.buckets.get(bucket_for(args)) or self.buckets["core"]
+        start = time.monotonic()
+        attempt = 0
+        while True:
+            bucket.acquire()
+            try:
+                with self._slots:
+                    result = subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+            except subprocess.TimeoutExpired:
+                logger.warning("gh command timed out: %s", " ".join(cmd))
+                self._record(args, start, attempt + 1, ok=False)
+                return None
+            except FileNotFoundError:
+                logger.error("gh CLI not found — install from https://cli.github.com/")
+                self._record(args, start, attempt + 1, ok=False)
+                return None
+            reason = retry_reason(result)
+            if reason is None or attempt == self.max_retries:
+                self._record(args, start, attempt + 1, ok=result.returncode == 0)
+                return result
+            delay = self._delay(reason, attempt)
+            logger.info(
+                "gh %s error, retrying in %.1fs (%d/%d): %s",
+                reason, delay, attempt + 1, self.max_retries, " ".join(cmd),
+            )
+            if reason == "secondary":
+                bucket.pause(delay)
+            else:
+                self._sleep(delay)
+            attempt += 1
+
+    def map(self, fn: Callable[[T], R], items: Iterable[T]) -> list[R]:
+        """`[fn(item) for item in items]`, up to max_concurrency at a time."""
+        items = list(items)
+        if self.max_concurrency <= 1 or len(items) <= 1:
+            return [fn(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(items))) as pool:
+            return list(pool.map(fn, items))
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Per gh subcommand: calls, retries, failures, total and slowest seconds."""
+        with self._metrics_lock:
+            metrics = list(self.metrics)
+        totals: dict[str, dict[str, float]] = {}
+        for m in metrics:
+            row = totals.setdefault(m.command.split(" ", 1)[0], {
+                "calls": 0, "retries": 0, "failures": 0, "seconds": 0.0, "max_seconds": 0.0,
+            })
+            row["calls"] += 1
+            row["retries"] += m.attempts - 1
+            row["failures"] += not m.ok
+            row["seconds"] += m.seconds
+            row["max_seconds"] = max(row["max_seconds"], m.seconds)
+        return dict(sorted(totals.items()))
+
+
+_default: GhExecutor | None = None
+
+
+def default_executor() -> GhExecutor:
+    """The process-wide executor every gh helper shares."""
+    global _default
+    if _default is None:
+        _default = GhExecutor()
+    return _default
@@ -2,54 +2,73 @@
 
 All GitHub interaction goes through the gh CLI to stay consistent
 with the workspace policy (no octokit, no direct API tokens in code).
+Every gh process is started by the shared GhExecutor (gh_executor), which
+bounds concurrency, rate-limits and retries; the `*_batch` helpers fan a
+helper out over its thread pool.
 """
 
 from __future__ import annotations
 
 import json
 import logging
-import subprocess
+from collections.abc import Iterable
 from typing import Any
+from urllib.parse import quote
+
+from contrib_engine import gh_cache, gh_executor
 
 logger = logging.getLogger(__name__)
 
 
 def _run_gh(args: list[str], timeout: int = 30) -> dict | list | str | None:
-    """Run a gh CLI command and return parsed JSON output."""
-    cmd = ["gh"] + args
+    """Run a gh CLI command and return parsed JSON output.
+
+    Single-page `gh api` GETs are served through the conditional-request
+    cache (gh_cache); everything else runs directly.
+    """
+    if gh_cache.cacheable(args):
+        return gh_cache.default_cache().run(args, timeout=timeout)
+    result = gh_executor.default_executor().run(args, timeout=timeout)
+    if result is None:
+        return None
+    if result.returncode != 0:
+        logger.warning("gh command failed: gh %s\nstderr: %s", " ".join(args), result.stderr)
+        return None
+    if not result.stdout.strip():
+        return None
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-        )
-        if result.returncode != 0:
-            logger.warning("gh command failed: %s\nstderr: %s", " ".join(cmd), result.stderr)
-            return None
-        if not result.stdout.strip():
-            return None
         return json.loads(result.stdout)
-    except subprocess.TimeoutExpired:
-        logger.warning("gh command timed out: %s", " ".join(cmd))
-        return None
     except json.JSONDecodeError:
         return result.stdout.strip()
-    except FileNotFoundError:
-        logger.error("gh CLI not found — install from https://cli.github.com/")
-        return None
 
 
 def get_repo_info(owner: str, repo: str) -> dict[str, Any] | None:
-    """Get repository metadata."""
+    """Get repository metadata.
+
+    Fetched from the REST endpoint (cacheable by ETag) and reshaped to the
+    `gh repo view --json` field names; `issues.totalCount` is GitHub's
+    open issue count, which includes open PRs.
+    """
     result = _run_gh([
-        "repo", "view", f"{owner}/{repo}",
-        "--json", "name,description,stargazerCount,isArchived,hasIssuesEnabled,"
-        "primaryLanguage,licenseInfo,issues",
+        "api", f"repos/{owner}/{repo}",
+        "-q", "{name: .name, description: .description, stargazerCount: .stargazers_count, "
+        "isArchived: .archived, hasIssuesEnabled: .has_issues, "
+        "primaryLanguage: (if .language then {name: .language} else null end), "
+        "licenseInfo: (if .license then {key: .license.key, name: .license.name} else null end), "
+        "issues: {totalCount: .open_issues_count}}",
     ])
     return result if isinstance(result, dict) else None
 
 
+def get_repo_info_batch(
+    repos: Iterable[tuple[str, str]],
+) -> dict[tuple[str, str], dict[str, Any] | None]:
+    """get_repo_info for many (owner, repo) pairs, run concurrently."""
+    repos = list(dict.fromkeys(repos))
+    infos = gh_executor.default_executor().map(lambda ref: get_repo_info(*ref), repos)
+    return dict(zip(repos, infos, strict=True))
+
+
 def get_repo_stargazers(owner: str, repo: str, limit: int = 100) -> list[str]:
     """Get recent stargazers of a repo."""
     result = _run_gh([
@@ -85,6 +104,24 @@ def search_issues(
     return []
 
 
+def search_issues_batch(
+    repos: Iterable[tuple[str, str]],
+    keywords: list[str],
+    state: str = "open",
+    limit: int = 10,
+) -> dict[tuple[str, str], list[dict[str, Any]]]:
+    """search_issues with the same keywords across many (owner, repo) pairs.
+
+    Searches run concurrently but draw from the executor's search bucket,
+    which keeps them under GitHub's 30 searches a minute.
+    """
+    repos = list(dict.fromkeys(repos))
+    found = gh_executor.default_executor().map(
+        lambda ref: search_issues(*ref, keywords, state=state, limit=limit), repos
+    )
+    return dict(zip(repos, found, strict=True))
+
+
 def get_pr_status(owner: str, repo: str, pr_number: int) -> dict[str, Any] | None:
     """Get PR state, reviews, comments, CI checks."""
     result = _run_gh([
@@ -107,6 +144,179 @@ def get_issue_assignees(owner: str, repo: str, issue_number: int) -> list[str]:
     return []
 
 
+COMMENTS_PER_PAGE = 100
+
+
+def get_issue_comments(
+    owner: str,
+    repo: str,
+    issue_number: int,
+    since: str = "",
+    etag: str = "",
+    per_page: int = COMMENTS_PER_PAGE,
+) -> tuple[list[dict[str, Any]], str]:
+    """Comments on an issue or PR updated at or after `since`, all pages.
+
+    Returns (comments, ETag of the first page). Pass that ETag back with the
+    same `since` and an unchanged thread costs one conditional request,
+    which GitHub answers 304 without charging the rate limit; that and
+    failures return ([], etag or "").
+    """
+    endpoint = f"repos/{owner}/{repo}/issues/{issue_number}/comments?per_page={per_page}"
+    if since:
+        endpoint += f"&since={quote(since, safe='')}"
+    comments: list[dict[str, Any]] = []
+    first_etag = ""
+    page = 1
+    while True:
+        args = ["api", f"{endpoint}&page={page}", "--include"]
+        if page == 1 and etag:
+            args += ["-H", f"If-None-Match: {etag}"]
+        result = gh_executor.default_executor().run(args, timeout=15)
+        if result is None:
+            return [], ""
+        status, headers, body = gh_cache.split_response(result.stdout)
+        if status == 304:
+            return [], etag
+        if status is None or not 200 <= status < 300:
+            logger.warning("gh command failed: gh %s\nstderr: %s", " ".join(args), result.stderr)
+            return [], ""
+        try:
+            batch = json.loads(body)
+        except json.JSONDecodeError:
+            return [], ""
+        if not isinstance(batch, list):
+            return [], ""
+        if page == 1:
+            first_etag = headers.get("etag", "")
+        comments.extend(batch)
+        if len(batch) < per_page:
+            return comments, first_etag
+        page += 1
+
+
+# --- Batched GraphQL polling ---
+
+# Items (PRs or issues) per GraphQL query. Each PR pulls up to ~130 nodes
+# (reviews, comments, labels, assignees, check contexts), so 25 items keep a
+# query near 3k nodes — far under GitHub's 500k node and 5k cost limits.
+GRAPHQL_BATCH_SIZE = 25
+
+_ITEM_FRAGMENT = """
+fragment item on IssueOrPullRequest {
+  __typename
+  ... on PullRequest {
+    state
+    mergeable
+    reviews(last: 20) { nodes { author { login } state body submittedAt } }
+    comments(last: 20) { nodes { author { login } body createdAt } }
+    labels(first: 20) { nodes { name } }
+    assignees(first: 10) { nodes { login } }
+    commits(last: 1) { nodes { commit { statusCheckRollup { contexts(first: 50) { nodes {
+      __typename
+      ... on CheckRun { name status conclusion }
+      ... on StatusContext { context state }
+    } } } } } }
+  }
+  ... on Issue {
+    state
+    assignees(first: 10) { nodes { login } }
+  }
+}
+"""
+
+
+def _graphql(query: str, timeout: int = 30) -> dict[str, Any] | None:
+    """Run a GraphQL query through `gh api graphql` and return its `data`.
+
+    Unlike _run_gh, a non-zero exit still yields the partial `data` GitHub
+    sends alongside per-field errors (e.g. one PR number that doesn't exist).
+    """
+    result = gh_executor.default_executor().run(
+        ["api", "graphql", "-f", f"query={query}"], timeout=timeout
+    )
+    if result is None:
+        return None
+    try:
+        payload = json.loads(result.stdout)
+    except json.JSONDecodeError:
+        logger.warning("gh graphql query failed\nstderr: %s", result.stderr)
+        return None
+    if not isinstance(payload, dict):
+        return None
+    for error in payload.get("errors") or []:
+        logger.warning("gh graphql error: %s", error.get("message", error))
+    return payload.get("data")
+
+
+def _nodes(connection: dict[str, Any] | None) -> list[dict[str, Any]]:
+    return (connection or {}).get("nodes") or []
+
+
+def _normalize_item(node: dict[str, Any]) -> dict[str, Any]:
+    """Reshape a GraphQL PR/issue into the `gh pr view`/`gh issue view --json` shape."""
+    if node.get("__typename") != "PullRequest":
+        return {"state": node.get("state"), "assignees": _nodes(node.get("assignees"))}
+    commits = _nodes(node.get("commits"))
+    rollup = (commits[0].get("commit") or {}).get("statusCheckRollup") if commits else None
+    return {
+        "state": node.get("state"),
+        "mergeable": node.get("mergeable"),
+        "reviews": _nodes(node.get("reviews")),
+        "comments": _nodes(node.get("comments")),
+        "labels": _nodes(node.get("labels")),
+        "assignees": _nodes(node.get("assignees")),
+        "statusCheckRollup": _nodes((rollup or {}).get("contexts")),
+    }
+
+
+def _status_query(
+    chunk: list[tuple[str, str, int]],
+) -> tuple[str, dict[tuple[str, str], tuple[str, str, int]]]:
+    """One aliased query for `chunk`, and (repo alias, item alias) -> ref."""
+    repos: dict[tuple[str, str], list[int]] = {}
+    for owner, repo, number in chunk:
+        repos.setdefault((owner, repo), []).append(int(number))
+    parts = []
+    aliases: dict[tuple[str, str], tuple[str, str, int]] = {}
+    for i, ((owner, repo), numbers) in enumerate(repos.items()):
+        parts.append(f"  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(repo)}) {{")
+        for number in numbers:
+            item = f"n{number}"
+            aliases[(f"r{i}", item)] = (owner, repo, number)
+            parts.append(f"    {item}: issueOrPullRequest(number: {number}) {{ ...item }}")
+        parts.append("  }")
+    return "query {\n" + "\n".join(parts) + "\n}\n" + _ITEM_FRAGMENT, aliases
+
+
+def get_status_batch(
+    refs: list[tuple[str, str, int]],
+    batch_size: int = GRAPHQL_BATCH_SIZE,
+) -> dict[tuple[str, str, int], dict[str, Any]]:
+    """State of many PRs and issues, `batch_size` per GraphQL query.
+
+    `refs` are (owner, repo, number). PRs come back in the `get_pr_status`
+    shape (state, reviews, comments, labels, assignees, mergeable,
+    statusCheckRollup), issues as {state, assignees}. Refs that could not be
+    fetched are missing from the result. This is the batch variant of
+    get_pr_status; chunks are queried concurrently through the executor.
+    """
+    refs = list(dict.fromkeys(refs))
+    queries = [
+        _status_query(refs[start:start + batch_size]) for start in range(0, len(refs), batch_size)
+    ]
+    results = gh_executor.default_executor().map(lambda q: _graphql(q[0]), queries)
+    statuses: dict[tuple[str, str, int], dict[str, Any]] = {}
+    for (_, aliases), data in zip(queries, results, strict=True):
+        if not data:
+            continue
+        for (repo_alias, item_alias), ref in aliases.items():
+            node = (data.get(repo_alias) or {}).get(item_alias)
+            if node:
+                statuses[ref] = _normalize_item(node)
+    return statuses
+
+
 def fork_repo(owner: str, repo: str) -> str | None:
     """Fork a repo to the authenticated user's account. Returns fork URL."""
     result = _run_gh(["repo", "fork", f"{owner}/{repo}", "--clone=false"])
@@ -13,12 +13,13 @@
 
 import yaml
 
-from contrib_engine.github_client import get_issue_assignees, get_pr_status
+from contrib_engine.github_client import get_status_batch
 from contrib_engine.schemas import (
     ContributionStatus,
     ContributionStatusIndex,
     PRState,
 )
+from contrib_engine.seed_index import SeedIndex
 
 logger = logging.getLogger(__name__)
 
@@ -32,21 +33,19 @@ def discover_contributions() -> list[ContributionStatus]:
     if not ORGAN_IV_DIR.exists():
         return contributions
 
-    for d in ORGAN_IV_DIR.iterdir():
-        if not d.is_dir() or not d.name.startswith("contrib--"):
+    index = SeedIndex(ORGAN_IV_DIR.parent)
+    for entry in index.seeds([ORGAN_IV_DIR.name], depth=1):
+        d = entry.path.parent
+        if not d.name.startswith("contrib--"):
             continue
-
-        seed_path = d / "seed.yaml"
-        if not seed_path.exists():
+        if entry.data is None:
+            logger.warning("Skipping %s: %s", d.name, entry.error)
             continue
 
-        with open(seed_path, encoding="utf-8") as f:
-            seed = yaml.safe_load(f)
-
         # Try to find PR info from journal or status file
         status = ContributionStatus(
             workspace=d.name,
-            target=_infer_target(seed),
+            target=_infer_target(entry.data),
         )
         contributions.append(status)
 
@@ -74,13 +73,40 @@ def _infer_target(seed: dict) -> str:
     return ""
 
 
-def check_pr_state(contribution: ContributionStatus) -> dict[str, Any]:
-    """Check current PR state from GitHub. Returns dict of changes detected."""
+def _refs(contribution: ContributionStatus) -> list[tuple[str, str, int]]:
+    """(owner, repo, number) of the contribution's PR and linked issue."""
+    if not contribution.pr_number or "/" not in contribution.target:
+        return []
+    owner, repo = contribution.target.split("/", 1)
+    refs = [(owner, repo, contribution.pr_number)]
+    if contribution.issue_number:
+        refs.append((owner, repo, contribution.issue_number))
+    return refs
+
+
+def poll_contributions(
+    contributions: list[ContributionStatus],
+) -> dict[tuple[str, str, int], dict[str, Any]]:
+    """Fetch every contribution's PR and linked issue in batched GraphQL queries."""
+    return get_status_batch([ref for c in contributions for ref in _refs(c)])
+
+
+def check_pr_state(
+    contribution: ContributionStatus,
+    polled: dict[tuple[str, str, int], dict[str, Any]] | None = None,
+) -> dict[str, Any]:
+    """Check current PR state from GitHub. Returns dict of changes detected.
+
+    `polled` is a poll_contributions result covering this contribution;
+    without it the contribution is polled on its own.
+    """
     if not contribution.target or not contribution.pr_number:
         return {}
 
+    if polled is None:
+        polled = poll_contributions([contribution])
     owner, repo = contribution.target.split("/", 1)
-    pr_data = get_pr_status(owner, repo, contribution.pr_number)
+    pr_data = polled.get((owner, repo, contribution.pr_number))
     if not pr_data:
         return {}
 
@@ -131,9 +157,10 @@ def check_pr_state(contribution: ContributionStatus) -> dict[str, Any]:
         else:
             contribution.last_ci = "pending"
 
-    # Check issue assignment
-    if contribution.issue_number:
-        assignees = get_issue_assignees(owner, repo, contribution.issue_number)
+    # Check issue assignment (left unchanged if the issue couldn't be fetched)
+    issue_data = polled.get((owner, repo, contribution.issue_number or 0))
+    if contribution.issue_number and issue_data is not None:
+        assignees = [a.get("login", "") for a in issue_data.get("assignees", [])]
         was_assigned = contribution.assigned
         contribution.assigned = "4444J99" in assignees
         if not was_assigned and contribution.assigned:
@@ -206,46 +233,53 @@ def run_monitoring_cycle(run_absorption: bool = True) -> ContributionStatusIndex
     Args:
         run_absorption: Also run the Absorption Protocol scan.
     """
+    from action_ledger.emissions import batched_emissions
+
     contributions = discover_contributions()
     index = ContributionStatusIndex(
         generated=datetime.now().isoformat(),
         contributions=contributions,
     )
 
-    for contrib in contributions:
-        if not contrib.pr_number:
-            logger.debug("Skipping %s — no PR number", contrib.workspace)
-            continue
+    # All PRs and linked issues in a few GraphQL queries instead of 2 gh calls each
+    polled = poll_contributions(contributions)
 
-        changes = check_pr_state(contrib)
-        if changes:
-            journal_changes(contrib, changes)
-            logger.info(
-                "%s: %d changes detected",
-                contrib.workspace,
-                len(changes),
-            )
+    # One ledger load/save for every emission in the cycle
+    with batched_emissions():
+        for contrib in contributions:
+            if not contrib.pr_number:
+                logger.debug("Skipping %s — no PR number", contrib.workspace)
+                continue
 
-        contrib.next_action = determine_next_action(contrib)
-
-    # Save status
-    save_status(index)
-
-    # Run Absorption Protocol — detect, assess, formalize, deposit (full cycle)
-    if run_absorption:
-        try:
-            from contrib_engine.absorption import run_full_absorption_cycle
-
-            absorption_results = run_full_absorption_cycle()
-            if absorption_results["detected"]:
+            changes = check_pr_state(contrib, polled)
+            if changes:
+                journal_changes(contrib, changes)
                 logger.info(
-                    "Absorption: %d detected, %d formalized, %d deposited",
-                    absorption_results["detected"],
-                    absorption_results["formalized"],
-                    absorption_results["deposited"],
+                    "%s: %d changes detected",
+                    contrib.workspace,
+                    len(changes),
                 )
-        except Exception as e:
-            logger.warning("Absorption cycle failed: %s", e)
+
+            contrib.next_action = determine_next_action(contrib)
+
+        # Save status
+        save_status(index)
+
+        # Run Absorption Protocol — detect, assess, formalize, deposit (full cycle)
+        if run_absorption:
+            try:
+                from contrib_engine.absorption import run_full_absorption_cycle
+
+                absorption_results = run_full_absorption_cycle()
+                if absorption_results["detected"]:
+                    logger.info(
+                        "Absorption: %d detected, %d formalized, %d deposited",
+                        absorption_results["detected"],
+                        absorption_results["formalized"],
+                        absorption_results["deposited"],
+                    )
+            except Exception as e:
+                logger.warning("Absorption cycle failed: %s", e)
 
     return index
 
@@ -16,9 +16,9 @@
 
 from contrib_engine.capabilities import CAPABILITIES, match_capabilities
 from contrib_engine.github_client import (
-    get_repo_info,
+    get_repo_info_batch,
     list_user_forks,
-    search_issues,
+    search_issues_batch,
     who_starred_my_repos,
 )
 from contrib_engine.schemas import ContributionTarget, RankedTargets, TargetStatus
@@ -207,33 +207,39 @@ def scan(
         elif login not in targets[key].contacts:
             targets[key].contacts.append(login)
 
-    # Phase 2: Enrich with GitHub data
+    # Phase 2: Enrich with GitHub data (lookups run concurrently)
     if enrich_github:
-        for name, target in targets.items():
-            if not target.github:
-                # Try to find the GitHub org/repo
-                # For now, use name as org and look for main repo
-                info = get_repo_info(name, name)
-                if info:
-                    target.github = f"{name}/{name}"
-                    target.stars = info.get("stargazerCount", 0)
-
-            if target.github:
-                owner, repo = target.github.split("/", 1)
-                # Search for issues matching ORGANVM capabilities
-                all_keywords = []
-                for cap in CAPABILITIES:
-                    all_keywords.extend(cap.issue_keywords[:3])
-                issues = search_issues(owner, repo, all_keywords[:10])
-                target.matching_issues = [i.get("number", 0) for i in issues]
-
-                # Determine domain overlap
-                for issue in issues:
-                    text = f"{issue.get('title', '')} {issue.get('body', '')}"
-                    caps = match_capabilities(text)
-                    for cap in caps:
-                        if cap.id not in target.domain_overlap:
-                            target.domain_overlap.append(cap.id)
+        # Try to find the GitHub org/repo
+        # For now, use name as org and look for main repo
+        unresolved = [name for name, target in targets.items() if not target.github]
+        infos = get_repo_info_batch((name, name) for name in unresolved)
+        for name in unresolved:
+            info = infos.get((name, name))
+            if info:
+                targets[name].github = f"{name}/{name}"
+                targets[name].stars = info.get("stargazerCount", 0)
+
+        # Search for issues matching ORGANVM capabilities
+        all_keywords = []
+        for cap in CAPABILITIES:
+            all_keywords.extend(cap.issue_keywords[:3])
+        repos = {
+            name: tuple(target.github.split("/", 1))
+            for name, target in targets.items() if target.github
+        }
+        found = search_issues_batch(repos.values(), all_keywords[:10])
+        for name, repo in repos.items():
+            target = targets[name]
+            issues = found.get(repo, [])
+            target.matching_issues = [i.get("number", 0) for i in issues]
+
+            # Determine domain overlap
+            for issue in issues:
+                text = f"{issue.get('title', '')} {issue.get('body', '')}"
+                caps = match_capabilities(text)
+                for cap in caps:
+                    if cap.id not in target.domain_overlap:
+                        target.domain_overlap.append(cap.id)
 
     # Phase 3: Score all targets
     for target in targets.values():
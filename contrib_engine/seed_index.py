@@ -0,0 +1,321 @@
+"""Persistent index of seed.yaml files across ~/Workspace.
+
+The seed validators and the contribution monitor each used to walk the
+organ directories and parse every seed.yaml they found. SeedIndex does the
+walk once and keeps, per seed, its path, mtime, size and parsed content
+in a per-user cache file. Later runs refresh the index instead of
+rebuilding it:
+
+- every known seed is stat-checked and re-parsed only if its mtime or
+  size changed
+- every known directory is stat-checked and re-listed only if its mtime
+  changed (an entry was added, removed or renamed in it), descending only
+  into subdirectories the index has not seen
+
+Hidden directories and dependency trees (node_modules, virtualenvs) are
+pruned before descending, and the walk stops MAX_DEPTH levels below each
+organ directory.
+
+Seeds are parsed with libyaml's CSafeLoader when pyyaml was built with it.
+A refresh collects every seed that needs parsing and parses the batch in a
+process pool once it reaches PARALLEL_MIN files (a cold index over a whole
+workspace); smaller batches are parsed in-process. Parse failures are kept
+on the entry as `error`, never raised.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+try:
+    import yaml
+except ImportError:  # validate-thresholds runs in CI without pyyaml
+    yaml = None
+
+SEED_NAME = "seed.yaml"
+SEED_INDEX_DIR = Path.home() / ".cache" / "organvm-seeds"
+
+# Directory levels below an organ directory that may hold seeds:
+# organ/repo (1), organ/superproject/repo (2), one more for nesting
+MAX_DEPTH = 3
+SKIP_DIRS = frozenset({"node_modules", "venv", "__pycache__"})
+
+# Error recorded when pyyaml is unavailable; such entries are re-parsed on
+# the next refresh instead of being trusted
+NO_YAML = "pyyaml is not installed"
+
+# Smallest batch of seeds worth starting worker processes for
+PARALLEL_MIN = 64
+
+# Bump when SeedEntry or the index layout changes
+_INDEX_VERSION = 1
+
+
+@dataclass
+class SeedEntry:
+    """One indexed seed.yaml. `data` is None when `error` says why."""
+
+    path: Path
+    mtime_ns: int
+    size: int
+    data: dict[str, Any] | None = None
+    error: str | None = None
+
+    @property
+    def key(self) -> str:
+        """org/repo as given by the directory layout."""
+        return f"{self.path.parent.parent.name}/{self.path.parent.name}"
+
+    @property
+    def metadata(self) -> dict[str, Any]:
+        meta = (self.data or {}).get("metadata")
+        return meta if isinstance(meta, dict) else {}
+
+    @property
+    def organ(self) -> Any:
+        return (self.data or {}).get("organ")
+
+    @property
+    def tier(self) -> str:
+        return self.metadata.get("tier", "")
+
+    @property
+    def produces(self) -> list[Any]:
+        return (self.data or {}).get("produces") or []
+
+    @property
+    def consumes(self) -> list[Any]:
+        return (self.data or {}).get("consumes") or []
+
+
+def parse_seed_file(path: Path) -> tuple[dict[str, Any] | None, str | None]:
+    """Parse a seed.yaml. Returns (mapping, None) or (None, error)."""
+    if yaml is None:
+        return None, NO_YAML
+    try:
+        with open(path, encoding="utf-8") as f:
+            data = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+    except yaml.YAMLError as e:
+        return None, f"YAML parse error: {e}"
+    except (OSError, UnicodeDecodeError) as e:
+        return None, f"Unreadable: {e}"
+    if not isinstance(data, dict):
+        return None, "Not a YAML mapping"
+    return data, None
+
+
+def parse_seed_files(
+    paths: list[Path],
+    workers: int | None = None,
+) -> list[tuple[dict[str, Any] | None, str | None]]:
+    """parse_seed_file over `paths`, in a process pool for large batches."""
+    workers = workers or os.cpu_count() or 1
+    if workers > 1 and len(paths) >= PARALLEL_MIN:
+        chunk = max(1, len(paths) // (workers * 4))
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(parse_seed_file, paths, chunksize=chunk))
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            pass  # no usable process support here — parse in-process
+    return [parse_seed_file(path) for path in paths]
+
+
+def _pruned(name: str) -> bool:
+    return name.startswith(".") or name in SKIP_DIRS
+
+
+def _depth(rel: str) -> int:
+    return rel.count("/")
+
+
+@dataclass
+class _State:
+    version: int = _INDEX_VERSION
+    max_depth: int = MAX_DEPTH
+    roots: set[str] = field(default_factory=set)
+    dirs: dict[str, int] = field(default_factory=dict)  # rel dir -> mtime_ns
+    seeds: dict[str, SeedEntry] = field(default_factory=dict)  # rel seed path -> entry
+
+
+class SeedIndex:
+    """Seed files under `workspace`, indexed per organ directory (root).
+
+    Roots are indexed on first use; `seeds()` refreshes the roots it is
+    asked about and saves the index if anything changed.
+    """
+
+    def __init__(
+        self,
+        workspace: Path,
+        cache_dir: Path | None = None,
+        max_depth: int = MAX_DEPTH,
+        workers: int | None = None,
+    ) -> None:
+        self.workspace = Path(workspace).expanduser().resolve()
+        self.max_depth = max_depth
+        self.workers = workers
+        digest = hashlib.sha1(str(self.workspace).encode()).hexdigest()[:16]
+        self.path = (cache_dir or SEED_INDEX_DIR) / f"index-{digest}.pickle"
+        self._dirty = False
+        # rel seed path -> (mtime_ns, size) of seeds awaiting a parse
+        self._pending: dict[str, tuple[int, int]] = {}
+        self._state = self._load()
+
+    def _load(self) -> _State:
+        try:
+            with open(self.path, "rb") as f:
+                state = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+            return _State(max_depth=self.max_depth)
+        if (
+            not isinstance(state, _State)
+            or state.version != _INDEX_VERSION
+            or state.max_depth != self.max_depth
+        ):
+            return _State(max_depth=self.max_depth)
+        return state
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "wb") as f:
+                pickle.dump(self._state, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(self.path)
+        except OSError:
+            return  # read-only home — the index is an optimization only
+        self._dirty = False
+
+    # -- maintenance -------------------------------------------------------
+
+    def _stat_seed(self, rel: str) -> None:
+        seeds = self._state.seeds
+        path = self.workspace / rel
+        try:
+            st = path.stat()
+        except OSError:
+            self._pending.pop(rel, None)
+            if seeds.pop(rel, None) is not None:
+                self._dirty = True
+            return
+        entry = seeds.get(rel)
+        if (
+            entry is not None
+            and entry.mtime_ns == st.st_mtime_ns
+            and entry.size == st.st_size
+            and entry.error != NO_YAML
+        ):
+            return
+        self._pending[rel] = (st.st_mtime_ns, st.st_size)
+
+    def _parse_pending(self) -> None:
+        if not self._pending:
+            return
+        rels = list(self._pending)
+        paths = [self.workspace / rel for rel in rels]
+        parsed = parse_seed_files(paths, self.workers)
+        for rel, path, (data, error) in zip(rels, paths, parsed, strict=True):
+            mtime_ns, size = self._pending[rel]
+            self._state.seeds[rel] = SeedEntry(path, mtime_ns, size, data, error)
+        self._pending.clear()
+        self._dirty = True
+
+    def _drop(self, rel: str) -> None:
+        """Forget directory `rel` and everything indexed below it."""
+        prefix = rel + "/"
+        state = self._state
+        for table in (state.dirs, state.seeds, self._pending):
+            for key in [k for k in table if k == rel or k.startswith(prefix)]:
+                del table[key]
+        self._dirty = True
+
+    def _scan(self, rel: str) -> None:
+        """List directory `rel`, descending into subdirectories not yet indexed."""
+        path = self.workspace / rel
+        try:
+            mtime = path.stat().st_mtime_ns
+            with os.scandir(path) as it:
+                children = list(it)
+        except OSError:
+            self._drop(rel)
+            return
+        self._state.dirs[rel] = mtime
+        self._dirty = True
+        descend = _depth(rel) < self.max_depth
+        for child in children:
+            child_rel = f"{rel}/{child.name}"
+            if child.name == SEED_NAME:
+                if child.is_file():
+                    self._stat_seed(child_rel)
+            elif descend and not _pruned(child.name) and child.is_dir():
+                if child_rel not in self._state.dirs:
+                    self._scan(child_rel)
+
+    def refresh(self, roots: Iterable[str]) -> None:
+        """Bring the index up to date for the given organ directories."""
+        state = self._state
+        for root in roots:
+            if root not in state.roots or root not in state.dirs:
+                self._drop(root)
+                self._scan(root)
+                state.roots.add(root)
+                continue
+            prefix = root + "/"
+            for rel in [d for d in state.dirs if d == root or d.startswith(prefix)]:
+                if rel not in state.dirs:
+                    continue  # dropped along with a vanished parent
+                try:
+                    mtime = (self.workspace / rel).stat().st_mtime_ns
+                except OSError:
+                    self._drop(rel)
+                    continue
+                if mtime != state.dirs[rel]:
+                    self._scan(rel)
+            for rel in [s for s in state.seeds if s.startswith(prefix)]:
+                self._stat_seed(rel)
+        self._parse_pending()
+
+    # -- queries -----------------------------------------------------------
+
+    def seeds(self, roots: Iterable[str], depth: int | None = None) -> list[SeedEntry]:
+        """Up-to-date entries under `roots`, sorted by path.
+
+        `depth` keeps only seeds exactly that many directories below their
+        root (1 = organ/repo/seed.yaml).
+        """
+        roots = list(roots)
+        self.refresh(roots)
+        self.save()
+        prefixes = tuple(root + "/" for root in roots)
+        return [
+            entry for rel, entry in sorted(self._state.seeds.items())
+            if rel.startswith(prefixes) and (depth is None or _depth(rel) - 1 == depth)
+        ]
+
+    def entry(self, path: Path) -> SeedEntry | None:
+        """The up-to-date entry for a seed file given by path, or None if absent.
+
+        Paths outside the workspace are parsed without being indexed.
+        """
+        path = Path(path).resolve()
+        try:
+            rel = path.relative_to(self.workspace).as_posix()
+        except ValueError:
+            try:
+                st = path.stat()
+            except OSError:
+                return None
+            return SeedEntry(path, st.st_mtime_ns, st.st_size, *parse_seed_file(path))
+        self._stat_seed(rel)
+        self._parse_pending()
+        return self._state.seeds.get(rel)
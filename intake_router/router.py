@@ -9,16 +9,9 @@
 
 from pydantic import BaseModel, Field
 
+from action_ledger.columnar import load_columns
 from action_ledger.emissions import emit_state_change
-from action_ledger.ledger import (
-    load_actions,
-    load_param_registry,
-    load_sequences,
-    record,
-    save_actions,
-    save_param_registry,
-    save_sequences,
-)
+from action_ledger.ledger import ledger_session
 from action_ledger.schemas import Action, ActionOrigin, RouteKind
 
 
@@ -258,38 +251,28 @@ def route(item: IntakeItem) -> Dispatch:
 def emit_routing(dispatch: Dispatch) -> None:
     """Persist both the operator intake and the routed follow-up to the ledger."""
 
-    actions = load_actions()
-    sequences = load_sequences()
-    registry = load_param_registry()
-
-    manual_action = record(
-        actions,
-        sequences,
-        registry,
-        session=ROUTER_SESSION,
-        verb="received_intake",
-        target=f"intake:{dispatch.item.domain.value}",
-        context=dispatch.item.raw,
-        params=_dispatch_params(dispatch, include_subsystem=True),
-        routes=_manual_routes(dispatch),
-        origin=ActionOrigin.MANUAL,
-    )
+    with ledger_session() as ledger:
+        manual_action = ledger.record(
+            session=ROUTER_SESSION,
+            verb="received_intake",
+            target=f"intake:{dispatch.item.domain.value}",
+            context=dispatch.item.raw,
+            params=_dispatch_params(dispatch, include_subsystem=True),
+            routes=_manual_routes(dispatch),
+            origin=ActionOrigin.MANUAL,
+        )
 
-    save_actions(actions)
-    save_sequences(sequences)
-    save_param_registry(registry)
-
-    emit_state_change(
-        subsystem="intake_router",
-        verb="routed_intake",
-        target=f"intake_router:{dispatch.item.domain.value}",
-        from_state="received",
-        to_state="dispatched",
-        session=ROUTER_SESSION,
-        params=_dispatch_params(dispatch, include_subsystem=False)
-        | {"intake_action_id": manual_action.id},
-        routes=_emitted_routes(dispatch, manual_action.id),
-    )
+        emit_state_change(
+            subsystem="intake_router",
+            verb="routed_intake",
+            target=f"intake_router:{dispatch.item.domain.value}",
+            from_state="received",
+            to_state="dispatched",
+            session=ROUTER_SESSION,
+            params=_dispatch_params(dispatch, include_subsystem=False)
+            | {"intake_action_id": manual_action.id},
+            routes=_emitted_routes(dispatch, manual_action.id),
+        )
 
 
 def recent_dispatches(
@@ -298,14 +281,18 @@ def recent_dispatches(
 ) -> list[Action]:
     """Return the most recent emitted intake-router dispatches."""
 
-    actions = [
-        action
-        for action in load_actions().actions
-        if action.origin == ActionOrigin.EMITTED
-        and action.params.get("subsystem") == "intake_router"
-        and (domain is None or action.params.get("domain") == domain.value)
-    ]
-    return list(reversed(actions[-limit:]))
+    actions: list[Action] = []
+    with load_columns() as columns:
+        rows = columns.select(origin=ActionOrigin.EMITTED.value, subsystem="intake_router")
+
+        # Newest first; materialize only until `limit` dispatches are found
+        for row in reversed(rows):
+            if len(actions) >= limit:
+                break
+            action = columns.action(row)
+            if domain is None or action.params.get("domain") == domain.value:
+                actions.append(action)
+    return actions
 
 
 def routing_table_rows() -> list[dict[str, str]]:
@@ -7,7 +7,7 @@
 import sys
 from datetime import datetime
 
-from .search import fan_out_search
+from .search import SEARCH_TIMEOUT, STORE_TIMEOUT, fan_out_search
 
 
 def _json_default(obj):
@@ -24,6 +24,7 @@ def _print_report_json(report) -> None:
         "target": report.target,
         "days": report.days,
         "stores_queried": list(report.stores_queried),
+        "timed_out": list(report.timed_out),
         "matches_by_store": {
             store: [dataclasses.asdict(m) for m in matches]
             for store, matches in report.matches_by_store.items()
@@ -39,6 +40,8 @@ def _print_report(report, show_trail: bool) -> None:
     print(f"  Stores queried: {len(report.stores_queried)} ({', '.join(report.stores_queried)})")
     for store, results in report.matches_by_store.items():
         print(f"    {store:20s}: {len(results):3d} match{'es' if len(results) != 1 else ''}")
+    if report.timed_out:
+        print(f"  Timed out (partial results): {', '.join(report.timed_out)}")
     print()
     print(f"  Verdict: {verdict.verdict}")
     print(f"  Dimensions met: {verdict.dimensions_met}/4")
@@ -65,7 +68,10 @@ def _print_report(report, show_trail: bool) -> None:
 
 
 def _cmd_search(args) -> int:
-    report = fan_out_search(verb=args.verb, target=args.target, days=args.days)
+    report = fan_out_search(
+        verb=args.verb, target=args.target, days=args.days,
+        store_timeout=args.store_timeout, timeout=args.timeout,
+    )
     if args.json:
         _print_report_json(report)
     else:
@@ -86,6 +92,10 @@ def main(argv: list[str] | None = None) -> int:
     p_search.add_argument("--days", type=int, default=None, help="Restrict to last N days (default: no limit)")
     p_search.add_argument("--show-trail", action="store_true", help="Print full match list with citations")
     p_search.add_argument("--json", action="store_true", help="Emit machine-readable JSON instead of human-readable report")
+    p_search.add_argument("--store-timeout", type=float, default=STORE_TIMEOUT,
+                          help="Per-store deadline in seconds (default: %(default)s)")
+    p_search.add_argument("--timeout", type=float, default=SEARCH_TIMEOUT,
+                          help="Whole-search deadline in seconds (default: %(default)s)")
     p_search.set_defaults(func=_cmd_search)
 
     args = parser.parse_args(argv)
@@ -0,0 +1,208 @@
+"""Persistent inverted index over the markdown corpora (memory files, plans).
+
+Keyword queries against MEMORY_DIR and PLANS_DIR used to read and lowercase
+every file on every search. Instead, each corpus gets a small SQLite index:
+
+- files    — path, mtime_ns, size, and the file's text (for excerpts)
+- postings — (token, file) pairs, where tokens are lowercase \\w+ runs
+- vocab    — every distinct token in the postings
+
+A refresh stats the directory and re-tokenizes only files whose mtime or
+size changed, so steady-state cost is one scandir. A query finds the
+vocabulary tokens that contain each keyword token anywhere — so "ledger"
+reaches files that only say "action_ledger" — intersects their file sets,
+then confirms the original substring match on the stored text of the few
+surviving candidates.
+"""
+from __future__ import annotations
+
+import fnmatch
+import os
+import re
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+_TOKEN = re.compile(r"\w+")
+
+# Bump when the tables change shape; older databases are rebuilt
+_SCHEMA_VERSION = 2
+
+# Rescan the directory at most this often per process (seconds)
+REFRESH_INTERVAL = 2.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id       INTEGER PRIMARY KEY,
+    path     TEXT NOT NULL UNIQUE,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL,
+    text     TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    token TEXT NOT NULL,
+    file  INTEGER NOT NULL,
+    PRIMARY KEY (token, file)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_file ON postings (file);
+CREATE TABLE IF NOT EXISTS vocab (
+    token TEXT PRIMARY KEY
+) WITHOUT ROWID;
+"""
+
+# Per-index refresh locks — concurrent searches wait for one refresh
+# instead of querying a half-built index
+_refresh_locks: dict[str, threading.Lock] = {}
+_last_refresh: dict[str, float] = {}
+
+
+def tokenize(text: str) -> set[str]:
+    return set(_TOKEN.findall(text.lower()))
+
+
+@dataclass
+class IndexedFile:
+    path: Path
+    mtime_ns: int
+    text: str
+
+
+class CorpusIndex:
+    """Inverted index over the files matching `glob` directly under `root`."""
+
+    def __init__(self, root: Path, db_path: Path, glob: str = "*.md") -> None:
+        self.root = root
+        self.db_path = db_path
+        self.glob = glob
+
+    def _connect(self) -> sqlite3.Connection:
+        # One connection per call — queries run on fan-out worker threads
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.db_path, timeout=30)
+        # A rebuildable cache — trade durability for write speed
+        db.execute("PRAGMA journal_mode = WAL")
+        db.execute("PRAGMA synchronous = OFF")
+        if db.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+            db.executescript(
+                "DROP TABLE IF EXISTS postings; DROP TABLE IF EXISTS files;"
+                " DROP TABLE IF EXISTS vocab;"
+            )
+            db.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        db.executescript(_SCHEMA)
+        return db
+
+    def refresh(self, force: bool = False) -> int:
+        """Re-index new and changed files, drop deleted ones. Returns files re-indexed."""
+        key = str(self.db_path)
+        with _refresh_locks.setdefault(key, threading.Lock()):
+            last = _last_refresh.get(key, float("-inf"))
+            if not force and time.monotonic() - last < REFRESH_INTERVAL:
+                return 0
+            changed = self._refresh()
+            _last_refresh[key] = time.monotonic()
+            return changed
+
+    def _refresh(self) -> int:
+        on_disk: dict[str, tuple[int, int]] = {}
+        if self.root.is_dir():
+            with os.scandir(self.root) as entries:
+                for entry in entries:
+                    if entry.is_file() and fnmatch.fnmatch(entry.name, self.glob):
+                        st = entry.stat()
+                        on_disk[entry.path] = (st.st_mtime_ns, st.st_size)
+
+        db = self._connect()
+        try:
+            indexed = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size
+                in db.execute("SELECT id, path, mtime_ns, size FROM files")
+            }
+            changed = 0
+            with db:
+                for path, (file_id, _, _) in indexed.items():
+                    if path not in on_disk:
+                        db.execute("DELETE FROM postings WHERE file = ?", (file_id,))
+                        db.execute("DELETE FROM files WHERE id = ?", (file_id,))
+                for path, (mtime_ns, size) in on_disk.items():
+                    known = indexed.get(path)
+                    if known is not None and known[1:] == (mtime_ns, size):
+                        continue
+                    try:
+                        text = Path(path).read_text(encoding="utf-8")
+                    except (OSError, UnicodeDecodeError):
+                        continue
+                    if known is not None:
+                        db.execute("DELETE FROM postings WHERE file = ?", (known[0],))
+                    db.execute(
+                        "INSERT INTO files (path, mtime_ns, size, text) VALUES (?, ?, ?, ?)"
+                        " ON CONFLICT (path) DO UPDATE SET"
+                        " mtime_ns = excluded.mtime_ns, size = excluded.size, text = excluded.text",
+                        (path, mtime_ns, size, text),
+                    )
+                    file_id = db.execute(
+                        "SELECT id FROM files WHERE path = ?", (path,),
+                    ).fetchone()[0]
+                    tokens = tokenize(text)
+                    db.executemany(
+                        "INSERT INTO postings (token, file) VALUES (?, ?)",
+                        ((token, file_id) for token in tokens),
+                    )
+                    db.executemany(
+                        "INSERT OR IGNORE INTO vocab (token) VALUES (?)",
+                        ((token,) for token in tokens),
+                    )
+                    changed += 1
+                if changed or indexed.keys() - on_disk.keys():
+                    db.execute(
+                        "DELETE FROM vocab WHERE NOT EXISTS"
+                        " (SELECT 1 FROM postings WHERE postings.token = vocab.token)"
+                    )
+            return changed
+        finally:
+            db.close()
+
+    def search(self, keywords: list[str], name_glob: str = "*") -> list[IndexedFile]:
+        """Files whose name matches `name_glob` and whose text contains every keyword.
+
+        Keyword tokens match anywhere inside indexed tokens; the final check
+        is the same case-insensitive substring test the uncached stores applied.
+        """
+        self.refresh()
+        tokens = sorted({t for kw in keywords for t in tokenize(kw)}, key=len, reverse=True)
+        db = self._connect()
+        try:
+            candidates: set[int] | None = None
+            for token in tokens:
+                ids = {
+                    row[0] for row in db.execute(
+                        "SELECT DISTINCT file FROM postings WHERE token IN"
+                        " (SELECT token FROM vocab WHERE instr(token, ?) > 0)",
+                        (token,),
+                    )
+                }
+                candidates = ids if candidates is None else candidates & ids
+                if not candidates:
+                    return []
+
+            if candidates is None:
+                rows = db.execute("SELECT path, mtime_ns, text FROM files")
+            else:
+                marks = ",".join("?" * len(candidates))
+                rows = db.execute(
+                    f"SELECT path, mtime_ns, text FROM files WHERE id IN ({marks})",
+                    tuple(candidates),
+                )
+            lowered = [kw.lower() for kw in keywords]
+            results = []
+            for path, mtime_ns, text in rows:
+                if not fnmatch.fnmatch(os.path.basename(path), name_glob):
+                    continue
+                haystack = text.lower()
+                if all(kw in haystack for kw in lowered):
+                    results.append(IndexedFile(Path(path), mtime_ns, text))
+            return sorted(results, key=lambda f: str(f.path))
+        finally:
+            db.close()
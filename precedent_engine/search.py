@@ -1,6 +1,9 @@
 """Search orchestrator — fans out to all stores per SOP-IV-PPC-001 §2 Phase L3."""
 from __future__ import annotations
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from dataclasses import dataclass, field
 
 from . import stores
@@ -16,34 +19,63 @@ class SearchReport:
     matches_by_store: dict[str, list[Match]] = field(default_factory=dict)
     verdict: RubricVerdict | None = None
     stores_queried: list[str] = field(default_factory=list)
+    timed_out: list[str] = field(default_factory=list)  # stores past their deadline
 
 
-def fan_out_search(verb: str, target: str, days: int | None = None) -> SearchReport:
-    """Run all L3 store queries, evaluate rubric, return report."""
+# Seconds — each store gets STORE_TIMEOUT, the whole search SEARCH_TIMEOUT
+STORE_TIMEOUT = 10.0
+SEARCH_TIMEOUT = 15.0
+
+
+def fan_out_search(
+    verb: str,
+    target: str,
+    days: int | None = None,
+    store_timeout: float = STORE_TIMEOUT,
+    timeout: float = SEARCH_TIMEOUT,
+) -> SearchReport:
+    """Run all L3 store queries concurrently, evaluate rubric, return report.
+
+    Every store runs in its own worker thread. A store that misses its
+    deadline (store_timeout, capped by the global timeout) contributes no
+    matches and is listed in `report.timed_out`; the rubric is evaluated on
+    whatever came back in time.
+    """
     report = SearchReport(verb=verb, target=target, days=days)
     keywords = [verb, target] if verb and target else [verb or target]
 
+    start = time.monotonic()
+    deadline = start + min(store_timeout, timeout)
+
     queries = [
-        ("action_ledger", lambda: stores.query_action_ledger(verb, target)),
+        ("action_ledger", lambda: stores.query_action_ledger(verb, target, days=days)),
         ("feedback", lambda: stores.query_feedback_memories(keywords)),
         ("project_artifact", lambda: stores.query_project_artifacts(keywords)),
         ("project_session", lambda: stores.query_project_sessions(keywords)),
         ("plans", lambda: stores.query_originating_plans(keywords, days=days)),
-        ("git", lambda: stores.query_git_log(verb, target, days=days or 30)),
+        ("git", lambda: stores.query_git_log(verb, target, days=days or 30, deadline=deadline)),
     ]
 
+    pool = ThreadPoolExecutor(max_workers=len(queries), thread_name_prefix="precedent")
+    futures = [(name, pool.submit(fn)) for name, fn in queries]
+
     all_matches: list[Match] = []
-    for store_name, query_fn in queries:
+    for store_name, future in futures:
         report.stores_queried.append(store_name)
         try:
-            results = query_fn()
+            results = future.result(timeout=max(0.0, deadline - time.monotonic()))
+        except FutureTimeout:
+            report.matches_by_store[store_name] = []
+            report.timed_out.append(store_name)
+            print(f"  [warning] {store_name} query timed out")
+            continue
         except Exception as exc:
-            results = []
             report.matches_by_store[store_name] = []
             print(f"  [warning] {store_name} query failed: {exc}")
             continue
         report.matches_by_store[store_name] = results
         all_matches.extend(results)
+    pool.shutdown(wait=False, cancel_futures=True)
 
     feedback_n = len(report.matches_by_store.get("feedback", []))
     report.verdict = evaluate(all_matches, verb, target, feedback_match_count=feedback_n)
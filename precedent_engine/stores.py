@@ -1,19 +1,27 @@
 """Per-store query functions. Each returns a list of Match dataclasses with citations."""
 from __future__ import annotations
 
+import difflib
 import os
-import re
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
+
+from .corpus_index import CorpusIndex
+
+if TYPE_CHECKING:
+    from action_ledger.columnar import ActionColumns
 
 HOME = Path(os.path.expanduser("~"))
 MEMORY_DIR = HOME / ".claude" / "projects" / "-Users-4jp" / "memory"
 PLANS_DIR = HOME / ".claude" / "plans"
 LEDGER_FILE = HOME / "Workspace" / "organvm" / "orchestration-start-here" / "action_ledger" / "data" / "actions.yaml"
 WORKSPACE_DIR = HOME / "Workspace"
+INDEX_DIR = HOME / ".cache" / "precedent_engine"
 
 
 @dataclass
@@ -33,6 +41,14 @@ def _matches_keywords(text: str, keywords: Iterable[str]) -> bool:
     return all(kw.lower() in lowered for kw in keywords)
 
 
+def _memory_index() -> CorpusIndex:
+    return CorpusIndex(MEMORY_DIR, INDEX_DIR / "memory.db")
+
+
+def _plans_index() -> CorpusIndex:
+    return CorpusIndex(PLANS_DIR, INDEX_DIR / "plans.db")
+
+
 def _extract_excerpt(text: str, keyword: str, context_chars: int = 120) -> str:
     idx = text.lower().find(keyword.lower())
     if idx < 0:
@@ -42,37 +58,90 @@ def _extract_excerpt(text: str, keyword: str, context_chars: int = 120) -> str:
     return text[start:end].strip().replace("\n", " ")
 
 
-def query_action_ledger(verb: str, target: str) -> list[Match]:
-    """Read actions.yaml directly (avoids the broken pydantic-based CLI)."""
+# Verbs at least this similar (difflib ratio) count as fuzzy matches
+VERB_FUZZY_CUTOFF = 0.8
+
+
+def _match_verbs(verbs: list[str], verb: str) -> dict[int, str]:
+    """Map verb-table codes matching `verb` → how they matched.
+
+    Exact (case-insensitive), prefix in either direction ("merge" ~
+    "merged"), or fuzzy by edit similarity ("clasified" ~ "classified").
+    """
+    query = verb.lower()
+    if not query:
+        return {code: "any" for code in range(len(verbs))}
+    lowered = [v.lower() for v in verbs]
+    found: dict[int, str] = {}
+    for code, candidate in enumerate(lowered):
+        if candidate == query:
+            found[code] = "exact"
+        elif candidate.startswith(query) or (len(candidate) >= 3 and query.startswith(candidate)):
+            found[code] = "prefix"
+    for close in difflib.get_close_matches(query, lowered, n=10, cutoff=VERB_FUZZY_CUTOFF):
+        for code, candidate in enumerate(lowered):
+            if candidate == close:
+                found.setdefault(code, "fuzzy")
+    return found
+
+
+def query_action_ledger(verb: str, target: str, days: int | None = None) -> list[Match]:
+    """Look up per-action precedents through the ledger's columnar index.
+
+    Verbs resolve through the interned verb table (exact, prefix, fuzzy);
+    targets match as case-insensitive substrings of the interned target
+    table. Only the matching rows are decoded — one Match per action, cited
+    by action ID. Raw records are read, so schema drift never hides
+    precedents. The lookup is read-only: a sidecar that is missing or
+    stale is replaced by an in-memory scan of the stream.
+    """
     if not LEDGER_FILE.exists():
         return []
+    from action_ledger.columnar import load_columns
+
     try:
-        text = LEDGER_FILE.read_text(encoding="utf-8")
-    except OSError:
+        columns = load_columns(LEDGER_FILE.parent)
+    except (OSError, ValueError):
         return []
+    with columns:
+        return _ledger_matches(columns, verb, target, days)
+
+
+def _ledger_matches(
+    columns: ActionColumns, verb: str, target: str, days: int | None,
+) -> list[Match]:
+    verb_codes = _match_verbs(columns.strings("verb"), verb)
+    needle = target.lower()
+    target_codes = {
+        code for code, name in enumerate(columns.strings("target"))
+        if needle in name.lower()
+    }
+    rows = columns.rows_with("verb", verb_codes)
+    if days:
+        rows = columns.select(rows=rows, since=datetime.now() - timedelta(days=days))
     matches: list[Match] = []
-    blocks = re.split(r"^---$", text, flags=re.MULTILINE)
-    for block in blocks:
-        if not block.strip():
-            continue
-        if verb.lower() not in block.lower() and target.lower() not in block.lower():
-            continue
-        if not _matches_keywords(block, [verb, target] if verb and target else [verb or target]):
+    for row in rows:
+        if columns.code_at("target", row) not in target_codes:
             continue
-        ts_match = re.search(r"timestamp:\s*['\"]?([0-9T:\-\.+]+)['\"]?", block)
-        ts = None
-        if ts_match:
-            try:
-                ts = datetime.fromisoformat(ts_match.group(1).replace("Z", "+00:00"))
-            except ValueError:
-                pass
+        data = columns.record(row)
+        try:
+            ts = datetime.fromisoformat(str(data.get("timestamp", "")).replace("Z", "+00:00"))
+        except ValueError:
+            ts = None
+        action_verb = columns.value("verb", row)
+        action_target = columns.value("target", row)
+        excerpt = f"[{action_verb}] {action_target} — {data.get('context', '')}"
         matches.append(Match(
             store="action_ledger",
-            citation=f"{LEDGER_FILE}",
-            excerpt=block.strip()[:200],
+            citation=str(data.get("id", "")),
+            excerpt=excerpt.strip(" —")[:200],
             timestamp=ts,
-            verb=verb,
-            target=target,
+            verb=action_verb,
+            target=action_target,
+            extras={
+                "session": columns.value("session", row),
+                "verb_match": verb_codes[columns.code_at("verb", row)],
+            },
         ))
     return matches
 
@@ -81,19 +150,13 @@ def _grep_memory_files(pattern: str, keywords: list[str]) -> list[Match]:
     matches: list[Match] = []
     if not MEMORY_DIR.exists():
         return matches
-    for path in MEMORY_DIR.glob(pattern):
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError:
-            continue
-        if not _matches_keywords(text, keywords):
-            continue
-        store_kind = path.stem.split("_")[0]
-        excerpt = _extract_excerpt(text, keywords[0])
-        ts = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    for hit in _memory_index().search(keywords, name_glob=pattern):
+        store_kind = hit.path.stem.split("_")[0]
+        excerpt = _extract_excerpt(hit.text, keywords[0])
+        ts = datetime.fromtimestamp(hit.mtime_ns / 1e9, tz=timezone.utc)
         matches.append(Match(
             store=store_kind,
-            citation=str(path),
+            citation=str(hit.path),
             excerpt=excerpt,
             timestamp=ts,
         ))
@@ -117,59 +180,84 @@ def query_originating_plans(keywords: list[str], days: int | None = None) -> lis
     if not PLANS_DIR.exists():
         return matches
     cutoff = datetime.now(timezone.utc) - timedelta(days=days) if days else None
-    for path in PLANS_DIR.glob("*.md"):
-        try:
-            text = path.read_text(encoding="utf-8")
-        except OSError:
-            continue
-        if not _matches_keywords(text, keywords):
-            continue
-        ts = datetime.fromtimestamp(path.stat().st_mtime, tz=timezone.utc)
+    for hit in _plans_index().search(keywords):
+        ts = datetime.fromtimestamp(hit.mtime_ns / 1e9, tz=timezone.utc)
         if cutoff and ts < cutoff:
             continue
         matches.append(Match(
             store="plan",
-            citation=str(path),
-            excerpt=_extract_excerpt(text, keywords[0]),
+            citation=str(hit.path),
+            excerpt=_extract_excerpt(hit.text, keywords[0]),
             timestamp=ts,
         ))
     return matches
 
 
-def query_git_log(verb: str, target: str, repo_paths: list[Path] | None = None,
-                  days: int | None = 30) -> list[Match]:
-    """Search git commit messages across workspace repos."""
+GIT_LOG_TIMEOUT = 10  # seconds per repo
+GIT_LOG_WORKERS = 8
+
+
+def _git_log_repo(repo: Path, args: list[str], deadline: float | None) -> list[Match]:
+    timeout = float(GIT_LOG_TIMEOUT)
+    if deadline is not None:
+        # Measured when the repo's turn comes, not when the search started
+        timeout = min(timeout, deadline - time.monotonic())
+        if timeout <= 0:
+            return []
+    try:
+        result = subprocess.run(
+            ["git", "-C", str(repo), "log", "--all", "--format=%H|%aI|%s", *args],
+            capture_output=True, text=True, timeout=timeout,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError):
+        return []
+    if result.returncode != 0:
+        return []
     matches: list[Match] = []
+    for line in result.stdout.splitlines():
+        parts = line.split("|", 2)
+        if len(parts) != 3:
+            continue
+        sha, ts_str, subject = parts
+        try:
+            ts = datetime.fromisoformat(ts_str)
+        except ValueError:
+            ts = None
+        matches.append(Match(
+            store="git",
+            citation=f"{repo.name}@{sha[:8]}",
+            excerpt=subject,
+            timestamp=ts,
+            extras={"repo": repo.name, "sha": sha},
+        ))
+    return matches
+
+
+def query_git_log(verb: str, target: str, repo_paths: list[Path] | None = None,
+                  days: int | None = 30, deadline: float | None = None) -> list[Match]:
+    """Search git commit messages across workspace repos, several repos at a time.
+
+    `deadline` (a time.monotonic() value) bounds the whole store: each git
+    subprocess gets at most the time left when it starts, repos still
+    queued at the deadline are skipped, and only repos finished by then
+    contribute matches.
+    """
     if repo_paths is None:
         repo_paths = [p for p in WORKSPACE_DIR.glob("organvm/*") if (p / ".git").is_dir()]
+    if not repo_paths:
+        return []
     since_arg = []
     if days:
         since_arg = [f"--since={days}.days.ago"]
     pattern = f"{verb}.*{target}|{target}.*{verb}" if verb and target else verb or target
-    for repo in repo_paths:
-        try:
-            result = subprocess.run(
-                ["git", "-C", str(repo), "log", "--all", "--format=%H|%aI|%s", *since_arg, f"--grep={pattern}", "-E", "-i"],
-                capture_output=True, text=True, timeout=10,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError):
-            continue
-        if result.returncode != 0:
-            continue
-        for line in result.stdout.splitlines():
-            parts = line.split("|", 2)
-            if len(parts) != 3:
-                continue
-            sha, ts_str, subject = parts
-            try:
-                ts = datetime.fromisoformat(ts_str)
-            except ValueError:
-                ts = None
-            matches.append(Match(
-                store="git",
-                citation=f"{repo.name}@{sha[:8]}",
-                excerpt=subject,
-                timestamp=ts,
-                extras={"repo": repo.name, "sha": sha},
-            ))
-    return matches
+    args = [*since_arg, f"--grep={pattern}", "-E", "-i"]
+
+    workers = min(GIT_LOG_WORKERS, len(repo_paths))
+    pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="git-log")
+    futures = [pool.submit(_git_log_repo, repo, args, deadline) for repo in repo_paths]
+    remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+    done, _ = wait(futures, timeout=remaining)
+    # Repos not started by the deadline are dropped; running git processes
+    # end by it on their own timeout
+    pool.shutdown(wait=False, cancel_futures=True)
+    return [m for future in futures if future in done for m in future.result()]
@@ -20,12 +20,18 @@
 from __future__ import annotations
 
 import argparse
-import json
 import sys
 from pathlib import Path
 
 import yaml
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(1, str(Path(__file__).resolve().parents[1]))
+
+from lib import registry as shared_registry  # noqa: E402
+
+from contrib_engine.seed_index import parse_seed_file  # noqa: E402
+
 # --- Canonical engine imports (isotope dissolution) ---
 try:
     from organvm_engine.organ_config import get_organ_map as _engine_get_organ_map
@@ -87,21 +93,10 @@
 }
 
 
-def load_registry(path: Path) -> dict:
+def load_registry(path: Path) -> dict[str, dict]:
     """Load registry-v2.json and flatten into {org/repo: entry} dict."""
-    with open(path) as f:
-        data = json.load(f)
-
-    flat: dict[str, dict] = {}
-    for organ_id, organ in data.get("organs", {}).items():
-        for repo in organ.get("repositories", []):
-            org = repo.get("org", "")
-            name = repo.get("name", "")
-            if org and name:
-                key = f"{org}/{name}"
-                repo["_organ_id"] = organ_id
-                flat[key] = repo
-    return flat
+    reg = shared_registry.load_registry(path, log=lambda msg: print(msg, file=sys.stderr))
+    return reg.entries
 
 
 def discover_seeds(workspace: Path) -> dict[str, Path]:
@@ -122,12 +117,10 @@ def discover_seeds(workspace: Path) -> dict[str, Path]:
 
 def read_seed(path: Path) -> dict | None:
     """Parse a seed.yaml, returning None on error."""
-    try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return data if isinstance(data, dict) else None
-    except Exception:
-        return None
+    data, error = parse_seed_file(path)
+    if error:
+        print(f"  {path}: {error}", file=sys.stderr)
+    return data
 
 
 def compute_drift(registry: dict, seeds: dict[str, Path]) -> list[dict]:
@@ -36,14 +36,22 @@
 from __future__ import annotations
 
 import datetime
+import hashlib
 import json
+import os
 import subprocess
+import sys
+import threading
 from collections import Counter, defaultdict
-from dataclasses import dataclass, field
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from .registry import load_registry as _load_shared_registry
+
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
@@ -96,6 +104,17 @@
 _IMPL_ORDER = {"ARCHIVED": 0, "DESIGN_ONLY": 1, "SKELETON": 2, "PROTOTYPE": 3, "ACTIVE": 4, "PRODUCTION": 4}
 _PROMO_ORDER = {"ARCHIVED": -1, "LOCAL": 0, "CANDIDATE": 1, "PUBLIC_PROCESS": 2, "GRADUATED": 3}
 
+# Gate bitmasks: bit i = GATE_NAMES[i]
+GATE_BITS: dict[str, int] = {name: 1 << i for i, name in enumerate(GATE_NAMES)}
+
+# Gates that must pass (where applicable) to leave each promotion level
+_PROMO_REQUIRED = {
+    0: GATE_BITS["SEED"] | GATE_BITS["SCAFFOLD"] | GATE_BITS["CI"],  # LOCAL → CANDIDATE
+    1: (GATE_BITS["SEED"] | GATE_BITS["SCAFFOLD"] | GATE_BITS["CI"]  # CANDIDATE → PUBLIC_PROCESS
+        | GATE_BITS["TESTS"] | GATE_BITS["DOCS"] | GATE_BITS["PROTO"]),
+    2: sum(GATE_BITS.values()) & ~GATE_BITS["OMEGA"],  # PUBLIC_PROCESS → GRADUATED
+}
+
 # Tier weights for weighted scoring
 TIER_WEIGHTS: dict[str, float] = {
     "flagship": 2.0,
@@ -114,6 +133,9 @@
     "archive": 0,
 }
 
+# Run-to-run caches (git commit counts, per-repo evaluations)
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "organvm-progress"
+
 # Staleness thresholds (days)
 STALE_WARN_DAYS = 30
 STALE_CRITICAL_DAYS = 90
@@ -139,6 +161,14 @@
     ".r": "R", ".R": "R",
 }
 
+# Directories never descended into when walking a repo
+SKIP_DIRS = {".git", ".venv", "venv", "node_modules", "__pycache__",
+             ".mypy_cache", ".ruff_cache", "dist", "build", ".next",
+             ".tox", ".pytest_cache", "coverage", ".build"}
+
+# Max directory depth counted by language detection (root = 0)
+LANG_MAX_DEPTH = 4
+
 # Security patterns to detect in filenames
 _SECURITY_BAD_FILES = {
     ".env", ".env.local", ".env.production",
@@ -188,6 +218,78 @@ class Severity(str, Enum):
 }
 
 
+# ---------------------------------------------------------------------------
+# Filesystem snapshot
+# ---------------------------------------------------------------------------
+
+def _skipped(name: str) -> bool:
+    return name in SKIP_DIRS or (name.startswith(".") and name != ".github")
+
+
+@dataclass
+class RepoFsSnapshot:
+    """One os.scandir traversal of a repo, shared by every probe and gate.
+
+    Directories are keyed by POSIX path relative to the root ("" = root).
+    Skipped directories (SKIP_DIRS, hidden dirs other than .github) are
+    listed in their parent but not descended into.
+    """
+    root: Path
+    files: dict[str, list[str]] = field(default_factory=dict)
+    dirs: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def scan(cls, root: Path) -> RepoFsSnapshot:
+        snap = cls(root)
+        stack = [("", str(root))]
+        while stack:
+            rel, abspath = stack.pop()
+            files: list[str] = []
+            dirs: list[str] = []
+            try:
+                with os.scandir(abspath) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir():
+                                dirs.append(entry.name)
+                                if not _skipped(entry.name) and not entry.is_symlink():
+                                    child = f"{rel}/{entry.name}" if rel else entry.name
+                                    stack.append((child, entry.path))
+                            elif entry.is_file():
+                                files.append(entry.name)
+                        except OSError:
+                            continue
+            except OSError:
+                pass
+            snap.files[rel] = files
+            snap.dirs[rel] = dirs
+        return snap
+
+    def is_file(self, rel: str) -> bool:
+        parent, _, name = rel.rpartition("/")
+        return name in self.files.get(parent, ())
+
+    def is_dir(self, rel: str) -> bool:
+        parent, _, name = rel.rpartition("/")
+        return name in self.dirs.get(parent, ())
+
+    def walk(self, under: str = "") -> Iterator[tuple[str, str]]:
+        """Yield (dir, filename) for every file at or below `under`."""
+        prefix = f"{under}/"
+        for rel, names in self.files.items():
+            if not under or rel == under or rel.startswith(prefix):
+                for name in names:
+                    yield rel, name
+
+
+def _snapshot(local_path: Path | None, fs: RepoFsSnapshot | None) -> RepoFsSnapshot | None:
+    if fs is not None:
+        return fs
+    if local_path is None or not local_path.is_dir():
+        return None
+    return RepoFsSnapshot.scan(local_path)
+
+
 # ---------------------------------------------------------------------------
 # Profile detection
 # ---------------------------------------------------------------------------
@@ -195,6 +297,7 @@ class Severity(str, Enum):
 def detect_profile(
     entry: dict[str, Any],
     local_path: Path | None = None,
+    fs: RepoFsSnapshot | None = None,
 ) -> Profile:
     """Auto-detect the project profile from registry + filesystem signals."""
     tier = entry.get("tier", "standard")
@@ -222,37 +325,38 @@ def detect_profile(
     # Governance repos — heuristic: name contains governance keywords
     _gov_keywords = {"petasum", "governance", "commandments", "policy", "constitution"}
     if any(kw in name.lower() for kw in _gov_keywords):
-        if local_path and _has_code_files(local_path):
+        if local_path and _has_code_files(local_path, fs):
             return Profile.CODE_FULL
         return Profile.GOVERNANCE
 
     # Documentation-heavy repos detected by local filesystem
-    if local_path and not _has_code_files(local_path):
+    if local_path and not _has_code_files(local_path, fs):
         return Profile.DOCUMENTATION
 
     return Profile.CODE_FULL
 
 
-def _has_code_files(path: Path) -> bool:
+def _has_code_files(path: Path, fs: RepoFsSnapshot | None = None) -> bool:
     """Quick check: does this repo contain substantive code files?"""
     code_extensions = {".py", ".ts", ".js", ".rs", ".go", ".java", ".rb", ".c", ".cpp"}
     code_dirs = {"src", "lib", "titan", "agents", "hive", "adapters", "runtime",
                  "pkg", "cmd", "internal", "app", "core", "server", "client"}
 
-    for d in code_dirs:
-        if (path / d).is_dir():
-            return True
+    fs = _snapshot(path, fs)
+    if fs is None:
+        return False
+
+    top_dirs = fs.dirs.get("", [])
+    if code_dirs.intersection(top_dirs):
+        return True
 
-    for item in path.iterdir():
-        if item.is_file() and item.suffix in code_extensions:
+    if any(os.path.splitext(name)[1] in code_extensions for name in fs.files.get("", [])):
+        return True
+    for d in top_dirs:
+        if d.startswith("."):
+            continue
+        if any(os.path.splitext(name)[1] in code_extensions for name in fs.files.get(d, [])):
             return True
-        if item.is_dir() and not item.name.startswith("."):
-            try:
-                for sub in item.iterdir():
-                    if sub.is_file() and sub.suffix in code_extensions:
-                        return True
-            except PermissionError:
-                continue
     return False
 
 
@@ -260,37 +364,28 @@ def _has_code_files(path: Path) -> bool:
 # Language detection
 # ---------------------------------------------------------------------------
 
-def detect_languages(local_path: Path | None) -> dict[str, int]:
+def detect_languages(
+    local_path: Path | None,
+    fs: RepoFsSnapshot | None = None,
+) -> dict[str, int]:
     """Detect programming languages by counting files per extension.
 
     Returns {language: file_count} sorted by count descending.
     """
-    if not local_path or not local_path.is_dir():
+    fs = _snapshot(local_path, fs)
+    if fs is None:
         return {}
 
     counts: dict[str, int] = defaultdict(int)
-    skip_dirs = {".git", ".venv", "venv", "node_modules", "__pycache__",
-                 ".mypy_cache", ".ruff_cache", "dist", "build", ".next",
-                 ".tox", ".pytest_cache", "coverage", ".build"}
-
-    def _walk(p: Path, depth: int = 0) -> None:
-        if depth > 4:
-            return
-        try:
-            for item in p.iterdir():
-                if item.name in skip_dirs or item.name.startswith("."):
-                    if item.name not in (".github",):
-                        continue
-                if item.is_file():
-                    lang = LANG_EXTENSIONS.get(item.suffix)
-                    if lang:
-                        counts[lang] += 1
-                elif item.is_dir():
-                    _walk(item, depth + 1)
-        except PermissionError:
-            pass
+    for rel, name in fs.walk():
+        if rel and rel.count("/") + 1 > LANG_MAX_DEPTH:
+            continue
+        if _skipped(name):
+            continue
+        lang = LANG_EXTENSIONS.get(os.path.splitext(name)[1])
+        if lang:
+            counts[lang] += 1
 
-    _walk(local_path)
     return dict(sorted(counts.items(), key=lambda x: -x[1]))
 
 
@@ -335,46 +430,149 @@ def to_dict(self) -> dict[str, Any]:
         }
 
 
-def probe_git_health(local_path: Path | None) -> GitHealth:
-    """Probe git repository health (fast, non-blocking)."""
+GIT_TIMEOUT = 5
+COMMIT_COUNTS_NAME = "commit-counts.json"
+
+
+class CommitCountCache:
+    """Per-repo (HEAD sha, commit count) pairs kept across runs.
+
+    Counting a huge history is the one expensive git call in the health
+    probe; with a cached count for an ancestor of HEAD, only the commits
+    since then are counted.
+    """
+
+    def __init__(self, path: Path | None = None) -> None:
+        self.path = path
+        self._entries: dict[str, tuple[str, int]] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path and path.is_file():
+            try:
+                data = json.loads(path.read_text())
+                self._entries = {k: (v[0], int(v[1])) for k, v in data.items()}
+            except (OSError, ValueError, TypeError, IndexError):
+                self._entries = {}
+
+    def get(self, repo: str) -> tuple[str, int] | None:
+        with self._lock:
+            return self._entries.get(repo)
+
+    def put(self, repo: str, head: str, count: int) -> None:
+        with self._lock:
+            if self._entries.get(repo) != (head, count):
+                self._entries[repo] = (head, count)
+                self._dirty = True
+
+    def save(self) -> None:
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(".tmp")
+            tmp.write_text(json.dumps({k: list(v) for k, v in sorted(self._entries.items())}))
+            tmp.replace(self.path)
+            self._dirty = False
+
+
+# Probes must not write .git/index (status refreshes it opportunistically):
+# the write would race the user's git commands and wake --watch
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0"}
+
+
+def _git(local_path: Path, *args: str) -> str | None:
+    """stdout of a git command in `local_path`, or None if it failed."""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=local_path, capture_output=True, text=True, timeout=GIT_TIMEOUT,
+        env=_GIT_ENV,
+    )
+    return result.stdout if result.returncode == 0 else None
+
+
+def _count_commits(local_path: Path, head: str, counts: CommitCountCache | None) -> int:
+    repo = str(local_path)
+    cached = counts.get(repo) if counts else None
+    if cached and cached[0] == head:
+        return cached[1]
+
+    total = -1
+    try:
+        if cached:
+            # "<behind> <ahead>" — behind == 0 means the cached HEAD is an ancestor
+            out = _git(local_path, "rev-list", "--left-right", "--count", f"{cached[0]}...{head}")
+            if out:
+                behind, ahead = (int(n) for n in out.split())
+                if behind == 0:
+                    total = cached[1] + ahead
+        if total < 0:
+            out = _git(local_path, "rev-list", "--count", head)
+            if out and out.strip():
+                total = int(out.strip())
+    except subprocess.TimeoutExpired:
+        # History too large to count in time — a stale count beats none
+        return cached[1] if cached else -1
+
+    if total >= 0 and counts:
+        counts.put(repo, head, total)
+    return total
+
+
+def probe_git_health(
+    local_path: Path | None,
+    counts: CommitCountCache | None = None,
+) -> GitHealth:
+    """Probe git repository health (fast, non-blocking).
+
+    Two git calls cover everything but the commit count: `status
+    --porcelain=v2 --branch` gives the HEAD sha and dirty state, and
+    `for-each-ref refs/heads` gives the branches with their commit dates.
+    The commit count is reused from `counts` while HEAD is unchanged.
+    """
     if not local_path or not (local_path / ".git").exists():
         return GitHealth()
 
     health = GitHealth()
     try:
-        # Last commit age
-        result = subprocess.run(
-            ["git", "log", "-1", "--format=%ct"],
-            cwd=local_path, capture_output=True, text=True, timeout=5,
+        head = ""
+        status = _git(
+            local_path, "status", "--porcelain=v2", "--branch", "--untracked-files=all",
         )
-        if result.returncode == 0 and result.stdout.strip():
-            ts = int(result.stdout.strip())
-            days = (datetime.datetime.now().timestamp() - ts) / 86400
-            health.last_commit_days = int(days)
-
-        # Branch count
-        result = subprocess.run(
-            ["git", "branch", "--list"],
-            cwd=local_path, capture_output=True, text=True, timeout=5,
+        if status is not None:
+            changes = False
+            for line in status.splitlines():
+                if line.startswith("# branch.oid "):
+                    head = line[len("# branch.oid "):]
+                elif line and not line.startswith("#"):
+                    changes = True
+            health.has_uncommitted = changes
+        if head == "(initial)":
+            head = ""  # no commits yet
+
+        head_ts: int | None = None
+        refs = _git(
+            local_path, "for-each-ref",
+            "--format=%(objectname) %(committerdate:unix)", "refs/heads",
         )
-        if result.returncode == 0:
-            health.branch_count = len([l for l in result.stdout.strip().splitlines() if l.strip()])
-
-        # Uncommitted changes
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            cwd=local_path, capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode == 0:
-            health.has_uncommitted = bool(result.stdout.strip())
+        if refs is not None:
+            lines = [ref for ref in refs.splitlines() if ref.strip()]
+            health.branch_count = len(lines)
+            for line in lines:
+                oid, _, ts = line.partition(" ")
+                if head and oid == head and ts:
+                    head_ts = int(ts)
+
+        if head and head_ts is None:
+            # Detached HEAD — not the tip of any local branch
+            out = _git(local_path, "log", "-1", "--format=%ct")
+            if out and out.strip():
+                head_ts = int(out.strip())
+        if head_ts is not None:
+            days = (datetime.datetime.now().timestamp() - head_ts) / 86400
+            health.last_commit_days = int(days)
 
-        # Total commits
-        result = subprocess.run(
-            ["git", "rev-list", "--count", "HEAD"],
-            cwd=local_path, capture_output=True, text=True, timeout=5,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            health.total_commits = int(result.stdout.strip())
+        if head:
+            health.total_commits = _count_commits(local_path, head, counts)
 
     except (subprocess.TimeoutExpired, OSError, ValueError):
         pass
@@ -407,19 +605,23 @@ def to_dict(self) -> dict[str, Any]:
         }
 
 
-def probe_security(local_path: Path | None) -> SecuritySignals:
+def probe_security(
+    local_path: Path | None,
+    fs: RepoFsSnapshot | None = None,
+) -> SecuritySignals:
     """Check for obvious security signals."""
-    if not local_path:
+    fs = _snapshot(local_path, fs)
+    if fs is None:
         return SecuritySignals()
 
     signals = SecuritySignals()
-    signals.has_gitignore = (local_path / ".gitignore").is_file()
-    signals.has_env_example = (local_path / ".env.example").is_file() or (local_path / ".env.sample").is_file()
-    signals.has_security_policy = (local_path / "SECURITY.md").is_file() or (local_path / ".github" / "SECURITY.md").is_file()
+    signals.has_gitignore = fs.is_file(".gitignore")
+    signals.has_env_example = fs.is_file(".env.example") or fs.is_file(".env.sample")
+    signals.has_security_policy = fs.is_file("SECURITY.md") or fs.is_file(".github/SECURITY.md")
 
-    for item in local_path.iterdir():
-        if item.name in _SECURITY_BAD_FILES and item.is_file():
-            signals.exposed_secrets.append(item.name)
+    for name in fs.files.get("", []):
+        if name in _SECURITY_BAD_FILES:
+            signals.exposed_secrets.append(name)
 
     return signals
 
@@ -469,27 +671,30 @@ def to_dict(self) -> dict[str, Any]:
         }
 
 
-def probe_scaffold(local_path: Path | None) -> ScaffoldSignals:
+def probe_scaffold(
+    local_path: Path | None,
+    fs: RepoFsSnapshot | None = None,
+) -> ScaffoldSignals:
     """Probe local filesystem for scaffold files."""
-    if not local_path:
+    fs = _snapshot(local_path, fs)
+    if fs is None:
         return ScaffoldSignals()
 
     s = ScaffoldSignals()
-    readme = local_path / "README.md"
-    s.has_readme = readme.is_file()
+    s.has_readme = fs.is_file("README.md")
     if s.has_readme:
         try:
-            s.readme_words = len(readme.read_text(errors="replace").split())
+            s.readme_words = len((fs.root / "README.md").read_text(errors="replace").split())
         except OSError:
             pass
 
-    s.has_gitignore = (local_path / ".gitignore").is_file()
-    s.has_license = any((local_path / f).is_file() for f in ("LICENSE", "LICENSE.md", "LICENSE.txt", "COPYING"))
-    s.has_changelog = (local_path / "CHANGELOG.md").is_file()
-    s.has_contributing = any((local_path / f).is_file() for f in ("CONTRIBUTING.md", ".github/CONTRIBUTING.md"))
-    s.has_claude_md = (local_path / "CLAUDE.md").is_file()
-    s.has_code_of_conduct = any((local_path / f).is_file() for f in ("CODE_OF_CONDUCT.md", ".github/CODE_OF_CONDUCT.md"))
-    s.has_editorconfig = (local_path / ".editorconfig").is_file()
+    s.has_gitignore = fs.is_file(".gitignore")
+    s.has_license = any(fs.is_file(f) for f in ("LICENSE", "LICENSE.md", "LICENSE.txt", "COPYING"))
+    s.has_changelog = fs.is_file("CHANGELOG.md")
+    s.has_contributing = any(fs.is_file(f) for f in ("CONTRIBUTING.md", ".github/CONTRIBUTING.md"))
+    s.has_claude_md = fs.is_file("CLAUDE.md")
+    s.has_code_of_conduct = any(fs.is_file(f) for f in ("CODE_OF_CONDUCT.md", ".github/CODE_OF_CONDUCT.md"))
+    s.has_editorconfig = fs.is_file(".editorconfig")
 
     pkg_configs = [
         ("pyproject.toml", "pyproject.toml"),
@@ -502,7 +707,7 @@ def probe_scaffold(local_path: Path | None) -> ScaffoldSignals:
         ("pom.xml", "pom.xml"),
     ]
     for filename, label in pkg_configs:
-        if (local_path / filename).is_file():
+        if fs.is_file(filename):
             s.has_pkg_config = True
             s.pkg_config_type = label
             break
@@ -551,6 +756,41 @@ def __post_init__(self) -> None:
         # else: remains FAIL
 
 
+@dataclass
+class GateMasks:
+    """A repo's checkpoints as bitmasks over GATE_BITS."""
+    present: int = 0
+    applicable: int = 0
+    passed: int = 0         # applicable and passed
+    warned: int = 0         # applicable, passed, with a discrepancy
+    discrepancies: int = 0  # checkpoints (any) carrying a discrepancy
+
+
+def _gate_masks(checkpoints: list[Checkpoint]) -> GateMasks:
+    m = GateMasks()
+    for c in checkpoints:
+        bit = GATE_BITS.get(c.name, 0)
+        m.present |= bit
+        if c.discrepancy:
+            m.discrepancies += 1
+        if c.applicable:
+            m.applicable |= bit
+            if c.passed:
+                m.passed |= bit
+                if c.discrepancy:
+                    m.warned |= bit
+    return m
+
+
+def _promotion_ready(promotion_status: str, applicable: int, passed: int) -> bool:
+    current = _PROMO_ORDER.get(promotion_status, 0)
+    required = _PROMO_REQUIRED.get(current)
+    if required is None:
+        return False  # archived or already graduated
+    # Every required gate that applies must pass
+    return not (applicable & required & ~passed)
+
+
 @dataclass
 class ProjectProgress:
     repo: str
@@ -631,23 +871,8 @@ def blockers(self) -> list[str]:
     @property
     def promotion_ready(self) -> bool:
         """Is this repo ready for its next promotion step?"""
-        current = _PROMO_ORDER.get(self.promotion_status, 0)
-        if current < 0:
-            return False  # archived
-        # To promote: all gates up to the next level's requirements must pass
-        if current == 0:  # LOCAL → CANDIDATE: need SEED + SCAFFOLD + CI
-            return all(
-                c.passed for c in self.checkpoints
-                if c.applicable and c.name in ("SEED", "SCAFFOLD", "CI")
-            )
-        if current == 1:  # CANDIDATE → PUBLIC_PROCESS: need TESTS + DOCS + PROTO
-            return all(
-                c.passed for c in self.checkpoints
-                if c.applicable and c.name in ("SEED", "SCAFFOLD", "CI", "TESTS", "DOCS", "PROTO")
-            )
-        if current == 2:  # PUBLIC_PROCESS → GRADUATED: need DEPLOY + all prior
-            return all(c.passed for c in self.checkpoints if c.applicable and c.name != "OMEGA")
-        return False  # Already GRADUATED
+        masks = _gate_masks(self.checkpoints)
+        return _promotion_ready(self.promotion_status, masks.applicable, masks.passed)
 
     @property
     def next_promotion(self) -> str:
@@ -753,16 +978,52 @@ def to_dict(self) -> dict[str, Any]:
             ],
         }
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ProjectProgress:
+        """Rebuild a ProjectProgress from `to_dict` output (derived keys are ignored)."""
+        return cls(
+            repo=data["repo"],
+            organ=data["organ"],
+            tier=data["tier"],
+            profile=Profile(data["profile"]),
+            checkpoints=[
+                Checkpoint(**{k: v for k, v in c.items() if k != "severity"})
+                for c in data.get("checkpoints", [])
+            ],
+            languages=data.get("languages", {}),
+            primary_lang=data.get("primary_language", "unknown"),
+            staleness_days=data.get("staleness_days", -1),
+            git_health=_from_fields(GitHealth, data.get("git_health", {})),
+            security=_from_fields(SecuritySignals, data.get("security", {})),
+            scaffold=_from_fields(ScaffoldSignals, data.get("scaffold", {})),
+            promotion_status=data.get("promotion_status", "LOCAL"),
+            implementation_status=data.get("implementation_status", "SKELETON"),
+            platinum_status=data.get("platinum_status", False),
+            deployment_url=data.get("deployment_url", ""),
+            org=data.get("org", ""),
+            description=data.get("description", ""),
+            revenue_model=data.get("revenue_model", ""),
+            revenue_status=data.get("revenue_status", ""),
+        )
+
+
+def _from_fields(cls: type, data: dict[str, Any]) -> Any:
+    """Instantiate a dataclass from a dict, dropping keys that are not fields."""
+    names = {f.name for f in fields(cls)}
+    return cls(**{k: v for k, v in data.items() if k in names})
+
 
 # ---------------------------------------------------------------------------
 # Gate evaluators
 # ---------------------------------------------------------------------------
 
-def _eval_seed(entry: dict, local_path: Path | None, tier: str) -> Checkpoint:
+def _eval_seed(entry: dict, local_path: Path | None, tier: str,
+               fs: RepoFsSnapshot | None = None) -> Checkpoint:
     """SEED: seed.yaml exists with required fields."""
+    fs = _snapshot(local_path, fs)
     if local_path:
         seed_path = local_path / "seed.yaml"
-        if seed_path.is_file():
+        if fs is not None and fs.is_file("seed.yaml"):
             try:
                 import yaml
                 with open(seed_path) as f:
@@ -836,14 +1097,16 @@ def _eval_scaffold(entry: dict, local_path: Path | None, tier: str, scaffold: Sc
                       detail=f"documentation_status={reg_doc}")
 
 
-def _eval_ci(entry: dict, local_path: Path | None, tier: str) -> Checkpoint:
+def _eval_ci(entry: dict, local_path: Path | None, tier: str,
+             fs: RepoFsSnapshot | None = None) -> Checkpoint:
     """CI: workflow file exists."""
     reg_ci = entry.get("ci_workflow")
     reg_ok = reg_ci is not None and reg_ci != ""
 
+    fs = _snapshot(local_path, fs)
     if local_path:
-        wf_dir = local_path / ".github" / "workflows"
-        local_files = list(wf_dir.glob("*.yml")) if wf_dir.is_dir() else []
+        wf_names = fs.files.get(".github/workflows", []) if fs is not None else []
+        local_files = [n for n in wf_names if n.endswith(".yml")]
         local_ok = len(local_files) > 0
         detail = f"{len(local_files)} workflow(s)" if local_files else "no workflow files"
         if reg_ok:
@@ -871,22 +1134,31 @@ def _eval_ci(entry: dict, local_path: Path | None, tier: str) -> Checkpoint:
                       next_action="" if reg_ok else "Set ci_workflow in registry")
 
 
-def _eval_tests(entry: dict, local_path: Path | None, tier: str) -> Checkpoint:
+_TEST_DIRS = ("tests", "__tests__", "test", "spec")
+_TEST_DIR_EXTS = (".py", ".ts", ".js")
+_INLINE_TEST_SUFFIXES = (".test.ts", ".test.js", ".spec.ts", ".spec.js")
+
+
+def _eval_tests(entry: dict, local_path: Path | None, tier: str,
+                fs: RepoFsSnapshot | None = None) -> Checkpoint:
     """TESTS: tests/ directory with test files. Flagship needs >=10."""
     min_tests = 10 if tier == "flagship" else 1
 
+    fs = _snapshot(local_path, fs)
     if local_path:
-        test_files: list[Path] = []
-        for test_dir_name in ("tests", "__tests__", "test", "spec"):
-            td = local_path / test_dir_name
-            if td.is_dir():
-                for ext in ("*.py", "*.ts", "*.js"):
-                    test_files.extend(td.rglob(ext))
-        # Also find inline test files (*.test.ts, *.spec.js) anywhere
-        for pattern in ("*.test.ts", "*.test.js", "*.spec.ts", "*.spec.js"):
-            test_files.extend(local_path.rglob(pattern))
-        # Deduplicate
-        test_files = list(set(test_files))
+        test_files: set[tuple[str, str]] = set()
+        if fs is not None:
+            for test_dir_name in _TEST_DIRS:
+                if fs.is_dir(test_dir_name):
+                    test_files.update(
+                        (rel, name) for rel, name in fs.walk(test_dir_name)
+                        if name.endswith(_TEST_DIR_EXTS)
+                    )
+            # Also find inline test files (*.test.ts, *.spec.js) anywhere
+            test_files.update(
+                (rel, name) for rel, name in fs.walk()
+                if name.endswith(_INLINE_TEST_SUFFIXES)
+            )
         count = len(test_files)
         ok = count >= min_tests
         detail = f"{count} test file(s)"
@@ -945,13 +1217,14 @@ def _eval_docs(entry: dict, local_path: Path | None, tier: str, scaffold: Scaffo
                       next_action="" if reg_ok else "Deploy documentation and update registry")
 
 
-def _eval_proto(entry: dict, local_path: Path | None, tier: str) -> Checkpoint:
+def _eval_proto(entry: dict, local_path: Path | None, tier: str,
+                fs: RepoFsSnapshot | None = None) -> Checkpoint:
     """PROTO: implementation_status >= PROTOTYPE."""
     impl = entry.get("implementation_status", "SKELETON")
     reg_ok = _IMPL_ORDER.get(impl, 0) >= _IMPL_ORDER["PROTOTYPE"]
 
     if local_path:
-        has_substance = _has_code_files(local_path)
+        has_substance = _has_code_files(local_path, fs)
         detail = f"implementation_status={impl}"
         if has_substance:
             detail += " + code on disk"
@@ -1053,9 +1326,15 @@ def evaluate_project(
     organ_id: str = "",
     local_path: Path | None = None,
     probe_git: bool = False,
+    commit_counts: CommitCountCache | None = None,
 ) -> ProjectProgress:
-    """Evaluate a single project's progress through all applicable gates."""
-    profile = detect_profile(entry, local_path)
+    """Evaluate a single project's progress through all applicable gates.
+
+    The repo is traversed once (RepoFsSnapshot); every probe and gate reads
+    from that snapshot.
+    """
+    fs = _snapshot(local_path, None)
+    profile = detect_profile(entry, local_path, fs)
     skip = _PROFILE_SKIP[profile]
 
     repo = entry.get("name", "?")
@@ -1063,12 +1342,12 @@ def evaluate_project(
     organ = organ_id or ORG_TO_ORGAN.get(entry.get("org", ""), "?")
 
     # Probe extended signals
-    scaffold = probe_scaffold(local_path)
-    languages = detect_languages(local_path)
+    scaffold = probe_scaffold(local_path, fs)
+    languages = detect_languages(local_path, fs)
     plang = primary_language(languages)
     staleness = compute_staleness_days(entry)
-    git_h = probe_git_health(local_path) if probe_git else GitHealth()
-    sec = probe_security(local_path)
+    git_h = probe_git_health(local_path, commit_counts) if probe_git else GitHealth()
+    sec = probe_security(local_path, fs)
 
     # Evaluate gates
     gates: list[Checkpoint] = []
@@ -1078,12 +1357,12 @@ def _add(name: str, cp: Checkpoint) -> None:
             cp = Checkpoint(name, False, False, cp.confidence, detail=f"N/A ({profile.value})")
         gates.append(cp)
 
-    _add("SEED", _eval_seed(entry, local_path, tier))
+    _add("SEED", _eval_seed(entry, local_path, tier, fs))
     _add("SCAFFOLD", _eval_scaffold(entry, local_path, tier, scaffold))
-    _add("CI", _eval_ci(entry, local_path, tier))
-    _add("TESTS", _eval_tests(entry, local_path, tier))
+    _add("CI", _eval_ci(entry, local_path, tier, fs))
+    _add("TESTS", _eval_tests(entry, local_path, tier, fs))
     _add("DOCS", _eval_docs(entry, local_path, tier, scaffold))
-    _add("PROTO", _eval_proto(entry, local_path, tier))
+    _add("PROTO", _eval_proto(entry, local_path, tier, fs))
     _add("CAND", _eval_cand(entry, local_path, tier))
     _add("DEPLOY", _eval_deploy(entry, local_path, tier))
     _add("GRAD", _eval_grad(entry, local_path, tier))
@@ -1117,23 +1396,184 @@ def _add(name: str, cp: Checkpoint) -> None:
     )
 
 
+# ---------------------------------------------------------------------------
+# Evaluation cache
+# ---------------------------------------------------------------------------
+
+EVALUATIONS_NAME = "evaluations"
+# Bump when evaluation logic changes so stale results are not served
+EVALUATION_CACHE_VERSION = 1
+# Keys embed the date, so older entries can never hit again
+EVALUATION_CACHE_MAX_AGE_DAYS = 2
+
+# Directories whose entries probes inspect even when git ignores them
+_STAMP_DIRS = ("", ".github", ".github/workflows", "tests", "test", "docs")
+
+# Space-separated fields before the path in each `status --porcelain=v2` entry type
+_STATUS_V2_FIELDS = {"1": 8, "2": 9, "u": 10, "?": 1, "!": 1}
+
+
+def _repo_stamp(local_path: Path) -> list[Any] | None:
+    """What an evaluation of `local_path` depends on, or None if not stampable.
+
+    `git status --porcelain=v2 --branch --untracked-files=all` gives the
+    HEAD sha and every dirty or untracked file — listed one by one, not
+    collapsed to their untracked directory, so a file added deep inside one
+    changes the listing. Those paths are stat'ed so that further edits to
+    an already-dirty file change the stamp. The top-level directories the
+    probes list are stat'ed too, to catch ignored files like `.env`.
+    Only git repos are stamped.
+    """
+    if not (local_path / ".git").exists():
+        return None
+    try:
+        status = _git(
+            local_path, "status", "--porcelain=v2", "--branch", "--untracked-files=all",
+        )
+    except (subprocess.TimeoutExpired, OSError):
+        return None
+    if status is None:
+        return None
+
+    stamp: list[Any] = [status]
+    for line in status.splitlines():
+        fields_before_path = _STATUS_V2_FIELDS.get(line[:1])
+        if fields_before_path is not None:
+            # Renames carry "path<TAB>orig_path"
+            path = line.split(" ", fields_before_path)[-1].split("\t", 1)[0]
+            stamp.append(_mtime(local_path / path))
+    for rel in _STAMP_DIRS:
+        stamp.append(_mtime(local_path / rel))
+    return stamp
+
+
+def _mtime(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class EvaluationCache:
+    """Content-addressed store of `evaluate_project` results.
+
+    Each result is one JSON file named by the hash of everything the
+    evaluation read: the registry entry, organ, local path, probe flags,
+    today's date (staleness and commit age are day counts) and the repo
+    stamp (see `_repo_stamp`).
+    """
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def key(
+        self,
+        entry: dict[str, Any],
+        organ_id: str,
+        local_path: Path | None,
+        probe_git: bool,
+    ) -> str | None:
+        stamp: list[Any] | None = []
+        if local_path is not None:
+            stamp = _repo_stamp(local_path)
+            if stamp is None:
+                return None
+        material = [
+            EVALUATION_CACHE_VERSION, entry, organ_id, str(local_path), probe_git,
+            datetime.date.today().isoformat(), stamp,
+        ]
+        blob = json.dumps(material, sort_keys=True, default=str)
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> ProjectProgress | None:
+        try:
+            with open(self.directory / f"{key}.json") as f:
+                return ProjectProgress.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, key: str, progress: ProjectProgress) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{key}.json"
+        tmp = path.with_name(f"{key}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(progress.to_dict()))
+        tmp.replace(path)
+
+    def prune(self, max_age_days: int = EVALUATION_CACHE_MAX_AGE_DAYS) -> int:
+        """Delete entries older than `max_age_days`. Returns entries removed."""
+        if not self.directory.is_dir():
+            return 0
+        cutoff = datetime.datetime.now().timestamp() - max_age_days * 86400
+        removed = 0
+        for path in self.directory.glob("*.json"):
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+                    removed += 1
+            except OSError:
+                pass
+        return removed
+
+
 def evaluate_all(
     registry: dict[str, Any],
     workspace: Path | None = None,
     probe_git: bool = False,
+    workers: int = 1,
+    cache_dir: Path | None = None,
 ) -> list[ProjectProgress]:
-    """Evaluate all repos in the registry."""
-    results: list[ProjectProgress] = []
+    """Evaluate all repos in the registry.
 
-    for organ_id, organ_data in registry.get("organs", {}).items():
-        for entry in organ_data.get("repositories", []):
-            local_path = _find_local_path(entry, organ_id, workspace)
-            progress = evaluate_project(entry, organ_id, local_path, probe_git=probe_git)
-            results.append(progress)
+    With workers > 1, repos are evaluated on a bounded thread pool so that
+    git subprocesses and filesystem probes of different repos overlap.
+    Results are always in registry order.
 
+    With cache_dir, git commit counts and per-repo evaluations are persisted
+    there between runs; repos whose stamp is unchanged are served from the
+    evaluation cache without being re-probed.
+    """
+    counts = CommitCountCache(cache_dir / COMMIT_COUNTS_NAME if cache_dir else None)
+    evaluations = EvaluationCache(cache_dir / EVALUATIONS_NAME) if cache_dir else None
+    jobs = registry_repos(registry, workspace)
+
+    def _evaluate(job: tuple[dict[str, Any], str, Path | None]) -> ProjectProgress:
+        entry, organ_id, local_path = job
+        key = evaluations.key(entry, organ_id, local_path, probe_git) if evaluations else None
+        if key:
+            cached = evaluations.get(key)
+            if cached is not None:
+                return cached
+        progress = evaluate_project(
+            entry, organ_id, local_path, probe_git=probe_git, commit_counts=counts,
+        )
+        if key:
+            evaluations.put(key, progress)
+        return progress
+
+    if workers <= 1 or len(jobs) <= 1:
+        results = [_evaluate(job) for job in jobs]
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+            results = list(pool.map(_evaluate, jobs))
+    counts.save()
+    if evaluations:
+        evaluations.prune()
     return results
 
 
+def registry_repos(
+    registry: dict[str, Any],
+    workspace: Path | None = None,
+) -> list[tuple[dict[str, Any], str, Path | None]]:
+    """(entry, organ_id, local_path) for every registry repo, in registry order."""
+    return [
+        (entry, organ_id, _find_local_path(entry, organ_id, workspace))
+        for organ_id, organ_data in registry.get("organs", {}).items()
+        for entry in organ_data.get("repositories", [])
+    ]
+
+
 def _find_local_path(
     entry: dict[str, Any],
     organ_id: str,
@@ -1167,6 +1607,114 @@ def _find_local_path(
 # Analytics
 # ---------------------------------------------------------------------------
 
+class ProgressMatrix:
+    """Columnar view of many ProjectProgress results.
+
+    Built once per report: every per-repo property the aggregates, filters
+    and sorts read (gate bitmasks, score, total, pct, promotion readiness,
+    staleness, organ, ...) is computed a single time into parallel
+    columns, so reports never re-derive them from checkpoints. Row i of
+    every column belongs to `projects[i]`.
+    """
+
+    def __init__(self, projects: list[ProjectProgress]) -> None:
+        self.projects = list(projects)
+        masks = [_gate_masks(p.checkpoints) for p in self.projects]
+        self.present = [m.present for m in masks]
+        self.applicable = [m.applicable for m in masks]
+        self.passed = [m.passed for m in masks]
+        self.warned = [m.warned for m in masks]
+        self.discrepancies = [m.discrepancies for m in masks]
+        self.score = [m.bit_count() for m in self.passed]
+        self.total = [m.bit_count() for m in self.applicable]
+        self.pct = [int(s / t * 100) if t else 0 for s, t in zip(self.score, self.total)]
+        self.repo = [p.repo for p in self.projects]
+        self.organ = [p.organ for p in self.projects]
+        self.tier = [p.tier for p in self.projects]
+        self.profile = [p.profile.value for p in self.projects]
+        self.promotion_status = [p.promotion_status for p in self.projects]
+        self.weighted = [s * TIER_WEIGHTS.get(t, 1.0) for s, t in zip(self.score, self.tier)]
+        self.promotion_ready = [
+            _promotion_ready(st, a, ps)
+            for st, a, ps in zip(self.promotion_status, self.applicable, self.passed)
+        ]
+        self.staleness = [p.staleness_days for p in self.projects]
+        self.stale = [d > STALE_CRITICAL_DAYS for d in self.staleness]
+        self.warn_stale = [STALE_WARN_DAYS < d <= STALE_CRITICAL_DAYS for d in self.staleness]
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def take(self, rows: list[int]) -> ProgressMatrix:
+        """Sub-matrix of the given rows, in the given order."""
+        sub = ProgressMatrix.__new__(ProgressMatrix)
+        for name, column in vars(self).items():
+            setattr(sub, name, [column[i] for i in rows])
+        return sub
+
+    def where(
+        self,
+        *,
+        profile: str | None = None,
+        tier: str | None = None,
+        organ: str | None = None,
+        failing_gate: str | None = None,
+        min_pct: int | None = None,
+        max_pct: int | None = None,
+        failing: bool = False,
+        passing: bool = False,
+        promo_ready: bool = False,
+    ) -> ProgressMatrix:
+        """Rows matching every given condition."""
+        rows = range(len(self))
+        if profile:
+            rows = [i for i in rows if self.profile[i] == profile]
+        if tier:
+            rows = [i for i in rows if self.tier[i] == tier]
+        if organ:
+            rows = [i for i in rows if self.organ[i] == organ]
+        if failing_gate:
+            bit = GATE_BITS.get(failing_gate.upper(), 0)
+            rows = [i for i in rows if self.applicable[i] & ~self.passed[i] & bit]
+        if min_pct is not None:
+            rows = [i for i in rows if self.pct[i] >= min_pct]
+        if max_pct is not None:
+            rows = [i for i in rows if self.pct[i] <= max_pct]
+        if failing:
+            rows = [i for i in rows if self.applicable[i] & ~self.passed[i]]
+        if passing:
+            rows = [i for i in rows if self.pct[i] == 100]
+        if promo_ready:
+            rows = [i for i in rows if self.promotion_ready[i]]
+        return self.take(list(rows))
+
+    def sorted(self, key: str) -> ProgressMatrix:
+        """Rows ordered by a --sort key ("organ" keeps registry order)."""
+        rows = range(len(self))
+        if key == "score":
+            order = sorted(rows, key=lambda i: (-self.pct[i], -self.score[i], self.repo[i]))
+        elif key == "pct":
+            order = sorted(rows, key=lambda i: (-self.pct[i], self.repo[i]))
+        elif key == "name":
+            order = sorted(rows, key=lambda i: self.repo[i])
+        elif key == "stale":
+            order = sorted(rows, key=lambda i: (-self.staleness[i], self.repo[i]))
+        else:
+            return self
+        return self.take(order)
+
+    def by_organ(self) -> dict[str, ProgressMatrix]:
+        """Sub-matrices per organ, in order of first appearance."""
+        groups: dict[str, list[int]] = defaultdict(list)
+        for i, organ in enumerate(self.organ):
+            groups[organ].append(i)
+        return {organ: self.take(rows) for organ, rows in groups.items()}
+
+
+def _matrix(projects: list[ProjectProgress] | ProgressMatrix) -> ProgressMatrix:
+    return projects if isinstance(projects, ProgressMatrix) else ProgressMatrix(projects)
+
+
 @dataclass
 class GateStats:
     """Pass/fail statistics for a single gate across all repos."""
@@ -1195,32 +1743,28 @@ def to_dict(self) -> dict[str, Any]:
         }
 
 
-def compute_gate_stats(projects: list[ProjectProgress]) -> list[GateStats]:
+def compute_gate_stats(projects: list[ProjectProgress] | ProgressMatrix) -> list[GateStats]:
     """Compute pass/fail rates per gate across all projects."""
-    stats_map: dict[str, GateStats] = {}
-    for gate_name in GATE_NAMES:
-        stats_map[gate_name] = GateStats(name=gate_name)
-
-    for p in projects:
-        for cp in p.checkpoints:
-            s = stats_map.get(cp.name)
-            if not s:
+    m = _matrix(projects)
+    stats: list[GateStats] = []
+    for gate_name, bit in GATE_BITS.items():
+        s = GateStats(name=gate_name)
+        for i, present in enumerate(m.present):
+            if not present & bit:
                 continue
-            if not cp.applicable:
+            if not m.applicable[i] & bit:
                 s.total_na += 1
-            elif cp.passed and not cp.discrepancy:
-                s.total_applicable += 1
-                s.total_passed += 1
-            elif cp.passed and cp.discrepancy:
-                s.total_applicable += 1
+                continue
+            s.total_applicable += 1
+            if m.passed[i] & bit:
                 s.total_passed += 1
-                s.total_warn += 1
+                if m.warned[i] & bit:
+                    s.total_warn += 1
             else:
-                s.total_applicable += 1
                 s.total_failed += 1
-                s.failing_repos.append(p.repo)
-
-    return [stats_map[g] for g in GATE_NAMES]
+                s.failing_repos.append(m.repo[i])
+        stats.append(s)
+    return stats
 
 
 @dataclass
@@ -1265,45 +1809,42 @@ def to_dict(self) -> dict[str, Any]:
         }
 
 
-def compute_system_summary(projects: list[ProjectProgress]) -> SystemSummary:
+def compute_system_summary(projects: list[ProjectProgress] | ProgressMatrix) -> SystemSummary:
     """Compute aggregate system analytics."""
+    m = _matrix(projects)
     s = SystemSummary()
-    s.total_repos = len(projects)
-    s.total_score = sum(p.score for p in projects)
-    s.total_possible = sum(p.total for p in projects)
+    s.total_repos = len(m)
+    s.total_score = sum(m.score)
+    s.total_possible = sum(m.total)
     s.avg_pct = (s.total_score / s.total_possible * 100) if s.total_possible else 0.0
-    s.weighted_total = sum(p.weighted_score for p in projects)
-    s.profile_counts = dict(Counter(p.profile.value for p in projects).most_common())
-    s.promo_counts = dict(Counter(p.promotion_status for p in projects).most_common())
-    s.tier_counts = dict(Counter(p.tier for p in projects).most_common())
-    s.stale_count = sum(1 for p in projects if p.is_stale)
-    s.warn_stale_count = sum(1 for p in projects if p.is_warn_stale)
-    s.security_issues_count = sum(1 for p in projects if not p.security.clean)
-    s.promotion_ready_count = sum(1 for p in projects if p.promotion_ready)
-    s.discrepancy_count = sum(len(p.discrepancies) for p in projects)
-    s.gate_stats = compute_gate_stats(projects)
+    s.weighted_total = sum(m.weighted)
+    s.profile_counts = dict(Counter(m.profile).most_common())
+    s.promo_counts = dict(Counter(m.promotion_status).most_common())
+    s.tier_counts = dict(Counter(m.tier).most_common())
+    s.stale_count = sum(m.stale)
+    s.warn_stale_count = sum(m.warn_stale)
+    s.security_issues_count = sum(1 for p in m.projects if not p.security.clean)
+    s.promotion_ready_count = sum(m.promotion_ready)
+    s.discrepancy_count = sum(m.discrepancies)
+    s.gate_stats = compute_gate_stats(m)
 
     # Language counts
     lang_counter: Counter[str] = Counter()
-    for p in projects:
+    for p in m.projects:
         if p.primary_lang != "unknown" and p.primary_lang != "none":
             lang_counter[p.primary_lang] += 1
     s.language_counts = dict(lang_counter.most_common())
 
     # Per-organ summaries
-    organs: dict[str, list[ProjectProgress]] = defaultdict(list)
-    for p in projects:
-        organs[p.organ].append(p)
-
-    for organ_id, projs in organs.items():
-        avg = sum(p.pct for p in projs) / len(projs) if projs else 0
+    for organ_id, om in m.by_organ().items():
+        n = len(om)
         s.organ_summaries[organ_id] = {
-            "count": len(projs),
-            "avg_pct": round(avg, 1),
-            "avg_score": round(sum(p.score for p in projs) / len(projs), 1) if projs else 0,
-            "avg_total": round(sum(p.total for p in projs) / len(projs), 1) if projs else 0,
-            "stale": sum(1 for p in projs if p.is_stale),
-            "promotion_ready": sum(1 for p in projs if p.promotion_ready),
+            "count": n,
+            "avg_pct": round(sum(om.pct) / n, 1),
+            "avg_score": round(sum(om.score) / n, 1),
+            "avg_total": round(sum(om.total) / n, 1),
+            "stale": sum(om.stale),
+            "promotion_ready": sum(om.promotion_ready),
         }
 
     return s
@@ -1573,50 +2114,54 @@ def render_detail(progress: ProjectProgress, color: bool = False) -> str:
 def render_organ_summary(
     organ_id: str,
     organ_name: str,
-    projects: list[ProjectProgress],
+    projects: list[ProjectProgress] | ProgressMatrix,
     color: bool = False,
 ) -> str:
     """Render an organ-level summary table."""
+    m = _matrix(projects)
     lines: list[str] = []
-    lines.append(f"{organ_id}: {organ_name} ({len(projects)} repos)")
+    lines.append(f"{organ_id}: {organ_name} ({len(m)} repos)")
     lines.append("\u2501" * 78)
 
-    for p in sorted(projects, key=lambda x: (-x.pct, -x.score, x.repo)):
+    for i in sorted(range(len(m)), key=lambda i: (-m.pct[i], -m.score[i], m.repo[i])):
+        p = m.projects[i]
         bar = p.bar_colored() if color else p.bar_ascii()
         promo = p.promotion_status
         badge = p.profile.value if p.profile != Profile.CODE_FULL else p.tier
-        ready = "\u2191" if p.promotion_ready else " "
+        ready = "\u2191" if m.promotion_ready[i] else " "
         stale = ""
-        if p.is_stale:
+        if m.stale[i]:
             stale = " !" if not color else " \033[91m!\033[0m"
-        elif p.is_warn_stale:
+        elif m.warn_stale[i]:
             stale = " ~" if not color else " \033[93m~\033[0m"
         lines.append(
-            f"  {p.repo:<35} {bar}  {p.score:>2}/{p.total:<2} {p.pct:>3}%  "
+            f"  {p.repo:<35} {bar}  {m.score[i]:>2}/{m.total[i]:<2} {m.pct[i]:>3}%  "
             f"{badge:<14} {promo:<16} {ready}{stale}"
         )
 
-    if projects:
-        avg_pct = sum(p.pct for p in projects) / len(projects)
-        avg_score = sum(p.score for p in projects) / len(projects)
-        avg_total = sum(p.total for p in projects) / len(projects)
-        ready_count = sum(1 for p in projects if p.promotion_ready)
-        stale_count = sum(1 for p in projects if p.is_stale)
+    if len(m):
+        avg_pct = sum(m.pct) / len(m)
+        avg_score = sum(m.score) / len(m)
+        avg_total = sum(m.total) / len(m)
+        ready_count = sum(m.promotion_ready)
+        stale_count = sum(m.stale)
         lines.append("\u2501" * 78)
         lines.append(
             f"  Avg: {avg_score:.1f}/{avg_total:.1f} ({avg_pct:.0f}%) | "
             f"Promo-ready: {ready_count} | Stale: {stale_count} | "
-            f"Discrepancies: {sum(len(p.discrepancies) for p in projects)}"
+            f"Discrepancies: {sum(m.discrepancies)}"
         )
 
     return "\n".join(lines)
 
 
-def render_heatmap(all_projects: list[ProjectProgress], color: bool = False) -> str:
+def render_heatmap(
+    all_projects: list[ProjectProgress] | ProgressMatrix,
+    color: bool = False,
+) -> str:
     """Render system-wide heatmap grouped by organ."""
-    organs: dict[str, list[ProjectProgress]] = defaultdict(list)
-    for p in all_projects:
-        organs[p.organ].append(p)
+    matrix = _matrix(all_projects)
+    organs = matrix.by_organ()
 
     organ_order = [
         "ORGAN-I", "ORGAN-II", "ORGAN-III", "ORGAN-IV",
@@ -1632,16 +2177,16 @@ def render_heatmap(all_projects: list[ProjectProgress], color: bool = False) ->
     total_possible = 0
 
     for organ in organ_order:
-        projs = organs.get(organ, [])
+        projs = organs.get(organ)
         if not projs:
             continue
-        avg_pct = sum(p.pct for p in projs) / len(projs)
+        avg_pct = sum(projs.pct) / len(projs)
         filled = int(avg_pct / 10)
         bar = "\u2588" * filled + "\u2591" * (10 - filled)
-        avg_score = sum(p.score for p in projs) / len(projs)
-        avg_total = sum(p.total for p in projs) / len(projs)
-        ready = sum(1 for p in projs if p.promotion_ready)
-        stale = sum(1 for p in projs if p.is_stale)
+        avg_score = sum(projs.score) / len(projs)
+        avg_total = sum(projs.total) / len(projs)
+        ready = sum(projs.promotion_ready)
+        stale = sum(projs.stale)
 
         extra = ""
         if ready:
@@ -1662,8 +2207,8 @@ def render_heatmap(all_projects: list[ProjectProgress], color: bool = False) ->
             )
 
         total_repos += len(projs)
-        total_score += sum(p.score for p in projs)
-        total_possible += sum(p.total for p in projs)
+        total_score += sum(projs.score)
+        total_possible += sum(projs.total)
 
     sys_pct = int(total_score / total_possible * 100) if total_possible else 0
     lines.append("")
@@ -1672,7 +2217,7 @@ def render_heatmap(all_projects: list[ProjectProgress], color: bool = False) ->
     lines.append(f"  {'System':<14} {bar}  {sys_pct:>3}%  ({total_repos} repos)")
     lines.append("")
 
-    summary = compute_system_summary(all_projects)
+    summary = compute_system_summary(matrix)
     promo_parts = []
     for status in ("GRADUATED", "PUBLIC_PROCESS", "CANDIDATE", "LOCAL", "ARCHIVED"):
         count = summary.promo_counts.get(status, 0)
@@ -1889,6 +2434,8 @@ def export_markdown(projects: list[ProjectProgress], summary: SystemSummary) ->
 # ---------------------------------------------------------------------------
 
 def load_registry(path: Path) -> dict[str, Any]:
-    """Load registry-v2.json."""
-    with open(path) as f:
-        return json.load(f)
+    """Load registry-v2.json (through the shared, cached registry loader).
+
+    Fallback and redirect notices go to stderr, keeping `--json` output clean.
+    """
+    return _load_shared_registry(path, log=lambda msg: print(msg, file=sys.stderr)).data
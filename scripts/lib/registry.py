@@ -0,0 +1,241 @@
+"""Shared registry-v2.json loading for the validator and progress scripts.
+
+One implementation of what each script used to do for itself:
+
+- resolve a missing registry path to the canonical registry
+- follow `_redirect` stubs (with loop detection)
+- flatten organs into {org/repo: entry}
+- index entries by organ, tier and promotion status
+
+Parsed registries are cached on disk, keyed by each file's path, mtime and
+size, so a suite of validators run back to back reads, parses and flattens
+the registry once; a cache hit costs a stat and an unpickle. Redirect stubs
+are cached the same way, as the decision to follow them. The cache is a
+per-user pickle under REGISTRY_CACHE_DIR and is rebuilt whenever a file
+changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+WORKSPACE = Path.home() / "Workspace"
+_SCRIPT_PARENTS = Path(__file__).resolve().parents
+# None when the checkout sits too close to the filesystem root to have one
+SCRIPT_WORKSPACE = _SCRIPT_PARENTS[4] if len(_SCRIPT_PARENTS) > 4 else None
+DEFAULT_REGISTRY_CANDIDATES = tuple(
+    workspace / "meta-organvm" / "organvm-corpvs-testamentvm" / "registry-v2.json"
+    for workspace in (WORKSPACE, SCRIPT_WORKSPACE) if workspace is not None
+)
+REGISTRY_CACHE_DIR = Path.home() / ".cache" / "organvm-registry"
+
+# Bump when the cached Registry layout changes
+_CACHE_VERSION = 2
+
+
+@dataclass
+class Registry:
+    """A parsed registry with flat and indexed views of its entries.
+
+    `entries` values are copies of the registry entries with `_organ_id`
+    added; `data` is the registry document as loaded.
+    """
+    path: Path
+    sha256: str
+    data: dict[str, Any]
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    by_organ: dict[str, list[str]] = field(default_factory=dict)
+    by_tier: dict[str, list[str]] = field(default_factory=dict)
+    by_status: dict[str, list[str]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, path: Path, sha256: str, data: dict[str, Any]) -> Registry:
+        reg = cls(path=path, sha256=sha256, data=data)
+        by_organ: dict[str, list[str]] = defaultdict(list)
+        by_tier: dict[str, list[str]] = defaultdict(list)
+        by_status: dict[str, list[str]] = defaultdict(list)
+        for organ_id, organ in data.get("organs", {}).items():
+            for repo in organ.get("repositories", []):
+                org = repo.get("org", "")
+                name = repo.get("name", "")
+                if not (org and name):
+                    continue
+                key = f"{org}/{name}"
+                reg.entries[key] = {**repo, "_organ_id": organ_id}
+                by_organ[organ_id].append(key)
+                by_tier[repo.get("tier", "")].append(key)
+                by_status[repo.get("promotion_status", "")].append(key)
+        reg.by_organ, reg.by_tier, reg.by_status = dict(by_organ), dict(by_tier), dict(by_status)
+        return reg
+
+    def select(
+        self,
+        organ: str | None = None,
+        tier: str | None = None,
+        status: str | None = None,
+    ) -> list[str]:
+        """Keys of entries matching every given index value, in registry order."""
+        keys: Iterable[str] = self.entries
+        for index, value in ((self.by_organ, organ), (self.by_tier, tier),
+                             (self.by_status, status)):
+            if value is not None:
+                wanted = set(index.get(value, ()))
+                keys = [k for k in keys if k in wanted]
+        return list(keys)
+
+
+def resolve_default_registry(candidates: Iterable[Path] | None = None) -> Path | None:
+    """Return first existing canonical registry path, if available."""
+    for candidate in DEFAULT_REGISTRY_CANDIDATES if candidates is None else candidates:
+        if candidate.is_file():
+            return candidate.resolve()
+    return None
+
+
+def _is_redirect(data: dict[str, Any]) -> bool:
+    return "_redirect" in data and "organs" not in data
+
+
+def _existing_registry(
+    path: str | Path,
+    candidates: tuple[Path, ...],
+    log: Callable[[str], None] | None,
+) -> Path:
+    resolved = (Path.cwd() / path).resolve()
+    if resolved.is_file():
+        return resolved
+    default = resolve_default_registry(candidates)
+    if default is None:
+        tried = ", ".join(str(p) for p in candidates)
+        raise FileNotFoundError(
+            f"Registry not found at {resolved}; no canonical registry found in [{tried}]"
+        )
+    if log:
+        log(f"Registry {resolved} not found. Falling back to {default}")
+    return default
+
+
+def _redirect_target(
+    resolved: Path,
+    visited: set[Path],
+    candidates: tuple[Path, ...],
+    log: Callable[[str], None] | None,
+) -> Path:
+    default = resolve_default_registry(candidates)
+    if default is None:
+        tried = ", ".join(str(p) for p in candidates)
+        raise FileNotFoundError(
+            f"Registry {resolved} is a redirect but no canonical registry found in [{tried}]"
+        )
+    if default == resolved:
+        raise FileNotFoundError(
+            f"Registry {resolved} is a redirect and no alternate canonical registry "
+            "is available"
+        )
+    if default in visited:
+        raise RuntimeError(f"Redirect loop detected while loading registry: {default}")
+    if log:
+        log(f"Registry {resolved} is a redirect. Following to {default}")
+    return default
+
+
+def resolve_registry(
+    path: str | Path,
+    candidates: Iterable[Path] | None = None,
+    log: Callable[[str], None] | None = print,
+) -> tuple[Path, bytes]:
+    """The registry file `path` leads to and its bytes.
+
+    A missing path falls back to the first existing candidate; a
+    `_redirect` stub (no `organs`) is followed to the canonical registry.
+    """
+    candidates = tuple(DEFAULT_REGISTRY_CANDIDATES if candidates is None else candidates)
+    resolved = _existing_registry(path, candidates, log)
+    visited = {resolved}
+    while True:
+        raw = resolved.read_bytes()
+        if not _is_redirect(json.loads(raw)):
+            return resolved, raw
+        resolved = _redirect_target(resolved, visited, candidates, log)
+        visited.add(resolved)
+
+
+def _cache_path(cache_dir: Path, path: Path) -> Path:
+    st = path.stat()
+    name = hashlib.sha256(str(path).encode()).hexdigest()[:16]
+    return cache_dir / f"{name}-{st.st_mtime_ns}-{st.st_size}.v{_CACHE_VERSION}.pickle"
+
+
+_MISS = object()
+
+
+def _read_cache(cached: Path) -> Any:
+    """The Registry (or None for a redirect stub) stored at `cached`, else _MISS."""
+    try:
+        with open(cached, "rb") as f:
+            entry = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+        return _MISS
+    return entry if entry is None or isinstance(entry, Registry) else _MISS
+
+
+def _write_cache(cached: Path, entry: Registry | None) -> None:
+    try:
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cached.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        tmp.replace(cached)
+        # One entry per file: drop the ones for its earlier versions
+        for stale in cached.parent.glob(f"{cached.name.split('-', 1)[0]}-*.pickle"):
+            if stale != cached:
+                stale.unlink(missing_ok=True)
+    except OSError:
+        pass  # read-only home — the cache is an optimization only
+
+
+def load_registry(
+    path: str | Path,
+    candidates: Iterable[Path] | None = None,
+    *,
+    cache: bool = True,
+    cache_dir: Path | None = None,
+    log: Callable[[str], None] | None = print,
+) -> Registry:
+    """Load the registry at `path` (following fallbacks and redirects).
+
+    With `cache`, a file whose path, mtime and size match an earlier load is
+    served from the on-disk cache in `cache_dir` (default REGISTRY_CACHE_DIR)
+    without being read; otherwise each file is read and parsed once.
+    """
+    candidates = tuple(DEFAULT_REGISTRY_CANDIDATES if candidates is None else candidates)
+    resolved = _existing_registry(path, candidates, log)
+    visited = {resolved}
+    while True:
+        # Stat before reading: a write racing the read leaves a key no later
+        # stat will match, never a stale entry under the new key
+        entry = _MISS
+        if cache:
+            cached = _cache_path(cache_dir or REGISTRY_CACHE_DIR, resolved)
+            entry = _read_cache(cached)
+        if entry is _MISS:
+            raw = resolved.read_bytes()
+            data = json.loads(raw)
+            entry = None if _is_redirect(data) else Registry.build(
+                resolved, hashlib.sha256(raw).hexdigest(), data,
+            )
+            if cache:
+                _write_cache(cached, entry)
+        if entry is not None:
+            entry.path = resolved
+            return entry
+        resolved = _redirect_target(resolved, visited, candidates, log)
+        visited.add(resolved)
@@ -0,0 +1,322 @@
+"""Append-only columnar history of progress snapshots.
+
+A JSON snapshot holds every project's full `to_dict()`, so questions that
+span many snapshots ("score history of repo X", "gates lost over the last
+30 runs") mean parsing every file. The history store keeps only what those
+questions need, one fixed-width column file per field:
+
+    repo.col     uint32  interned repo name
+    organ.col    uint16  interned organ ID
+    profile.col  uint8   interned profile
+    applic.col   uint16  applicable-gate bitmask (progress.GATE_BITS)
+    passed.col   uint16  passed-gate bitmask (applicable gates only)
+    score.col    uint8   gates passed
+    total.col    uint8   gates applicable
+    pct.col      uint8   score / total
+
+Row i of every column belongs to the same (snapshot, repo). Snapshots are
+indexed by `snapshots.idx`: fixed-width records of (epoch timestamp, first
+row, row count, system pct, interned label), in append order. Strings are
+interned in `strings.jsonl`, one `[table, value]` line per new string.
+
+Columns are written first and the index record last, so a crash mid-append
+leaves rows past the last indexed snapshot; the next append truncates them.
+Likewise an unterminated last line of `strings.jsonl` is ignored on load and
+truncated by the next append.
+Single writer per directory.
+"""
+
+from __future__ import annotations
+
+import bisect
+import datetime
+import json
+import struct
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .progress import GATE_BITS, ProjectProgress, SystemSummary
+
+HISTORY_NAME = "history"
+
+# (name, array typecode)
+_COLUMNS = (
+    ("repo", "I"),
+    ("organ", "H"),
+    ("profile", "B"),
+    ("applic", "H"),
+    ("passed", "H"),
+    ("score", "B"),
+    ("total", "B"),
+    ("pct", "B"),
+)
+
+# timestamp, first row, row count, system pct, label
+_INDEX = struct.Struct("<dIIdI")
+
+
+@dataclass
+class SnapshotInfo:
+    position: int
+    timestamp: str
+    label: str
+    sys_pct: float
+    repos: int
+
+
+def _epoch(timestamp: str) -> float:
+    return datetime.datetime.fromisoformat(timestamp).timestamp()
+
+
+def _mask(gates: list[dict[str, Any]], key: str) -> int:
+    mask = 0
+    for c in gates:
+        if c.get("applicable") and (key == "applicable" or c.get("passed")):
+            mask |= GATE_BITS.get(c["name"], 0)
+    return mask
+
+
+def _gates(mask: int) -> list[str]:
+    return [name for name, bit in GATE_BITS.items() if mask & bit]
+
+
+class SnapshotStore:
+    """Columnar snapshot history under `directory`."""
+
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+        self._strings: dict[str, list[str]] = {}
+        # Bytes of strings.jsonl up to its last complete line
+        self._strings_end = 0
+        self._codes: dict[str, dict[str, int]] = {}
+        self._index: list[tuple[float, int, int, float, int]] = []
+        self._columns: dict[str, array] = {}
+        self._load()
+
+    # -- reading ----------------------------------------------------------
+
+    def _load(self) -> None:
+        self._strings = {}
+        strings = self.directory / "strings.jsonl"
+        raw = strings.read_bytes() if strings.is_file() else b""
+        # A line without its newline is a torn write — not part of the store
+        self._strings_end = raw.rfind(b"\n") + 1
+        for line in raw[:self._strings_end].decode("utf-8").splitlines():
+            table, value = json.loads(line)
+            self._strings.setdefault(table, []).append(value)
+        self._codes = {
+            table: {v: i for i, v in enumerate(values)}
+            for table, values in self._strings.items()
+        }
+
+        idx = self.directory / "snapshots.idx"
+        raw = idx.read_bytes() if idx.is_file() else b""
+        usable = len(raw) - len(raw) % _INDEX.size
+        self._index = list(_INDEX.iter_unpack(raw[:usable]))
+
+        rows = self._index[-1][1] + self._index[-1][2] if self._index else 0
+        self._columns = {}
+        for name, code in _COLUMNS:
+            col = array(code)
+            path = self.directory / f"{name}.col"
+            if path.is_file():
+                col.frombytes(path.read_bytes()[: rows * col.itemsize])
+            self._columns[name] = col
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def _string(self, table: str, code: int) -> str:
+        return self._strings[table][code]
+
+    def _info(self, position: int) -> SnapshotInfo:
+        ts, _, count, sys_pct, label = self._index[position]
+        return SnapshotInfo(
+            position=position,
+            timestamp=datetime.datetime.fromtimestamp(ts).isoformat(),
+            label=self._string("label", label),
+            sys_pct=sys_pct,
+            repos=count,
+        )
+
+    def snapshots(self) -> list[SnapshotInfo]:
+        return [self._info(i) for i in range(len(self._index))]
+
+    def resolve(self, ref: str) -> int | None:
+        """Position of a snapshot by index ("-1" = latest) or ISO timestamp.
+
+        A timestamp selects the latest snapshot at or before it, so a date
+        like "2026-03-01" means "as of the start of that day".
+        """
+        try:
+            pos = int(ref)
+        except ValueError:
+            pass
+        else:
+            if -len(self._index) <= pos < len(self._index):
+                return pos % len(self._index)
+            return None
+        try:
+            when = _epoch(ref)
+        except ValueError:
+            return None
+        pos = bisect.bisect_right([entry[0] for entry in self._index], when) - 1
+        return pos if pos >= 0 else None
+
+    def _rows(self, position: int) -> range:
+        _, start, count, _, _ = self._index[position]
+        return range(start, start + count)
+
+    def load(self, position: int) -> dict[str, Any]:
+        """A snapshot in the JSON snapshot shape, as far as compute_delta reads it."""
+        info = self._info(position)
+        cols = self._columns
+        projects = []
+        for row in self._rows(position):
+            applic, passed = cols["applic"][row], cols["passed"][row]
+            projects.append({
+                "repo": self._string("repo", cols["repo"][row]),
+                "organ": self._string("organ", cols["organ"][row]),
+                "profile": self._string("profile", cols["profile"][row]),
+                "score": cols["score"][row],
+                "total": cols["total"][row],
+                "pct": cols["pct"][row],
+                "checkpoints": [
+                    {"name": name, "applicable": bool(applic & bit), "passed": bool(passed & bit)}
+                    for name, bit in GATE_BITS.items()
+                ],
+            })
+        return {
+            "timestamp": info.timestamp,
+            "label": info.label,
+            "summary": {"sys_pct": info.sys_pct},
+            "projects": projects,
+        }
+
+    def score_history(
+        self,
+        repo: str,
+        since: str | None = None,
+        until: str | None = None,
+    ) -> list[tuple[str, int, int, int]]:
+        """(timestamp, score, total, pct) for `repo` in each snapshot it appears in."""
+        code = self._codes.get("repo", {}).get(repo)
+        if code is None:
+            return []
+        stamps = [entry[0] for entry in self._index]
+        lo = bisect.bisect_left(stamps, _epoch(since)) if since else 0
+        hi = bisect.bisect_right(stamps, _epoch(until)) if until else len(stamps)
+        cols = self._columns
+        history = []
+        for position in range(lo, hi):
+            rows = self._rows(position)
+            try:
+                row = cols["repo"].index(code, rows.start, rows.stop)
+            except ValueError:
+                continue
+            history.append((
+                self._info(position).timestamp,
+                cols["score"][row], cols["total"][row], cols["pct"][row],
+            ))
+        return history
+
+    def gates_lost(self, last: int = 30) -> list[tuple[str, str, list[str]]]:
+        """(timestamp, repo, gates) for every gate lost between consecutive
+        snapshots among the last `last`, oldest first."""
+        positions = range(max(0, len(self._index) - last), len(self._index))
+        cols = self._columns
+        lost: list[tuple[str, str, list[str]]] = []
+        previous: dict[int, int] | None = None
+        for position in positions:
+            current = {cols["repo"][row]: cols["passed"][row] for row in self._rows(position)}
+            if previous is not None:
+                timestamp = self._info(position).timestamp
+                for code, passed in current.items():
+                    dropped = previous.get(code, 0) & ~passed
+                    if dropped:
+                        lost.append((timestamp, self._string("repo", code), _gates(dropped)))
+            previous = current
+        return lost
+
+    # -- writing ----------------------------------------------------------
+
+    def _intern(self, table: str, value: str, pending: list[str]) -> int:
+        codes = self._codes.setdefault(table, {})
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(codes)
+            self._strings.setdefault(table, []).append(value)
+            pending.append(json.dumps([table, value]))
+        return code
+
+    def append_snapshot(self, data: dict[str, Any]) -> int:
+        """Append a snapshot in the JSON snapshot shape. Returns its position."""
+        when = _epoch(data["timestamp"])
+        if self._index and when < self._index[-1][0]:
+            raise ValueError(
+                f"snapshot {data['timestamp']} is older than the latest in {self.directory}"
+            )
+        pending: list[str] = []
+        label = self._intern("label", data.get("label", ""), pending)
+        new = {name: array(code) for name, code in _COLUMNS}
+        for p in data.get("projects", []):
+            gates = p.get("checkpoints", [])
+            new["repo"].append(self._intern("repo", p["repo"], pending))
+            new["organ"].append(self._intern("organ", p.get("organ", "?"), pending))
+            new["profile"].append(self._intern("profile", p.get("profile", ""), pending))
+            new["applic"].append(_mask(gates, "applicable"))
+            new["passed"].append(_mask(gates, "passed"))
+            new["score"].append(p.get("score", 0))
+            new["total"].append(p.get("total", 0))
+            new["pct"].append(p.get("pct", 0))
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        if pending:
+            text = "\n".join(pending) + "\n"
+            with open(self.directory / "strings.jsonl", "a", encoding="utf-8") as f:
+                f.truncate(self._strings_end)
+                f.write(text)
+            self._strings_end += len(text.encode("utf-8"))
+        start = self._index[-1][1] + self._index[-1][2] if self._index else 0
+        for name, col in self._columns.items():
+            with open(self.directory / f"{name}.col", "ab") as f:
+                # Drop rows a crashed append left past the last indexed snapshot
+                f.truncate(start * col.itemsize)
+                new[name].tofile(f)
+            col.extend(new[name])
+        record = (when, start, len(new["repo"]),
+                  float(data.get("summary", {}).get("sys_pct", 0)), label)
+        with open(self.directory / "snapshots.idx", "ab") as f:
+            f.truncate(len(self._index) * _INDEX.size)
+            f.write(_INDEX.pack(*record))
+        self._index.append(record)
+        return len(self._index) - 1
+
+    def append(
+        self,
+        projects: list[ProjectProgress],
+        summary: SystemSummary,
+        label: str = "",
+    ) -> int:
+        return self.append_snapshot({
+            "timestamp": datetime.datetime.now().isoformat(),
+            "label": label,
+            "summary": {"sys_pct": summary.to_dict()["sys_pct"]},
+            "projects": [p.to_dict() for p in projects],
+        })
+
+    def backfill(self, paths: list[Path]) -> int:
+        """Import JSON snapshots newer than the latest stored one. Returns count imported."""
+        latest = self._index[-1][0] if self._index else float("-inf")
+        snaps = []
+        for path in paths:
+            with open(path) as f:
+                data = json.load(f)
+            if _epoch(data["timestamp"]) > latest:
+                snaps.append(data)
+        snaps.sort(key=lambda d: d["timestamp"])
+        for data in snaps:
+            self.append_snapshot(data)
+        return len(snaps)
@@ -0,0 +1,290 @@
+"""Watch mode for project-progress — re-evaluate only repos whose files change.
+
+Two watchers report which repo roots changed:
+
+- InotifyWatcher — Linux inotify through libc (no third-party dependency).
+  One watch per non-skipped directory of each repo, plus `.git` and
+  `.git/refs/heads` so commits, checkouts and staging are seen. Blocks in
+  select(), so an idle dashboard costs no CPU.
+- PollingWatcher — fallback elsewhere (or when the inotify watch limit is
+  hit). Stats the same directories every POLL_INTERVAL seconds; it sees
+  files being added, removed or renamed and git operations, but not
+  in-place edits of existing working-tree files.
+
+ProgressWatch keeps the registry and per-repo results in memory and swaps
+in fresh `evaluate_project` results for the repos a watcher reports.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Protocol
+
+from .progress import (
+    COMMIT_COUNTS_NAME,
+    CommitCountCache,
+    ProjectProgress,
+    RepoFsSnapshot,
+    _skipped,
+    evaluate_all,
+    evaluate_project,
+    registry_repos,
+)
+
+# Quiet period that ends a burst of events (a commit touches many files)
+DEBOUNCE = 0.15
+POLL_INTERVAL = 1.0
+
+_GIT_DIRS = (".git", ".git/refs/heads")
+
+
+def _tree_dirs(top: Path) -> list[Path]:
+    """`top` and every directory below it that the probes descend into."""
+    return [top / rel if rel else top for rel in RepoFsSnapshot.scan(top).files]
+
+
+def _watched_dirs(root: Path) -> list[Path]:
+    """Directories whose changes can alter an evaluation of `root`."""
+    return _tree_dirs(root) + [root / rel for rel in _GIT_DIRS if (root / rel).is_dir()]
+
+
+class Watcher(Protocol):
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        """Block until some repos change (or timeout); return their roots."""
+        ...
+
+    def close(self) -> None: ...
+
+
+# ---------------------------------------------------------------------------
+# inotify
+# ---------------------------------------------------------------------------
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_EVENT = struct.Struct("iIII")  # wd, mask, cookie, name length
+
+
+class InotifyWatcher:
+    """Recursive watch of repo roots via inotify."""
+
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+            | IN_CREATE | IN_DELETE | IN_DELETE_SELF)
+
+    def __init__(self, roots: list[Path]) -> None:
+        self._libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self._fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.roots = list(roots)
+        # wd -> (repo root, watched directory)
+        self._watches: dict[int, tuple[Path, Path]] = {}
+        try:
+            for root in self.roots:
+                for path in _watched_dirs(root):
+                    self._add(root, path)
+        except OSError:
+            self.close()
+            raise
+
+    def _add(self, root: Path, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), self.MASK)
+        if wd < 0:
+            err = ctypes.get_errno()
+            if err == 28:  # ENOSPC — out of watches; let the caller fall back
+                raise OSError(err, f"inotify watch limit reached at {path}")
+            return  # directory vanished meanwhile
+        self._watches[wd] = (root, path)
+
+    def _drain(self, changed: set[Path]) -> None:
+        try:
+            buf = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + _EVENT.size <= len(buf):
+            wd, mask, _, length = _EVENT.unpack_from(buf, offset)
+            name = buf[offset + _EVENT.size:offset + _EVENT.size + length].rstrip(b"\0")
+            offset += _EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                changed.update(self.roots)
+                continue
+            watch = self._watches.get(wd)
+            if watch is None:
+                continue
+            if mask & IN_IGNORED:
+                del self._watches[wd]
+                continue
+            root, path = watch
+            changed.add(root)
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO):
+                child = path / os.fsdecode(name)
+                if not _skipped(child.name) and ".git" not in path.relative_to(root).parts:
+                    for sub in _tree_dirs(child):
+                        self._add(root, sub)
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        changed: set[Path] = set()
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return changed
+        self._drain(changed)
+        while select.select([self._fd], [], [], DEBOUNCE)[0]:
+            self._drain(changed)
+        return changed
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+# ---------------------------------------------------------------------------
+# Polling fallback
+# ---------------------------------------------------------------------------
+
+class PollingWatcher:
+    """Stat-based fallback: compares directory mtimes every `interval` seconds."""
+
+    def __init__(self, roots: list[Path], interval: float = POLL_INTERVAL) -> None:
+        self.roots = list(roots)
+        self.interval = interval
+        self._dirs = {root: _watched_dirs(root) for root in self.roots}
+        self._stamps = {root: self._stamp(root) for root in self.roots}
+
+    def _stamp(self, root: Path) -> list[int]:
+        stamp = []
+        for path in self._dirs[root]:
+            try:
+                stamp.append(path.stat().st_mtime_ns)
+            except OSError:
+                stamp.append(-1)
+        for rel in (".git/HEAD", ".git/index"):
+            try:
+                stamp.append((root / rel).stat().st_mtime_ns)
+            except OSError:
+                stamp.append(-1)
+        return stamp
+
+    def wait(self, timeout: float | None = None) -> set[Path]:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            changed = set()
+            for root in self.roots:
+                stamp = self._stamp(root)
+                if stamp != self._stamps[root]:
+                    changed.add(root)
+                    # Pick up directories created since the last scan
+                    self._dirs[root] = _watched_dirs(root)
+                    self._stamps[root] = self._stamp(root)
+            if changed:
+                return changed
+            if deadline is not None and time.monotonic() >= deadline:
+                return changed
+            pause = self.interval
+            if deadline is not None:
+                pause = min(pause, max(0.0, deadline - time.monotonic()))
+            time.sleep(pause)
+
+    def close(self) -> None:
+        pass
+
+
+def open_watcher(roots: list[Path], poll: bool = False) -> Watcher:
+    """An inotify watcher where available, else a polling one."""
+    if not poll:
+        try:
+            return InotifyWatcher(roots)
+        except (OSError, AttributeError, TypeError):
+            pass  # not Linux, no libc, or out of watches
+    return PollingWatcher(roots)
+
+
+# ---------------------------------------------------------------------------
+# In-memory evaluation state
+# ---------------------------------------------------------------------------
+
+class ProgressWatch:
+    """Registry results kept in memory and refreshed per changed repo."""
+
+    def __init__(
+        self,
+        registry: dict[str, Any],
+        workspace: Path | None = None,
+        probe_git: bool = False,
+        workers: int = 1,
+        cache_dir: Path | None = None,
+    ) -> None:
+        self.probe_git = probe_git
+        self.workers = workers
+        self.jobs = registry_repos(registry, workspace)
+        self.results: list[ProjectProgress] = evaluate_all(
+            registry, workspace, probe_git=probe_git, workers=workers, cache_dir=cache_dir,
+        )
+        self._counts = CommitCountCache(cache_dir / COMMIT_COUNTS_NAME if cache_dir else None)
+        self._positions: dict[Path, list[int]] = {}
+        for i, (_, _, local_path) in enumerate(self.jobs):
+            if local_path is not None:
+                self._positions.setdefault(local_path, []).append(i)
+
+    @property
+    def roots(self) -> list[Path]:
+        return list(self._positions)
+
+    def refresh(self, changed: set[Path]) -> list[ProjectProgress]:
+        """Re-evaluate the repos under `changed`. Returns the new results."""
+        positions = [i for root in changed for i in self._positions.get(root, [])]
+
+        def _evaluate(i: int) -> ProjectProgress:
+            entry, organ_id, local_path = self.jobs[i]
+            return evaluate_project(
+                entry, organ_id, local_path,
+                probe_git=self.probe_git, commit_counts=self._counts,
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(self.workers, len(positions)))) as pool:
+            fresh = list(pool.map(_evaluate, positions))
+        for i, progress in zip(positions, fresh, strict=True):
+            self.results[i] = progress
+        self._counts.save()
+        return fresh
+
+    def run(
+        self,
+        on_update: Callable[[list[ProjectProgress], list[ProjectProgress]], None],
+        watcher: Watcher | None = None,
+        max_updates: int | None = None,
+    ) -> None:
+        """Call `on_update(results, updated)` after every batch of changes.
+
+        Runs until interrupted, or for `max_updates` batches.
+        """
+        watcher = watcher or open_watcher(self.roots)
+        updates = 0
+        try:
+            while max_updates is None or updates < max_updates:
+                changed = watcher.wait()
+                if not changed:
+                    continue
+                on_update(self.results, self.refresh(changed))
+                updates += 1
+        finally:
+            watcher.close()
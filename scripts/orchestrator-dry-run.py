@@ -18,7 +18,12 @@
 from collections import defaultdict
 from pathlib import Path
 
-import yaml
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(1, str(Path(__file__).resolve().parents[1]))
+
+from lib import registry as shared_registry  # noqa: E402
+
+from contrib_engine.seed_index import SeedEntry, SeedIndex  # noqa: E402
 
 WORKSPACE = Path.home() / "Workspace"
 REGISTRY_PATH = WORKSPACE / "meta-organvm" / "organvm-corpvs-testamentvm" / "registry-v2.json"
@@ -46,48 +51,18 @@
 }
 
 
-def discover_seeds(workspace: Path) -> dict[str, Path]:
-    """Find all seed.yaml, keyed by org/repo."""
-    found: dict[str, Path] = {}
-    for org_name in ORGAN_ORGS:
-        org_dir = workspace / org_name
-        if not org_dir.is_dir():
-            continue
-        for repo_dir in sorted(org_dir.iterdir()):
-            if not repo_dir.is_dir():
-                continue
-            seed_path = repo_dir / "seed.yaml"
-            if seed_path.is_file():
-                found[f"{org_name}/{repo_dir.name}"] = seed_path
-    return found
+def discover_seeds(workspace: Path) -> dict[str, SeedEntry]:
+    """Find all seed.yaml (from the workspace seed index), keyed by org/repo."""
+    return {seed.key: seed for seed in SeedIndex(workspace).seeds(ORGAN_ORGS, depth=1)}
 
 
 def load_registry(path: Path) -> dict[str, dict]:
     """Load registry into {org/repo: entry} dict."""
-    with open(path) as f:
-        data = json.load(f)
-    flat: dict[str, dict] = {}
-    for organ_id, organ in data.get("organs", {}).items():
-        for repo in organ.get("repositories", []):
-            org = repo.get("org", "")
-            name = repo.get("name", "")
-            if org and name:
-                repo["_organ_id"] = organ_id
-                flat[f"{org}/{name}"] = repo
-    return flat
-
-
-def parse_seed(path: Path) -> dict | None:
-    """Parse a seed.yaml, return None on error."""
-    try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
-        return data if isinstance(data, dict) else None
-    except Exception:
-        return None
-
-
-def build_graph(seeds: dict[str, Path]) -> dict:
+    reg = shared_registry.load_registry(path, log=lambda msg: print(msg, file=sys.stderr))
+    return reg.entries
+
+
+def build_graph(seeds: dict[str, SeedEntry]) -> dict:
     """Build the produces/consumes directed graph.
 
     Returns dict with nodes, edges, orphans, broken_refs, errors.
@@ -98,10 +73,10 @@ def build_graph(seeds: dict[str, Path]) -> dict:
     all_keys = set(seeds.keys())
 
     # Parse all seeds
-    for key, path in sorted(seeds.items()):
-        data = parse_seed(path)
+    for key, seed in sorted(seeds.items()):
+        data = seed.data
         if data is None:
-            errors.append(f"Parse error: {key}")
+            errors.append(f"Parse error: {key}: {seed.error}")
             continue
         org_name = key.split("/")[0]
         nodes[key] = {
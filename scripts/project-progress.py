@@ -16,8 +16,10 @@
     --blockers          Promotion blockers report
     --discrepancies     Registry/local mismatches
     --stale             Staleness report
-    --snapshot          Save evaluation to timestamped JSON
-    --compare A B       Delta between two snapshots
+    --snapshot          Save evaluation to timestamped JSON + snapshot history
+    --compare A B       Delta between two snapshots (files, history indexes, or timestamps)
+    --history REPO      Score trajectory of one repo across the snapshot history
+    --gates-lost N      Gates lost between consecutive snapshots among the last N
 
 Filters
 -------
@@ -37,20 +39,30 @@
     --color / --no-color  ANSI color (auto-detect by default)
     --sort score|organ|name|pct|stale  Sort order
     --verbose           More detail in summaries
+
+Advanced
+--------
+    --no-probe-git      Skip git health probing (on by default)
+    --workers N         Repos evaluated in parallel
+    --cache-dir DIR     Run-to-run caches (default ~/.cache/organvm-progress)
+    --no-cache          Re-evaluate every repo, ignoring caches
+    --watch             Live heatmap (or --organ view); re-evaluates only changed repos
 """
 
 import argparse
+import datetime
 import json
 import os
 import sys
-from collections import defaultdict
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).resolve().parent))
 
 from lib.progress import (
+    DEFAULT_CACHE_DIR,
     GATE_NAMES,
     Profile,
+    ProgressMatrix,
     compute_delta,
     compute_gate_stats,
     compute_system_summary,
@@ -71,6 +83,8 @@
     render_stale,
     save_snapshot,
 )
+from lib.snapshot_store import HISTORY_NAME, SnapshotStore
+from lib.watch import ProgressWatch
 
 _ORGAN_ALIASES: dict[str, str] = {
     "I": "ORGAN-I", "1": "ORGAN-I",
@@ -105,6 +119,22 @@ def detect_color(args: argparse.Namespace) -> bool:
     return sys.stdout.isatty() and os.environ.get("NO_COLOR") is None
 
 
+def _select(all_projects: list | ProgressMatrix, args: argparse.Namespace) -> ProgressMatrix:
+    """Apply the filter flags and --sort order."""
+    if not isinstance(all_projects, ProgressMatrix):
+        all_projects = ProgressMatrix(all_projects)
+    return all_projects.where(
+        profile=args.profile,
+        tier=args.tier,
+        failing_gate=args.gate,
+        min_pct=args.min_score,
+        max_pct=args.max_score,
+        failing=args.failing,
+        passing=args.passing,
+        promo_ready=args.promo_ready,
+    ).sorted(args.sort)
+
+
 def main() -> None:
     parser = argparse.ArgumentParser(
         description="Per-project alpha-to-omega progress bar with contextual gate awareness",
@@ -125,7 +155,13 @@ def main() -> None:
     modes.add_argument("--discrepancies", action="store_true", help="Registry/local mismatches")
     modes.add_argument("--stale", action="store_true", help="Staleness report")
     modes.add_argument("--snapshot", action="store_true", help="Save evaluation snapshot")
-    modes.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two snapshots")
+    modes.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"),
+                       help="Compare two snapshots: JSON files, history indexes (-1 = latest), "
+                            "or ISO timestamps")
+    modes.add_argument("--history", type=str, metavar="REPO",
+                       help="Score history of a repo from the snapshot history")
+    modes.add_argument("--gates-lost", type=int, metavar="N",
+                       help="Gates lost across the last N snapshots")
 
     # --- Filters ---
     parser.add_argument("--profile", type=str, choices=[p.value for p in Profile], help="Filter by profile")
@@ -146,9 +182,18 @@ def main() -> None:
     parser.add_argument("--verbose", action="store_true", help="More detail in summaries")
 
     # --- Advanced ---
-    parser.add_argument("--probe-git", action="store_true", help="Probe git health (slower)")
+    parser.add_argument("--probe-git", action=argparse.BooleanOptionalAction, default=True,
+                        help="Probe git health (default: on)")
+    parser.add_argument("--workers", type=int, default=min(8, os.cpu_count() or 1),
+                        help="Repos evaluated in parallel (default: %(default)s)")
     parser.add_argument("--snapshot-dir", type=Path, default=None, help="Directory for snapshot files")
+    parser.add_argument("--cache-dir", type=Path, default=DEFAULT_CACHE_DIR,
+                        help="Directory for run-to-run caches (default: %(default)s)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-evaluate every repo, ignoring caches")
     parser.add_argument("--limit", type=int, default=20, help="Limit for list outputs")
+    parser.add_argument("--watch", action="store_true",
+                        help="Stay running; re-evaluate repos as their files change")
 
     args = parser.parse_args()
     use_color = detect_color(args)
@@ -157,81 +202,100 @@ def main() -> None:
         print(f"Error: registry not found at {args.registry}", file=sys.stderr)
         sys.exit(1)
 
-    # --- Snapshot compare mode (no registry eval needed) ---
+    snap_dir = args.snapshot_dir or (args.registry.parent / "snapshots")
+
+    # --- Snapshot history modes (no registry eval needed) ---
     if args.compare:
-        old_path, new_path = Path(args.compare[0]), Path(args.compare[1])
-        if not old_path.is_file() or not new_path.is_file():
-            print("Error: both snapshot files must exist", file=sys.stderr)
-            sys.exit(1)
-        old_snap = load_snapshot(old_path)
-        new_snap = load_snapshot(new_path)
-        delta = compute_delta(old_snap, new_snap)
+        history = SnapshotStore(snap_dir / HISTORY_NAME)
+        snaps = []
+        for ref in args.compare:
+            if Path(ref).is_file():
+                snaps.append(load_snapshot(Path(ref)))
+                continue
+            pos = history.resolve(ref)
+            if pos is None:
+                print(f"Error: no snapshot file or history entry matches {ref!r}", file=sys.stderr)
+                sys.exit(1)
+            snaps.append(history.load(pos))
+        delta = compute_delta(snaps[0], snaps[1])
         if args.json_output:
             print(json.dumps(delta.to_dict(), indent=2))
         else:
             print(render_delta(delta, color=use_color))
         return
 
+    if args.history:
+        trail = SnapshotStore(snap_dir / HISTORY_NAME).score_history(args.history)
+        if args.json_output:
+            print(json.dumps([
+                {"timestamp": ts, "score": score, "total": total, "pct": pct}
+                for ts, score, total, pct in trail
+            ], indent=2))
+        elif not trail:
+            print(f"No snapshot history for {args.history!r}", file=sys.stderr)
+        else:
+            print(f"\n  Score history: {args.history}\n")
+            for ts, score, total, pct in trail:
+                print(f"  {ts[:19]}  {score:2d}/{total:<2d}  {pct:3d}%")
+            print()
+        return
+
+    if args.gates_lost:
+        lost = SnapshotStore(snap_dir / HISTORY_NAME).gates_lost(args.gates_lost)
+        if args.json_output:
+            print(json.dumps([
+                {"timestamp": ts, "repo": repo, "gates": gates} for ts, repo, gates in lost
+            ], indent=2))
+        elif not lost:
+            print(f"  No gates lost across the last {args.gates_lost} snapshots")
+        else:
+            print(f"\n  Gates lost across the last {args.gates_lost} snapshots\n")
+            for ts, repo, gates in lost:
+                print(f"  {ts[:19]}  {repo:40s} {', '.join(gates)}")
+            print()
+        return
+
     # --- Load and evaluate ---
     registry = load_registry(args.registry)
     workspace = args.workspace.expanduser() if args.workspace else None
-    all_projects = evaluate_all(registry, workspace, probe_git=args.probe_git)
-
-    # --- Apply filters ---
-    if args.profile:
-        all_projects = [p for p in all_projects if p.profile.value == args.profile]
-    if args.tier:
-        all_projects = [p for p in all_projects if p.tier == args.tier]
-    if args.gate:
-        gate_upper = args.gate.upper()
-        all_projects = [
-            p for p in all_projects
-            if any(c.name == gate_upper and c.applicable and not c.passed for c in p.checkpoints)
-        ]
-    if args.min_score is not None:
-        all_projects = [p for p in all_projects if p.pct >= args.min_score]
-    if args.max_score is not None:
-        all_projects = [p for p in all_projects if p.pct <= args.max_score]
-    if args.failing:
-        all_projects = [p for p in all_projects if p.failures]
-    if args.passing:
-        all_projects = [p for p in all_projects if p.pct == 100]
-    if args.promo_ready:
-        all_projects = [p for p in all_projects if p.promotion_ready]
+    if args.watch:
+        _watch(registry, workspace, args, use_color)
+        return
+    all_projects = evaluate_all(
+        registry, workspace, probe_git=args.probe_git, workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    )
+
+    # --- Apply filters and sort ---
+    matrix = _select(all_projects, args)
+    all_projects = matrix.projects
 
     if not all_projects:
         print("No repos match the given filters.", file=sys.stderr)
         sys.exit(0)
 
-    # --- Apply sort ---
-    if args.sort == "score":
-        all_projects.sort(key=lambda p: (-p.pct, -p.score, p.repo))
-    elif args.sort == "pct":
-        all_projects.sort(key=lambda p: (-p.pct, p.repo))
-    elif args.sort == "name":
-        all_projects.sort(key=lambda p: p.repo)
-    elif args.sort == "stale":
-        all_projects.sort(key=lambda p: (-p.staleness_days, p.repo))
-
     # --- Export modes ---
     if args.export == "csv":
         print(export_csv(all_projects))
         return
     if args.export == "md":
-        summary = compute_system_summary(all_projects)
+        summary = compute_system_summary(matrix)
         print(export_markdown(all_projects, summary))
         return
 
     # --- Snapshot mode ---
     if args.snapshot:
-        summary = compute_system_summary(all_projects)
-        snap_dir = args.snapshot_dir or (args.registry.parent / "snapshots")
+        summary = compute_system_summary(matrix)
+        history = SnapshotStore(snap_dir / HISTORY_NAME)
+        if not len(history):
+            # First run with the history store: import existing JSON snapshots
+            history.backfill(list_snapshots(snap_dir))
         path = save_snapshot(all_projects, summary, snap_dir)
+        history.append(all_projects, summary)
         print(f"Snapshot saved: {path}")
-        snaps = list_snapshots(snap_dir)
-        if len(snaps) > 1:
-            print(f"  {len(snaps)} snapshots in {snap_dir}")
-            print(f"  Compare: --compare {snaps[1]} {snaps[0]}")
+        if len(history) > 1:
+            print(f"  {len(history)} snapshots in {snap_dir / HISTORY_NAME}")
+            print("  Compare: --compare -2 -1")
         return
 
     # --- Single repo detail ---
@@ -252,7 +316,7 @@ def main() -> None:
 
     # --- Gate stats mode ---
     if args.gate_stats:
-        stats = compute_gate_stats(all_projects)
+        stats = compute_gate_stats(matrix)
         if args.json_output:
             print(json.dumps([s.to_dict() for s in stats], indent=2))
         else:
@@ -314,14 +378,15 @@ def main() -> None:
     # --- Organ filter ---
     if args.organ:
         target = resolve_organ(args.organ)
-        all_projects = [p for p in all_projects if p.organ == target]
+        matrix = matrix.where(organ=target)
+        all_projects = matrix.projects
         if not all_projects:
             print(f"Error: no repos found for organ '{args.organ}'", file=sys.stderr)
             sys.exit(1)
 
     # --- JSON output ---
     if args.json_output:
-        summary = compute_system_summary(all_projects)
+        summary = compute_system_summary(matrix)
         output = {
             "summary": summary.to_dict(),
             "projects": [p.to_dict() for p in all_projects],
@@ -329,41 +394,72 @@ def main() -> None:
         print(json.dumps(output, indent=2))
         return
 
-    # --- Single organ summary ---
+    # --- Single organ summary / default system heatmap ---
+    print(_render_dashboard(matrix, registry, args, use_color))
+
+
+def _render_dashboard(
+    matrix: ProgressMatrix, registry: dict, args: argparse.Namespace, use_color: bool,
+) -> str:
+    """The organ summary (--organ) or the system heatmap with per-organ breakdowns."""
     if args.organ:
-        organ_id = all_projects[0].organ
+        organ_id = matrix.organ[0]
         organ_name = _organ_display_name(organ_id, registry)
-        print(render_organ_summary(organ_id, organ_name, all_projects, color=use_color))
+        parts = [render_organ_summary(organ_id, organ_name, matrix, color=use_color)]
         if args.verbose:
-            print()
-            stats = compute_gate_stats(all_projects)
-            print(render_gate_stats(stats, color=use_color))
-        return
+            stats = compute_gate_stats(matrix)
+            parts += ["", render_gate_stats(stats, color=use_color)]
+        return "\n".join(parts)
 
-    # --- Default: system heatmap ---
-    print(render_heatmap(all_projects, color=use_color))
-    print()
+    parts = [render_heatmap(matrix, color=use_color), ""]
 
     # Per-organ breakdowns
-    organs: dict[str, list] = defaultdict(list)
-    for p in all_projects:
-        organs[p.organ].append(p)
-
+    organs = matrix.by_organ()
     for organ_id in sorted(organs.keys()):
-        projs = organs[organ_id]
         organ_name = _organ_display_name(organ_id, registry)
-        print()
-        print(render_organ_summary(organ_id, organ_name, projs, color=use_color))
+        summary = render_organ_summary(organ_id, organ_name, organs[organ_id], color=use_color)
+        parts += ["", summary]
 
     # Verbose: append gate stats and blockers
     if args.verbose:
+        stats = compute_gate_stats(matrix)
+        parts += [
+            "", render_gate_stats(stats, color=use_color),
+            "", render_blockers(matrix.projects, color=use_color),
+            "", render_stale(matrix.projects),
+        ]
+    return "\n".join(parts)
+
+
+def _watch(registry: dict, workspace: Path | None, args: argparse.Namespace,
+           use_color: bool) -> None:
+    """Keep results in memory and re-render whenever a watched repo changes."""
+    state = ProgressWatch(
+        registry, workspace, probe_git=args.probe_git, workers=args.workers,
+        cache_dir=None if args.no_cache else args.cache_dir,
+    )
+    target = resolve_organ(args.organ) if args.organ else None
+
+    def _show(results: list, updated: list) -> None:
+        matrix = _select(results, args)
+        if target:
+            matrix = matrix.where(organ=target)
+        sys.stdout.write("\033[2J\033[H")  # clear screen, cursor home
+        if len(matrix):
+            print(_render_dashboard(matrix, registry, args, use_color))
+        else:
+            print("No repos match the given filters.")
+        changed = ", ".join(p.repo for p in updated) if updated else "all"
+        now = datetime.datetime.now().strftime("%H:%M:%S")
+        print(f"\n  [{now}] evaluated: {changed} — watching {len(state.roots)} repos"
+              " (Ctrl-C to stop)")
+        sys.stdout.flush()
+
+    _show(state.results, [])
+    try:
+        state.run(_show)
+    except KeyboardInterrupt:
         print()
-        stats = compute_gate_stats(all_projects)
-        print(render_gate_stats(stats, color=use_color))
-        print()
-        print(render_blockers(all_projects, color=use_color))
-        print()
-        print(render_stale(all_projects))
 
 
 def _organ_display_name(organ_id: str, registry: dict) -> str:
@@ -22,7 +22,12 @@
 import sys
 from pathlib import Path
 
-import yaml
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+sys.path.insert(1, str(Path(__file__).resolve().parents[1]))
+
+from lib import registry as shared_registry  # noqa: E402
+
+from contrib_engine.seed_index import SeedEntry, SeedIndex  # noqa: E402
 
 # --- Canonical engine imports (isotope dissolution) ---
 try:
@@ -59,47 +64,23 @@
 STATUS_NORMALIZATION = {"PRODUCTION": "ACTIVE"}
 
 
-def discover_seeds(workspace: Path) -> dict[str, Path]:
-    """Find all seed.yaml in workspace, keyed by org/repo."""
-    found: dict[str, Path] = {}
-    for org_name in ORGAN_ORGS:
-        org_dir = workspace / org_name
-        if not org_dir.is_dir():
-            continue
-        for repo_dir in sorted(org_dir.iterdir()):
-            if not repo_dir.is_dir():
-                continue
-            seed_path = repo_dir / "seed.yaml"
-            if seed_path.is_file():
-                found[f"{org_name}/{repo_dir.name}"] = seed_path
-    return found
+def discover_seeds(workspace: Path) -> dict[str, SeedEntry]:
+    """Find all seed.yaml in workspace (from the seed index), keyed by org/repo."""
+    return {seed.key: seed for seed in SeedIndex(workspace).seeds(ORGAN_ORGS, depth=1)}
 
 
 def load_registry(path: Path) -> dict[str, dict]:
     """Load registry-v2.json into {org/repo: entry} dict."""
-    with open(path) as f:
-        data = json.load(f)
-    flat: dict[str, dict] = {}
-    for organ_id, organ in data.get("organs", {}).items():
-        for repo in organ.get("repositories", []):
-            org = repo.get("org", "")
-            name = repo.get("name", "")
-            if org and name:
-                flat[f"{org}/{name}"] = repo
-    return flat
-
-
-def validate_schema(path: Path, key: str) -> list[str]:
+    reg = shared_registry.load_registry(path, log=lambda msg: print(msg, file=sys.stderr))
+    return reg.entries
+
+
+def validate_schema(seed: SeedEntry, key: str) -> list[str]:
     """Layer 1: Schema validation."""
     errors = []
-    try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
-    except yaml.YAMLError as e:
-        return [f"{key}: YAML parse error: {e}"]
-
-    if not isinstance(data, dict):
-        return [f"{key}: Not a YAML mapping"]
+    data = seed.data
+    if data is None:
+        return [f"{key}: {seed.error}"]
 
     for field in REQUIRED_FIELDS:
         if field not in data:
@@ -135,7 +116,7 @@ def validate_schema(path: Path, key: str) -> list[str]:
 
 
 def validate_registry_agreement(
-    path: Path, key: str, registry: dict[str, dict]
+    seed: SeedEntry, key: str, registry: dict[str, dict]
 ) -> list[str]:
     """Layer 2: Check metadata matches registry."""
     errors = []
@@ -144,15 +125,10 @@ def validate_registry_agreement(
         errors.append(f"{key}: Not in registry-v2.json")
         return errors
 
-    try:
-        with open(path) as f:
-            data = yaml.safe_load(f)
-    except Exception:
+    data = seed.data
+    if data is None:
         return []  # Already caught in schema layer
 
-    if not isinstance(data, dict):
-        return []
-
     metadata = data.get("metadata", {})
     reg = registry[key]
 
@@ -183,20 +159,15 @@ def validate_registry_agreement(
     return errors
 
 
-def validate_graph_integrity(seeds: dict[str, Path]) -> list[str]:
+def validate_graph_integrity(seeds: dict[str, SeedEntry]) -> list[str]:
     """Layer 3: Check that produces/consumes references resolve."""
     errors = []
 
     all_keys = set(seeds.keys())
 
-    for key, path in sorted(seeds.items()):
-        try:
-            with open(path) as f:
-                data = yaml.safe_load(f)
-        except Exception:
-            continue
-
-        if not isinstance(data, dict):
+    for key, seed in sorted(seeds.items()):
+        data = seed.data
+        if data is None:
             continue
 
         # Check produces consumers
@@ -244,13 +215,14 @@ def main():
     if _HAS_ENGINE:
         # Use engine's canonical seed discovery (returns list of Paths)
         seed_paths = _engine_discover_seeds(workspace=workspace)
+        index = SeedIndex(workspace)
         seeds = {}
         for p in seed_paths:
-            # Reconstruct org/repo key from path structure
-            repo_dir = p.parent
-            org_dir = repo_dir.parent
-            key = f"{org_dir.name}/{repo_dir.name}"
-            seeds[key] = p
+            seed = index.entry(p)
+            if seed is not None:
+                # org/repo key from path structure
+                seeds[seed.key] = seed
+        index.save()
     else:
         seeds = discover_seeds(workspace)
 
@@ -259,9 +231,9 @@ def main():
     schema_errors: list[str] = []
     registry_errors: list[str] = []
 
-    for key, path in sorted(seeds.items()):
-        schema_errors.extend(validate_schema(path, key))
-        registry_errors.extend(validate_registry_agreement(path, key, registry))
+    for key, seed in sorted(seeds.items()):
+        schema_errors.extend(validate_schema(seed, key))
+        registry_errors.extend(validate_registry_agreement(seed, key, registry))
 
     graph_errors = validate_graph_integrity(seeds)
 
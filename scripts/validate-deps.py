@@ -18,6 +18,10 @@
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from lib import registry as shared_registry  # noqa: E402
+
 # --- Canonical engine imports (isotope dissolution) ---
 try:
     from organvm_engine.governance.dependency_graph import validate_dependencies as _engine_validate
@@ -52,51 +56,12 @@
 
 def resolve_default_registry() -> Path | None:
     """Return first existing canonical registry path, if available."""
-    for candidate in DEFAULT_REGISTRY_CANDIDATES:
-        if candidate.is_file():
-            return candidate.resolve()
-    return None
+    return shared_registry.resolve_default_registry(DEFAULT_REGISTRY_CANDIDATES)
 
 
-def load_registry(path: str, visited: set[Path] | None = None) -> dict:
+def load_registry(path: str) -> dict:
     """Load registry with fallback to meta-organvm if needed."""
-    visited = visited or set()
-    requested_path = (Path.cwd() / path).resolve()
-    resolved_path = requested_path
-
-    if not requested_path.is_file():
-        default_registry = resolve_default_registry()
-        if default_registry is None:
-            tried = ", ".join(str(p) for p in DEFAULT_REGISTRY_CANDIDATES)
-            raise FileNotFoundError(
-                f"Registry not found at {requested_path}; no canonical registry found in [{tried}]"
-            )
-        print(f"Registry {requested_path} not found. Falling back to {default_registry}")
-        resolved_path = default_registry
-
-    if resolved_path in visited:
-        raise RuntimeError(f"Redirect loop detected while loading registry: {resolved_path}")
-    visited.add(resolved_path)
-
-    with resolved_path.open(encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Check if this is a redirect file
-    if "_redirect" in data and "organs" not in data:
-        default_registry = resolve_default_registry()
-        if default_registry is None:
-            tried = ", ".join(str(p) for p in DEFAULT_REGISTRY_CANDIDATES)
-            raise FileNotFoundError(
-                f"Registry {resolved_path} is a redirect but no canonical registry found in [{tried}]"
-            )
-        if default_registry == resolved_path:
-            raise FileNotFoundError(
-                f"Registry {resolved_path} is a redirect and no alternate canonical registry is available"
-            )
-        print(f"Registry {resolved_path} is a redirect. Following to {default_registry}")
-        return load_registry(str(default_registry), visited)
-
-    return data
+    return shared_registry.load_registry(path, DEFAULT_REGISTRY_CANDIDATES).data
 
 
 def validate(registry_path: str, governance_path: str) -> int:
@@ -27,6 +27,10 @@
 PROJECT_DIR = SCRIPT_DIR.parent
 WORKSPACE = Path.home() / "Workspace"
 
+sys.path.insert(0, str(PROJECT_DIR))
+
+from contrib_engine.seed_index import NO_YAML, SeedEntry, SeedIndex  # noqa: E402
+
 SCOPE_ORDER = ["SUBSTRATE", "CONTROL", "PRODUCTION", "INTERFACE"]
 DEPTH_ORDER = ["ORGANISM", "COMPOUND", "MOLECULE", "ATOM"]
 
@@ -132,38 +136,21 @@ def build_organ_to_scope(thresholds: dict) -> dict[str, str]:
     return mapping or DEFAULT_ORGAN_TO_SCOPE
 
 
-def discover_seed_files(workspace: Path, local_only: bool = False) -> list[Path]:
-    """Find all seed.yaml files across the workspace or locally."""
-    seeds: list[Path] = []
+def discover_seed_files(workspace: Path, local_only: bool = False) -> list[SeedEntry]:
+    """Find all seed.yaml files across the workspace or locally (via the seed index)."""
     if local_only:
-        for p in PROJECT_DIR.parent.rglob("seed.yaml"):
-            seeds.append(p)
-        return seeds
-
-    for organ_dir in ORGAN_DIRS:
-        organ_path = workspace / organ_dir
-        if not organ_path.is_dir():
-            continue
-        for p in organ_path.rglob("seed.yaml"):
-            # Skip deeply nested paths (node_modules, .venv, etc.)
-            rel = p.relative_to(organ_path)
-            if any(part.startswith(".") or part in ("node_modules", ".venv", "__pycache__")
-                   for part in rel.parts[:-1]):
-                continue
-            seeds.append(p)
-    return seeds
-
-
-def classify_repo_from_seed(seed_path: Path) -> dict[str, str] | None:
-    """Extract organ and repo name from a seed.yaml file."""
-    try:
-        import yaml
-    except ImportError:
-        return _classify_seed_simple(seed_path)
-    with seed_path.open(encoding="utf-8") as f:
-        data = yaml.safe_load(f)
-    if not isinstance(data, dict):
-        return None
+        local = PROJECT_DIR.parent
+        return SeedIndex(local.parent).seeds([local.name])
+    return SeedIndex(workspace).seeds(ORGAN_DIRS)
+
+
+def classify_repo_from_seed(seed: SeedEntry) -> dict[str, str] | None:
+    """Extract organ and repo name from an indexed seed.yaml."""
+    seed_path = seed.path
+    data = seed.data
+    if data is None:
+        # Without pyyaml the index holds no parsed content; read the fields directly
+        return _classify_seed_simple(seed_path) if seed.error == NO_YAML else None
     organ_num = data.get("organ")
     repo = data.get("repo", seed_path.parent.name)
     org = data.get("org", "")
@@ -459,8 +446,11 @@ def validate(
     unreachable: list[dict] = []
     repo_governance: dict[str, list[dict]] = {}  # repo_key → list of {rule_id, strength, advisory}
 
-    for seed_path in seeds:
-        info = classify_repo_from_seed(seed_path)
+    for seed in seeds:
+        if seed.data is None and seed.error != NO_YAML:
+            errors.append(f"{seed.path}: {seed.error}")
+            continue
+        info = classify_repo_from_seed(seed)
         if info is None:
             continue
         organ = info["organ"]
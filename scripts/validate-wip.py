@@ -15,6 +15,10 @@
 from datetime import UTC, datetime, timedelta
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from lib import registry as shared_registry  # noqa: E402
+
 ORG_TO_ORGAN = {
     "organvm-i-theoria": "ORGAN-I",
     "organvm-ii-poiesis": "ORGAN-II",
@@ -37,41 +41,12 @@
 
 def resolve_default_registry() -> Path | None:
     """Return first existing canonical registry path, if available."""
-    for candidate in DEFAULT_REGISTRY_CANDIDATES:
-        if candidate.is_file():
-            return candidate.resolve()
-    return None
+    return shared_registry.resolve_default_registry(DEFAULT_REGISTRY_CANDIDATES)
 
 
 def load_registry(path: str) -> dict:
     """Load registry with fallback to meta-organvm if needed."""
-    requested_path = (Path.cwd() / path).resolve()
-    resolved_path = requested_path
-
-    if not requested_path.is_file():
-        default_registry = resolve_default_registry()
-        if default_registry is None:
-            tried = ", ".join(str(p) for p in DEFAULT_REGISTRY_CANDIDATES)
-            raise FileNotFoundError(
-                f"Registry not found at {requested_path}; "
-                f"no canonical registry found in [{tried}]"
-            )
-        print(f"Registry {requested_path} not found. Falling back to {default_registry}")
-        resolved_path = default_registry
-
-    with resolved_path.open(encoding="utf-8") as f:
-        data = json.load(f)
-
-    # Handle redirect files
-    if "_redirect" in data and "organs" not in data:
-        default_registry = resolve_default_registry()
-        if default_registry is None:
-            raise FileNotFoundError("Registry is a redirect but no canonical registry found")
-        print(f"Registry {resolved_path} is a redirect. Following to {default_registry}")
-        with default_registry.open(encoding="utf-8") as f:
-            data = json.load(f)
-
-    return data
+    return shared_registry.load_registry(path, DEFAULT_REGISTRY_CANDIDATES).data
 
 
 def load_governance(path: str) -> dict:
@@ -1,9 +1,15 @@
 """Shared fixtures for orchestration-start-here tests."""
 import json
+import os
+import sys
 from pathlib import Path
 
 import pytest
 
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from lib import registry as shared_registry  # noqa: E402
+
 
 @pytest.fixture(autouse=True)
 def _isolate_ledger_data(tmp_path, monkeypatch):
@@ -17,6 +23,90 @@ def _isolate_ledger_data(tmp_path, monkeypatch):
     monkeypatch.setattr("action_ledger.ledger.DATA_DIR", tmp_path)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_registry_cache(tmp_path, monkeypatch):
+    """Keep the shared registry loader's parse cache out of ~/.cache."""
+    monkeypatch.setattr(shared_registry, "REGISTRY_CACHE_DIR", tmp_path / "registry-cache")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_seed_index(tmp_path, monkeypatch):
+    """Keep the workspace seed index out of ~/.cache."""
+    monkeypatch.setattr("contrib_engine.seed_index.SEED_INDEX_DIR", tmp_path / "seed-index")
+
+
+@pytest.fixture(autouse=True)
+def _isolate_gh_cache(tmp_path, monkeypatch):
+    """Give every test an empty gh response cache outside contrib_engine/data."""
+    from contrib_engine import gh_cache
+
+    monkeypatch.setattr(gh_cache, "_default", gh_cache.ResponseCache(tmp_path / "gh_cache.json"))
+
+
+@pytest.fixture(autouse=True)
+def _isolate_gh_executor(monkeypatch):
+    """Give every test a fresh gh executor that retries without waiting."""
+    from contrib_engine import gh_executor
+
+    executor = gh_executor.GhExecutor(backoff=0, secondary_wait=0)
+    monkeypatch.setattr(gh_executor, "_default", executor)
+
+
+FAKE_GH = """#!{python}
+import json, pathlib, sys
+here = pathlib.Path(__file__).parent
+with open(here / "calls.jsonl", "a") as f:
+    f.write(json.dumps(sys.argv[1:]) + "\\n")
+for rule in json.loads((here / "rules.json").read_text()):
+    if all(m in sys.argv[1:] for m in rule["match"]):
+        sys.stdout.write(rule["stdout"])
+        sys.stderr.write(rule["stderr"])
+        sys.exit(rule["exit_code"])
+sys.exit(1)
+"""
+
+
+class FakeGh:
+    """A `gh` executable on PATH that logs its argv and serves canned output.
+
+    Rules are tried newest first; a rule matches when every string in
+    `match` is one of the arguments.
+    """
+
+    def __init__(self, bin_dir: Path) -> None:
+        self.bin_dir = bin_dir
+        self.rules: list[dict] = []
+        gh = bin_dir / "gh"
+        gh.write_text(FAKE_GH.format(python=sys.executable))
+        gh.chmod(0o755)
+        self._write()
+
+    def _write(self) -> None:
+        (self.bin_dir / "rules.json").write_text(json.dumps(self.rules))
+
+    def serve(
+        self, stdout: str, exit_code: int = 0, match: tuple[str, ...] = (), stderr: str = "",
+    ) -> None:
+        self.rules.insert(0, {
+            "stdout": stdout, "stderr": stderr, "exit_code": exit_code, "match": list(match),
+        })
+        self._write()
+
+    def calls(self) -> list[list[str]]:
+        log = self.bin_dir / "calls.jsonl"
+        if not log.exists():
+            return []
+        return [json.loads(line) for line in log.read_text().splitlines()]
+
+
+@pytest.fixture
+def fake_gh(tmp_path, monkeypatch):
+    bin_dir = tmp_path / "fake-gh"
+    bin_dir.mkdir()
+    monkeypatch.setenv("PATH", f"{bin_dir}:{os.environ.get('PATH', '')}")
+    return FakeGh(bin_dir)
+
+
 @pytest.fixture
 def governance_rules():
     """Governance rules matching production governance-rules.json structure."""
@@ -1,5 +1,7 @@
 """Tests for the Absorption Protocol."""
 
+import json
+
 import pytest
 
 from contrib_engine.absorption import (
@@ -9,12 +11,16 @@
     auto_formalize,
     deposit_to_backflow,
     detect_triggers,
+    detect_triggers_many,
     generate_formalization_prompt,
     infer_organ,
     load_absorption,
+    load_cursors,
     load_tracked_conversations_config,
     mark_formalized,
+    match_triggers,
     save_absorption,
+    save_cursors,
     save_tracked_conversations_config,
     scan_conversations,
 )
@@ -200,6 +206,34 @@ def test_load_empty(self, tmp_path):
         assert len(loaded.items) == 0
 
 
+class TestTriggerEngine:
+    """Compiled matching: spans, bulk API, case handling."""
+
+    TEXT = (
+        "We ended up storing traces per agent. How do you HANDLE two agents that "
+        "disagree about the same target?"
+    )
+
+    def test_spans_point_at_evidence(self):
+        matches = match_triggers(self.TEXT)
+        assert [m.trigger for m in matches] == [
+            AbsorptionTrigger.UNNAMED_PATTERN, AbsorptionTrigger.INDEPENDENT_CONVERGENCE,
+        ]
+        assert [self.TEXT[slice(*m.span)] for m in matches] == [
+            "How do you HANDLE", "We ended up",
+        ]
+        assert detect_triggers(self.TEXT) == [(m.trigger, m.evidence) for m in matches]
+
+    def test_length_changing_lowercase_keeps_spans(self):
+        text = "İstanbul team here. " + self.TEXT
+        (_, converged) = match_triggers(text)
+        assert text[slice(*converged.span)] == "We ended up"
+
+    def test_many(self):
+        texts = [self.TEXT, "short", self.TEXT + " What version is this?"]
+        assert [len(m) for m in detect_triggers_many(texts)] == [2, 0, 0]
+
+
 class TestScanConversations:
     """Test conversation scanning with mock data."""
 
@@ -213,6 +247,74 @@ def test_scan_empty_conversations(self):
         assert items == []
 
 
+def _page(comments=None, status=200, etag=""):
+    head = f"HTTP/2.0 {status} OK\r\nETag: {etag}\r\n" if etag else f"HTTP/2.0 {status} OK\r\n"
+    return head + "\r\n" + (json.dumps(comments) if comments is not None else "")
+
+
+def _comment(cid, login, body, stamp):
+    return {
+        "id": cid, "user": {"login": login}, "body": body,
+        "created_at": stamp, "updated_at": stamp,
+        "html_url": f"https://github.com/o/r/issues/1#issuecomment-{cid}",
+    }
+
+
+class TestIncrementalScan:
+    """Cursors limit each scan to comments past the previous one."""
+
+    CONVS = [{"owner": "o", "repo": "r", "issue_number": 1, "workspace": "w"}]
+    QUESTION = (
+        "How do you handle conflicting traces? Like if two agents deposit contradicting "
+        "RESOURCE traces about the same target."
+    )
+
+    def test_cursor_advances_and_revalidates(self, fake_gh):
+        ours = _comment(1, "4444J99", self.QUESTION, "2026-03-01T00:00:00Z")
+        theirs = _comment(2, "m13v", self.QUESTION, "2026-03-02T00:00:00Z")
+        fake_gh.serve(_page([ours, theirs], etag='"v1"'), match=("--include",))
+        existing = AbsorptionIndex(items=[])
+        cursors = {}
+
+        items = scan_conversations(self.CONVS, cursors=cursors, existing=existing)
+        assert [i.source_url for i in items] == [theirs["html_url"]]
+        assert cursors == {"o/r#1": {"last_id": 2, "since": "2026-03-02T00:00:00Z", "etag": ""}}
+
+        # `since` is inclusive: the newest comment comes back and is skipped
+        fake_gh.serve(_page([theirs], etag='"v2"'), match=("--include",))
+        assert scan_conversations(self.CONVS, cursors=cursors) == []
+        assert cursors["o/r#1"]["etag"] == '"v2"'
+        assert "since=2026-03-02T00%3A00%3A00Z" in fake_gh.calls()[-1][1]
+
+        fake_gh.serve(_page(status=304), exit_code=1, match=('If-None-Match: "v2"',))
+        assert scan_conversations(self.CONVS, cursors=cursors) == []
+        assert cursors["o/r#1"]["etag"] == '"v2"'
+
+        later = _comment(3, "m13v", self.QUESTION, "2026-03-05T00:00:00Z")
+        fake_gh.serve(_page([theirs, later], etag='"v3"'), match=("--include",))
+        items = scan_conversations(self.CONVS, cursors=cursors)
+        assert [i.source_url for i in items] == [later["html_url"]]
+        assert cursors["o/r#1"] == {"last_id": 3, "since": "2026-03-05T00:00:00Z", "etag": ""}
+        assert len(fake_gh.calls()) == 4
+
+    def test_first_scan_skips_tracked_comments(self, fake_gh):
+        theirs = _comment(2, "m13v", self.QUESTION, "2026-03-02T00:00:00Z")
+        fake_gh.serve(_page([theirs]), match=("--include",))
+        existing = AbsorptionIndex(items=[AbsorptionItem(
+            id="abs-1", workspace="w", source_url=theirs["html_url"], questioner="m13v",
+            question_text=self.QUESTION, detected_at="t",
+        )])
+        cursors = {}
+        assert scan_conversations(self.CONVS, cursors=cursors, existing=existing) == []
+        assert cursors["o/r#1"]["last_id"] == 2
+
+    def test_cursors_round_trip(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("contrib_engine.absorption.CURSORS_PATH", tmp_path / "cursors.yaml")
+        assert load_cursors() == {}
+        save_cursors({"o/r#1": {"since": "2026-03-02T00:00:00Z", "last_id": 2, "etag": '"v1"'}})
+        assert load_cursors()["o/r#1"]["etag"] == '"v1"'
+
+
 class TestTrackedConversations:
     """Test tracked conversations config."""
 
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 from pathlib import Path
 
 import yaml
 
+from action_ledger.counters import stream_stamp
 from action_ledger.cycles import (
     detect_all_cycles,
     detect_intent_cycles,
@@ -29,9 +31,12 @@
     set_sequence_intent,
 )
 from action_ledger.routes import (
+    ROUTES_NAME,
+    RouteStore,
     build_route_graph,
     find_consumers,
     find_producers,
+    load_route_store,
     provenance_comment,
     provenance_yaml_header,
     routes_from,
@@ -329,6 +334,80 @@ def test_set_intent(self):
 # ---------------------------------------------------------------------------
 
 
+class TestIdCounters:
+    def test_counters_rebuilt_from_stream_when_missing(self, tmp_path: Path):
+        actions = ActionIndex(actions=[
+            Action(id=f"act-S42-{datetime.now():%m%d}-007", timestamp="2026-03-31T14:00:00",
+                   session="S42", verb="explored", target="fieldwork"),
+        ])
+        action = record(actions, SequenceIndex(), ParamRegistry(),
+                        session="S42", verb="designed", target="ledger")
+        assert action.id.endswith("-008")
+        assert (tmp_path / "counters.json").exists()
+
+    def test_stale_indexes_get_distinct_ids(self):
+        # Two writers holding the same (empty) stream — as two processes would
+        first, second = ActionIndex(), ActionIndex()
+        a = record(first, SequenceIndex(), ParamRegistry(),
+                   session="S42", verb="explored", target="x")
+        b = record(second, SequenceIndex(), ParamRegistry(),
+                   session="S42", verb="explored", target="y")
+        assert a.id != b.id
+        assert a.sequence_id != b.sequence_id
+
+    def test_allocation_does_not_scan_stream(self, tmp_path: Path):
+        actions = ActionIndex()
+        record(actions, SequenceIndex(), ParamRegistry(),
+               session="S42", verb="explored", target="x")
+
+        class NoScan(list):
+            def __iter__(self):
+                raise AssertionError("stream scanned")
+
+        actions.actions = NoScan(actions.actions)
+        action = record(actions, SequenceIndex(), ParamRegistry(),
+                        session="S42", verb="designed", target="y")
+        assert action.id.endswith("-002")
+
+    def test_outside_stream_changes_reconciled(self, tmp_path: Path):
+        actions = ActionIndex()
+        record(actions, SequenceIndex(), ParamRegistry(),
+               session="S42", verb="explored", target="x")
+        save_actions(actions)
+
+        class NoScan(list):
+            def __iter__(self):
+                raise AssertionError("stream scanned")
+
+        # The ledger's own write keeps the counters in step — no rebuild
+        loaded = load_actions()
+        loaded.actions = NoScan(loaded.actions)
+        assert record(loaded, SequenceIndex(), ParamRegistry(),
+                      session="S42", verb="designed", target="y").id.endswith("-002")
+
+        # actions.yaml restored from elsewhere with a higher ID in use
+        restored = ActionIndex(actions=[
+            Action(id=f"act-S42-{datetime.now():%m%d}-050", timestamp="2026-03-31T14:00:00",
+                   session="S42", verb="explored", target="fieldwork"),
+        ])
+        (tmp_path / "actions.yaml").write_text(
+            yaml.safe_dump(restored.model_dump(mode="json")), encoding="utf-8",
+        )
+        action = record(load_actions(), SequenceIndex(), ParamRegistry(),
+                        session="S42", verb="designed", target="z")
+        assert action.id.endswith("-051")
+
+    def test_chain_ids_use_counters(self):
+        sequences = SequenceIndex()
+        record(ActionIndex(), sequences, ParamRegistry(),
+               session="S42", verb="explored", target="x")
+        chains = ChainIndex()
+        first = compose_chain(sequences, chains, "S42", emit=False)
+        second = compose_chain(sequences, ChainIndex(), "S42", emit=False)
+        assert first.id == "chain-S42-001"
+        assert second.id == "chain-S42-002"
+
+
 class TestPersistence:
     def test_actions_round_trip(self, tmp_path: Path):
         actions = ActionIndex()
@@ -525,6 +604,80 @@ def test_routes_from_nonexistent(self):
         assert routes_from(graph, "nonexistent") == []
 
 
+class TestRouteStore:
+    _make_action_index = TestRouteGraph._make_action_index
+
+    def test_matches_in_memory_graph(self, tmp_path: Path):
+        index = self._make_action_index()
+        graph = build_route_graph(index)
+        store = RouteStore(tmp_path / ROUTES_NAME)
+        assert store.sync(index.actions) == 7
+
+        for aid in ("act-S42-0331-001", "act-S42-0331-002"):
+            assert routes_from(store, aid) == routes_from(graph, aid)
+        for target in ("fieldwork.py", "insight-001", "schemas.py"):
+            assert routes_to(store, target) == routes_to(graph, target)
+        assert find_producers(store, "schemas.py") == find_producers(graph, "schemas.py")
+        assert (trace_lineage(store, "act-S42-0331-002", depth=2)
+                == trace_lineage(graph, "act-S42-0331-002", depth=2))
+
+    def test_sync_is_incremental(self, tmp_path: Path):
+        index = self._make_action_index()
+        store = RouteStore(tmp_path / ROUTES_NAME)
+        assert store.sync(index.actions[:1]) == 2
+        assert store.sync(index.actions) == 5
+        assert store.sync(index.actions) == 0
+        assert store.indexed == 3
+
+    def test_save_actions_appends_edges(self, tmp_path: Path):
+        index = self._make_action_index()
+        save_actions(index)
+        store = load_route_store()
+        assert len(routes_to(store, "schemas.py")) == 2
+
+        record(index, load_sequences(), load_param_registry(),
+               session="S42", verb="reviewed", target="schemas",
+               routes=[{"kind": "consumed", "target": "schemas.py"}])
+        save_actions(index)
+        assert len(find_consumers(store, "schemas.py")) == 2
+
+    def _replace_stream(self, tmp_path: Path) -> None:
+        """Rewrite actions.yaml outside save_actions, keeping its length."""
+        index = self._make_action_index()
+        index.actions[2] = Action(
+            id="act-S42-0331-009", timestamp="2026-03-31T14:30:00",
+            session="S42", verb="restored", target="ledger",
+            routes=[Route(kind=RouteKind.CONSUMED, target="backup.tar")],
+        )
+        save_actions(index, tmp_path / "actions.yaml")
+
+    def test_stream_replaced_outside_save_is_rebuilt_on_query(self, tmp_path: Path):
+        save_actions(self._make_action_index())
+        load_route_store().close()
+
+        self._replace_stream(tmp_path)
+        store = load_route_store()
+        assert routes_from(store, "act-S42-0331-003") == []
+        assert [r.source_id for r in routes_to(store, "backup.tar")] == ["act-S42-0331-009"]
+        assert store.source == stream_stamp(tmp_path, "actions")
+
+    def test_save_after_outside_change_rebuilds(self, tmp_path: Path):
+        save_actions(self._make_action_index())
+        load_route_store().close()
+
+        self._replace_stream(tmp_path)
+        index = load_actions()
+        record(index, load_sequences(), load_param_registry(),
+               session="S42", verb="reviewed", target="schemas",
+               routes=[{"kind": "consumed", "target": "schemas.py"}])
+        save_actions(index)
+
+        store = RouteStore(tmp_path / ROUTES_NAME)
+        assert routes_from(store, "act-S42-0331-003") == []
+        assert len(routes_to(store, "backup.tar")) == 1
+        assert len(find_consumers(store, "schemas.py")) == 1
+
+
 class TestProvenance:
     def test_provenance_comment(self):
         a = Action(id="act-S42-0331-001", timestamp="2026-03-31T14:00:00",
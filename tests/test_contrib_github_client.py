@@ -1,8 +1,20 @@
 """Tests for github_client with mocks."""
 
+import threading
+import time
 from unittest.mock import patch
 
-from contrib_engine.github_client import search_issues, who_starred_my_repos
+from contrib_engine import gh_cache, gh_executor
+from contrib_engine.gh_executor import GhExecutor, TokenBucket
+from contrib_engine.github_client import (
+    _run_gh,
+    get_issue_comments,
+    get_repo_info,
+    get_repo_info_batch,
+    search_issues,
+    search_issues_batch,
+    who_starred_my_repos,
+)
 
 
 class TestWhoStarredMyRepos:
@@ -25,3 +37,122 @@ def test_returns_empty_on_no_results(self):
             mock.return_value = []
             result = search_issues("owner", "repo", ["keyword"])
             assert result == []
+
+
+def _http(status, body="", **headers):
+    reason = {200: "OK", 304: "Not Modified"}[status]
+    lines = [f"HTTP/2.0 {status} {reason}"]
+    lines += [f"{name.replace('_', '-')}: {value}" for name, value in headers.items()]
+    return "\n".join(lines) + "\n\n" + body
+
+
+class TestResponseCache:
+    ENDPOINT = "repos/adenhq/hive/issues/3/comments"
+
+    def test_revalidates_with_etag(self, fake_gh):
+        fake_gh.serve(_http(200, '[{"user": "maint"}]', ETag='"v1"'), match=("--include",))
+        fake_gh.serve(_http(304), exit_code=1, match=("If-None-Match: \"v1\"",))
+
+        first = _run_gh(["api", self.ENDPOINT])
+        second = _run_gh(["api", self.ENDPOINT])
+        assert first == second == [{"user": "maint"}]
+
+        calls = fake_gh.calls()
+        assert len(calls) == 2
+        assert "If-None-Match: \"v1\"" not in calls[0]
+        assert "If-None-Match: \"v1\"" in calls[1]
+        assert gh_cache.default_cache().summary() == {"comments": {"miss": 1, "revalidated": 1}}
+
+    def test_fresh_entries_skip_the_request(self, fake_gh, monkeypatch):
+        fake_gh.serve(_http(200, '{"stargazerCount": 5}', Last_Modified="Mon, 02 Mar 2026"),
+                      match=("--include",))
+        assert get_repo_info("adenhq", "hive") == {"stargazerCount": 5}
+        assert get_repo_info("adenhq", "hive") == {"stargazerCount": 5}
+        assert len(fake_gh.calls()) == 1
+        assert gh_cache.default_cache().summary()["repo"] == {"miss": 1, "fresh": 1}
+
+        # A new process reloads the entry from disk
+        path = gh_cache.default_cache().path
+        monkeypatch.setattr(gh_cache, "_default", gh_cache.ResponseCache(path))
+        assert get_repo_info("adenhq", "hive") == {"stargazerCount": 5}
+        assert len(fake_gh.calls()) == 1
+
+    def test_uncacheable_calls_bypass_cache(self):
+        assert not gh_cache.cacheable(["api", "repos/o/r/stargazers", "--paginate"])
+        assert not gh_cache.cacheable(["api", "graphql", "-f", "query=..."])
+        assert not gh_cache.cacheable(["pr", "view", "1"])
+        assert gh_cache.cacheable(["api", "repos/o/r/issues/1/comments", "-q", ".[]"])
+
+
+class TestGhExecutor:
+    def test_retries_server_errors(self, fake_gh):
+        fake_gh.serve("", exit_code=1, stderr="gh: Server Error (HTTP 502)")
+        assert _run_gh(["pr", "view", "1"]) is None
+        assert len(fake_gh.calls()) == 1 + gh_executor.MAX_RETRIES
+        (metric,) = gh_executor.default_executor().metrics
+        assert (metric.command, metric.attempts, metric.ok) == ("pr view", 4, False)
+
+    def test_other_failures_not_retried(self, fake_gh):
+        fake_gh.serve("", exit_code=1, stderr="GraphQL: Could not resolve to a PullRequest")
+        assert _run_gh(["pr", "view", "1"]) is None
+        assert len(fake_gh.calls()) == 1
+        assert gh_executor.default_executor().summary()["pr"]["failures"] == 1
+
+    def test_token_bucket_paces_and_pauses(self):
+        now = [0.0]
+        bucket = TokenBucket(
+            2.0, 2, clock=lambda: now[0], sleep=lambda s: now.__setitem__(0, now[0] + s),
+        )
+        assert [bucket.acquire() for _ in range(4)] == [0.0, 0.0, 0.5, 0.5]
+        bucket.pause(10)
+        assert bucket.acquire() == 10
+
+    def test_searches_use_their_own_bucket(self):
+        assert gh_executor.bucket_for(["search", "issues", "--repo", "o/r"]) == "search"
+        assert gh_executor.bucket_for(["api", "search/issues?q=x"]) == "search"
+        assert gh_executor.bucket_for(["api", "repos/o/r"]) == "core"
+
+    def test_map_bounds_concurrency(self):
+        active, peak = [0], [0]
+        lock = threading.Lock()
+
+        def work(i):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.02)
+            with lock:
+                active[0] -= 1
+            return i * 2
+
+        assert GhExecutor(max_concurrency=3).map(work, range(9)) == list(range(0, 18, 2))
+        assert 1 < peak[0] <= 3
+
+    def test_batch_helpers(self, fake_gh):
+        fake_gh.serve(_http(200, '{"stargazerCount": 7}'), match=("repos/a/a",))
+        fake_gh.serve("", exit_code=1, match=("repos/b/b",))
+        fake_gh.serve('[{"number": 4}]', match=("search",))
+
+        infos = get_repo_info_batch([("a", "a"), ("b", "b"), ("a", "a")])
+        assert infos == {("a", "a"): {"stargazerCount": 7}, ("b", "b"): None}
+
+        found = search_issues_batch([("a", "a"), ("c", "c")], ["mcp"])
+        assert found == {("a", "a"): [{"number": 4}], ("c", "c"): [{"number": 4}]}
+        assert len(fake_gh.calls()) == 4
+
+
+class TestIssueComments:
+    def test_follows_pages(self, fake_gh):
+        endpoint = "repos/o/r/issues/5/comments?per_page=2&page={}"
+        fake_gh.serve(_http(200, '[{"id": 1}, {"id": 2}]', ETag='"p1"'),
+                      match=(endpoint.format(1),))
+        fake_gh.serve(_http(200, '[{"id": 3}]', ETag='"p2"'), match=(endpoint.format(2),))
+
+        comments, etag = get_issue_comments("o", "r", 5, per_page=2)
+        assert [c["id"] for c in comments] == [1, 2, 3]
+        assert etag == '"p1"'
+
+    def test_not_modified_keeps_etag(self, fake_gh):
+        fake_gh.serve(_http(304), exit_code=1, match=('If-None-Match: "p1"',))
+        assert get_issue_comments("o", "r", 5, since="2026-03-01", etag='"p1"') == ([], '"p1"')
+        assert "since=2026-03-01" in fake_gh.calls()[0][1]
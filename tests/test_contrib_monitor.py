@@ -1,9 +1,22 @@
 """Tests for the contribution monitor."""
 
-from contrib_engine.monitor import _infer_target, determine_next_action
+import json
+
+from contrib_engine import github_client
+from contrib_engine.monitor import (
+    _infer_target,
+    check_pr_state,
+    determine_next_action,
+    poll_contributions,
+)
 from contrib_engine.schemas import ContributionStatus, PRState
 
 
+def _serve_graphql(fake_gh, data, errors=None):
+    payload = {"data": data, **({"errors": errors} if errors else {})}
+    fake_gh.serve(json.dumps(payload), exit_code=1 if errors else 0)
+
+
 class TestInferTarget:
     def test_infers_from_produces(self):
         seed = {"produces": ["pr_to_adenhq_hive", "theory_extraction"]}
@@ -81,3 +94,66 @@ def test_dict_without_consumers(self):
             ]
         }
         assert _infer_target(seed) == ""
+
+
+def _pr(state="OPEN", comments=(), checks=()):
+    return {
+        "__typename": "PullRequest",
+        "state": state,
+        "mergeable": "MERGEABLE",
+        "reviews": {"nodes": []},
+        "comments": {"nodes": list(comments)},
+        "labels": {"nodes": []},
+        "assignees": {"nodes": []},
+        "commits": {"nodes": [{"commit": {"statusCheckRollup": {"contexts": {
+            "nodes": list(checks),
+        }}}}]},
+    }
+
+
+class TestBatchedPolling:
+    def test_one_query_for_all_contributions(self, fake_gh):
+        contributions = [
+            ContributionStatus(workspace="contrib--hive", target="adenhq/hive",
+                               pr_number=7, issue_number=3, pr_state=PRState.OPEN),
+            ContributionStatus(workspace="contrib--skills", target="anthropics/skills",
+                               pr_number=12, pr_state=PRState.OPEN),
+            ContributionStatus(workspace="contrib--draft", target="someone/draft"),
+        ]
+        _serve_graphql(fake_gh, {
+            "r0": {
+                "n7": _pr(comments=[{"author": {"login": "maint"}, "body": "thanks",
+                                     "createdAt": "2026-03-01T00:00:00Z"}],
+                          checks=[{"__typename": "CheckRun", "name": "ci",
+                                   "status": "COMPLETED", "conclusion": "SUCCESS"}]),
+                "n3": {"__typename": "Issue", "state": "OPEN",
+                       "assignees": {"nodes": [{"login": "4444J99"}]}},
+            },
+            "r1": {"n12": _pr(state="MERGED")},
+        })
+
+        statuses = poll_contributions(contributions)
+        calls = fake_gh.calls()
+        assert len(calls) == 1
+        assert calls[0][:2] == ["api", "graphql"]
+        assert statuses[("adenhq", "hive", 3)] == {
+            "state": "OPEN", "assignees": [{"login": "4444J99"}],
+        }
+
+        hive, skills, _ = contributions
+        changes = check_pr_state(hive, statuses)
+        assert changes["new_comment"]["author"] == "maint"
+        assert changes["assigned"] is True
+        assert hive.last_ci == "pass"
+        assert check_pr_state(skills, statuses)["state_changed"]["to"] == PRState.MERGED
+        assert len(fake_gh.calls()) == 1
+
+    def test_chunks_and_partial_errors(self, fake_gh):
+        _serve_graphql(fake_gh, {"r0": {"n1": _pr(), "n2": None}},
+                       errors=[{"message": "Could not resolve to an issue or pull request"}])
+
+        refs = [("o", "r", 1), ("o", "r", 2), ("o", "r", 3)]
+        statuses = github_client.get_status_batch(refs, batch_size=2)
+        assert len(fake_gh.calls()) == 2
+        assert list(statuses) == [("o", "r", 1)]
+        assert statuses[("o", "r", 1)]["statusCheckRollup"] == []
@@ -0,0 +1,89 @@
+"""Tests for the workspace seed.yaml index."""
+
+import os
+
+import pytest
+
+from contrib_engine import monitor, seed_index
+from contrib_engine.seed_index import SeedIndex
+
+
+def _seed(path, **fields):
+    path.mkdir(parents=True, exist_ok=True)
+    lines = [f"{k}: {v}" for k, v in fields.items()]
+    (path / "seed.yaml").write_text("\n".join(lines) + "\n")
+    return path / "seed.yaml"
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    ws = tmp_path / "Workspace"
+    _seed(ws / "organvm-i-theoria" / "engine", org="organvm-i-theoria", repo="engine")
+    _seed(ws / "organvm-i-theoria" / "super" / "nested", repo="nested")
+    _seed(ws / "organvm-i-theoria" / "engine" / "node_modules" / "dep", repo="dep")
+    _seed(ws / "organvm-i-theoria" / ".hidden", repo="hidden")
+    (ws / "organvm-i-theoria" / "broken").mkdir()
+    (ws / "organvm-i-theoria" / "broken" / "seed.yaml").write_text("key: [unclosed\n")
+    return ws
+
+
+class TestSeedIndex:
+    def test_discovers_and_prunes(self, workspace):
+        entries = SeedIndex(workspace).seeds(["organvm-i-theoria", "missing-organ"])
+        assert [e.key for e in entries] == [
+            "organvm-i-theoria/broken", "organvm-i-theoria/engine", "super/nested",
+        ]
+        broken, engine, _ = entries
+        assert broken.data is None and broken.error.startswith("YAML parse error")
+        assert engine.data == {"org": "organvm-i-theoria", "repo": "engine"}
+
+        top = SeedIndex(workspace).seeds(["organvm-i-theoria"], depth=1)
+        assert [e.key for e in top] == ["organvm-i-theoria/broken", "organvm-i-theoria/engine"]
+
+    def test_refresh_reparses_only_changes(self, workspace, monkeypatch):
+        SeedIndex(workspace).seeds(["organvm-i-theoria"])
+
+        parsed = []
+        real_parse = seed_index.parse_seed_file
+        monkeypatch.setattr(
+            seed_index, "parse_seed_file", lambda p: parsed.append(p.parent.name) or real_parse(p)
+        )
+        assert len(SeedIndex(workspace).seeds(["organvm-i-theoria"])) == 3
+        assert parsed == []
+
+        engine = workspace / "organvm-i-theoria" / "engine" / "seed.yaml"
+        engine.write_text("repo: engine\ntier: flagship\n")
+        os.utime(engine, ns=(1, 1))
+        _seed(workspace / "organvm-i-theoria" / "fresh", repo="fresh")
+        (workspace / "organvm-i-theoria" / "broken" / "seed.yaml").unlink()
+
+        entries = {e.key: e for e in SeedIndex(workspace).seeds(["organvm-i-theoria"])}
+        assert sorted(parsed) == ["engine", "fresh"]
+        assert sorted(entries) == [
+            "organvm-i-theoria/engine", "organvm-i-theoria/fresh", "super/nested",
+        ]
+        assert entries["organvm-i-theoria/engine"].data["tier"] == "flagship"
+
+    def test_discover_contributions_reads_index(self, tmp_path, monkeypatch):
+        organ_iv = tmp_path / "Workspace" / "organvm-iv-taxis"
+        _seed(organ_iv / "contrib--hive", produces="[pr_to_adenhq_hive]")
+        _seed(organ_iv / "orchestration-start-here", produces="[pr_to_other_repo]")
+        monkeypatch.setattr(monitor, "ORGAN_IV_DIR", organ_iv)
+
+        contributions = monitor.discover_contributions()
+        assert [(c.workspace, c.target) for c in contributions] == [
+            ("contrib--hive", "adenhq/hive"),
+        ]
+
+    def test_large_batch_parsed_in_pool(self, tmp_path):
+        organ = tmp_path / "Workspace" / "organvm-v-logos"
+        count = seed_index.PARALLEL_MIN + 6
+        for i in range(count):
+            _seed(organ / f"repo-{i:03d}", repo=f"repo-{i:03d}", created="2026-03-01")
+        (organ / "repo-000" / "seed.yaml").write_text("- not\n- a mapping\n")
+
+        entries = SeedIndex(tmp_path / "Workspace", workers=2).seeds(["organvm-v-logos"])
+        assert len(entries) == count
+        assert entries[0].error == "Not a YAML mapping"
+        assert [e.data["repo"] for e in entries[1:]] == [f"repo-{i:03d}" for i in range(1, count)]
+        assert str(entries[1].data["created"]) == "2026-03-01"
@@ -223,3 +223,98 @@ def test_origin_serializes_to_yaml(self, tmp_path):
         save_actions(actions, path)
         reloaded = load_actions(path)
         assert reloaded.actions[0].origin == ActionOrigin.EMITTED
+
+
+class TestLedgerSession:
+    """Batched load/save through LedgerSession and batched_emissions."""
+
+    def test_emissions_join_active_session(self, tmp_path, monkeypatch):
+        from action_ledger.ledger import ledger_session
+
+        with ledger_session() as ledger:
+            ledger.record(session="S42", verb="explored", target="fieldwork")
+            emit_state_change(
+                subsystem="test", verb="first", target="x",
+                from_state="a", to_state="b", session="S42",
+            )
+            emit_state_change(
+                subsystem="test", verb="second", target="y",
+                from_state="b", to_state="c", session="S42",
+            )
+            # Nothing hits disk until the outermost exit
+            assert not (tmp_path / "actions.yaml").exists()
+
+        reloaded = load_actions()
+        assert [a.verb for a in reloaded.actions] == ["explored", "first", "second"]
+        assert len({a.id for a in reloaded.actions}) == 3
+
+    def test_single_load_per_session(self, monkeypatch):
+        import action_ledger.ledger as ledger_mod
+
+        loads = []
+        real_load = ledger_mod.load_actions
+        monkeypatch.setattr(
+            ledger_mod, "load_actions",
+            lambda path=None: loads.append(path) or real_load(path),
+        )
+
+        with ledger_mod.ledger_session():
+            for i in range(5):
+                emit_state_change(
+                    subsystem="test", verb=f"v{i}", target="t",
+                    from_state="a", to_state="b",
+                )
+
+        assert len(loads) == 1
+        assert len(real_load().actions) == 5
+
+    def test_nested_session_joins_outer(self):
+        from action_ledger.ledger import current_ledger_session, ledger_session
+
+        with ledger_session() as outer:
+            with ledger_session() as inner:
+                assert inner is outer
+            assert current_ledger_session() is outer
+        assert current_ledger_session() is None
+
+    def test_session_discards_on_error(self, tmp_path):
+        from action_ledger.ledger import ledger_session
+
+        try:
+            with ledger_session() as ledger:
+                ledger.record(session="S42", verb="explored", target="fieldwork")
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert load_actions().actions == []
+
+    def test_batched_emissions_flush_on_error(self):
+        from action_ledger.emissions import batched_emissions
+
+        try:
+            with batched_emissions():
+                emit_state_change(
+                    subsystem="test", verb="happened", target="t",
+                    from_state="a", to_state="b",
+                )
+                raise RuntimeError("boom")
+        except RuntimeError:
+            pass
+
+        assert [a.verb for a in load_actions().actions] == ["happened"]
+
+    def test_batched_emissions_tolerates_broken_ledger(self, tmp_path, monkeypatch):
+        from action_ledger.emissions import batched_emissions
+
+        bad_path = tmp_path / "bad"
+        bad_path.mkdir()
+        (bad_path / "actions.yaml").write_text("not: [valid: {yaml")
+        monkeypatch.setattr("action_ledger.ledger.DATA_DIR", bad_path)
+
+        with batched_emissions():
+            result = emit_state_change(
+                subsystem="test", verb="lost", target="t",
+                from_state="a", to_state="b",
+            )
+        assert result is None
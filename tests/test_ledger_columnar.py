@@ -0,0 +1,178 @@
+"""Tests for the columnar action index sidecar."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from action_ledger.columnar import COLUMNS_NAME, HEADER_NAME, load_columns
+from action_ledger.cycles import detect_verb_cycles
+from action_ledger.ledger import (
+    load_actions,
+    load_param_registry,
+    load_sequences,
+    record,
+    save_actions,
+)
+from action_ledger.storage import JOURNAL_NAME, import_yaml
+
+
+def _seed(tmp_path: Path, specs: list[tuple[str, str, dict]]) -> None:
+    index = load_actions()
+    sequences = load_sequences()
+    registry = load_param_registry()
+    for session, verb, params in specs:
+        record(index, sequences, registry,
+               session=session, verb=verb, target=f"{verb}-target", params=params)
+    save_actions(index)
+
+
+class TestColumns:
+    def test_select_and_materialize(self, tmp_path: Path):
+        _seed(tmp_path, [
+            ("S1", "read", {"subsystem": "intake_router"}),
+            ("S1", "write", {}),
+            ("S2", "read", {}),
+        ])
+        columns = load_columns()
+
+        assert columns.rows == 3
+        rows = columns.select(verb="read")
+        assert [columns.value("session", r) for r in rows] == ["S1", "S2"]
+        assert columns.select(subsystem="intake_router") == [0]
+        assert columns.select(verb="missing") == []
+
+        action = columns.action(1)
+        assert action.verb == "write"
+        assert columns.ids([1]) == [action.id]
+
+    def test_time_range_and_group_by(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {}), ("S2", "b", {}), ("S1", "c", {})])
+        columns = load_columns()
+
+        now = datetime.now()
+        assert len(columns.select(since=now - timedelta(hours=1))) == 3
+        assert columns.select(until=now - timedelta(hours=1)) == []
+        groups = columns.group_by("session")
+        assert groups == {"S1": [0, 2], "S2": [1]}
+
+    def test_rebuilds_when_stream_changes(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {})])
+        assert load_columns().rows == 1
+        _seed(tmp_path, [("S1", "b", {})])
+        assert load_columns().rows == 2
+
+    def test_journal_appends_incrementally(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {})])
+        import_yaml(tmp_path / "actions.yaml", tmp_path)
+        assert load_columns().rows == 1
+
+        _seed(tmp_path, [("S1", "b", {}), ("S2", "a", {})])
+        columns = load_columns()
+        assert columns.rows == 3
+        assert columns.group_by("verb") == {"a": [0, 2], "b": [1]}
+        assert (tmp_path / COLUMNS_NAME).exists()
+
+    def test_save_appends_to_block_files(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {"subsystem": "x"})])
+        sidecar = tmp_path / COLUMNS_NAME
+        header = json.loads((sidecar / HEADER_NAME).read_text())
+        ts_col = sidecar / f"{header['generation']}.ts.col"
+        inode = ts_col.stat().st_ino
+
+        _seed(tmp_path, [("S2", "b", {"subsystem": "x"}), ("S2", "a", {})])
+        patched = json.loads((sidecar / HEADER_NAME).read_text())
+        assert patched["generation"] == header["generation"]
+        assert patched["rows"] == 3
+        assert ts_col.stat().st_ino == inode
+        assert ts_col.stat().st_size == 3 * 8
+        with load_columns() as columns:
+            assert columns.header == patched
+            assert columns.strings("verb") == ["a", "b"]
+            assert columns.select(subsystem="x") == [0, 1]
+            assert columns.action(2).session == "S2"
+
+    def test_torn_append_is_truncated(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {})])
+        sidecar = tmp_path / COLUMNS_NAME
+        header = json.loads((sidecar / HEADER_NAME).read_text())
+        for block in ("verb.col", "record.heap", "record.offs"):
+            with open(sidecar / f"{header['generation']}.{block}", "ab") as f:
+                f.write(b"\xff" * 13)
+
+        assert load_columns().rows == 1
+        _seed(tmp_path, [("S1", "b", {})])
+        with load_columns() as columns:
+            assert columns.rows == 2
+            assert [columns.value("verb", r) for r in range(2)] == ["a", "b"]
+            assert columns.record(1)["verb"] == "b"
+
+    def test_reads_never_write(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {})])
+        sidecar = tmp_path / COLUMNS_NAME
+        before = {f.name: f.read_bytes() for f in sidecar.iterdir()}
+
+        # Changed outside save_actions — the fingerprint no longer matches
+        index = load_actions()
+        record(index, load_sequences(), load_param_registry(),
+               session="S2", verb="b", target="t", params={})
+        save_actions(index, tmp_path / "actions.yaml")
+
+        with load_columns() as columns:
+            assert columns.rows == 2
+            assert columns.value("verb", 1) == "b"
+        assert {f.name: f.read_bytes() for f in sidecar.iterdir()} == before
+
+    def test_context_manager_releases_mappings(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {})])
+        with load_columns() as columns:
+            assert columns._maps
+        assert columns._maps == []
+
+    def test_verb_cycles_match_action_index(self, tmp_path: Path):
+        _seed(tmp_path, [
+            ("S1", "read", {}), ("S1", "edit", {}), ("S1", "test", {}),
+            ("S2", "read", {}), ("S2", "edit", {}), ("S2", "test", {}),
+        ])
+        from_index = detect_verb_cycles(load_actions())
+        from_columns = detect_verb_cycles(load_columns())
+        assert [(c.pattern, c.sessions, c.evidence) for c in from_columns] == [
+            (c.pattern, c.sessions, c.evidence) for c in from_index
+        ]
+
+    def test_half_written_journal_line_indexed_once_complete(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {})])
+        import_yaml(tmp_path / "actions.yaml", tmp_path)
+        _seed(tmp_path, [("S1", "b", {})])
+        journal = tmp_path / JOURNAL_NAME
+        line = journal.read_bytes().splitlines(keepends=True)[-1]
+        journal.write_bytes(journal.read_bytes()[:-len(line)] + line[:20])
+
+        assert load_columns().rows == 1
+        with open(journal, "ab") as f:
+            f.write(line[20:])
+        columns = load_columns()
+        assert columns.rows == 2
+        assert columns.value("verb", 1) == "b"
+
+    def test_concurrent_readers(self, tmp_path: Path):
+        _seed(tmp_path, [("S1", "a", {}), ("S2", "b", {})])
+        errors, rows = [], []
+
+        def read():
+            try:
+                with load_columns() as columns:
+                    rows.append(columns.rows)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert errors == []
+        assert rows == [2] * 8
+        assert list(tmp_path.rglob("*.tmp")) == []
@@ -0,0 +1,92 @@
+"""Tests for concurrent ledger writers — locking, generations, merges."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+from action_ledger.concurrency import read_generation
+from action_ledger.emissions import emit_state_change
+from action_ledger.ledger import (
+    LedgerSession,
+    close_sequence,
+    load_actions,
+    load_param_registry,
+    load_sequences,
+    save_sequences,
+)
+from action_ledger.schemas import SequenceIndex
+
+
+class TestGeneration:
+    def test_default_path_saves_bump_generation(self, tmp_path: Path):
+        assert read_generation(tmp_path) == 0
+        save_sequences(SequenceIndex())
+        assert read_generation(tmp_path) == 1
+
+    def test_explicit_path_saves_do_not(self, tmp_path: Path):
+        save_sequences(SequenceIndex(), tmp_path / "export.yaml")
+        assert read_generation(tmp_path) == 0
+
+
+class TestStaleSessionMerge:
+    def test_interleaved_sessions_keep_both_actions(self):
+        first = LedgerSession.load()
+        second = LedgerSession.load()
+
+        first.record(session="S42", verb="explored", target="a",
+                     params={"abstraction": 0.2})
+        second.record(session="S42", verb="designed", target="b",
+                      params={"abstraction": 0.9})
+        first.flush()
+        second.flush()
+
+        actions = load_actions().actions
+        assert sorted(a.verb for a in actions) == ["designed", "explored"]
+        assert load_param_registry().axes["abstraction"].frequency == 2
+
+    def test_merge_replays_sequence_edits(self):
+        with LedgerSession.load() as ledger:
+            ledger.record(session="S42", verb="explored", target="a")
+
+        stale = LedgerSession.load()
+        with LedgerSession.load() as ledger:
+            ledger.record(session="S42", verb="designed", target="b")
+
+        close_sequence(stale.sequences, "S42", outcome="done", emit=False)
+        stale.flush()
+
+        [seq] = load_sequences().sequences
+        assert seq.closed is True
+        assert seq.outcome == "done"
+        assert len(seq.action_ids) == 2
+
+    def test_unchanged_indexes_are_not_rewritten(self, tmp_path: Path):
+        with LedgerSession.load() as ledger:
+            ledger.record(session="S42", verb="explored", target="a")
+        before = read_generation(tmp_path)
+
+        with LedgerSession.load():
+            pass
+
+        assert read_generation(tmp_path) == before
+
+
+class TestConcurrentEmitters:
+    def test_threads_do_not_lose_emissions(self):
+        def emit_many(worker: int) -> None:
+            for i in range(5):
+                emit_state_change(
+                    subsystem="test", verb=f"w{worker}", target=f"t{i}",
+                    from_state="a", to_state="b",
+                )
+
+        threads = [threading.Thread(target=emit_many, args=(w,)) for w in range(3)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        actions = load_actions().actions
+        assert len(actions) == 15
+        assert len({a.id for a in actions}) == 15
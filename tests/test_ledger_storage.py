@@ -0,0 +1,111 @@
+"""Tests for action ledger storage backends — YAML and journal."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from action_ledger.ledger import (
+    get_action_store,
+    load_actions,
+    load_param_registry,
+    load_sequences,
+    record,
+    save_actions,
+)
+from action_ledger.schemas import ActionIndex
+from action_ledger.storage import (
+    JOURNAL_NAME,
+    SNAPSHOT_NAME,
+    JournalActionStore,
+    YamlActionStore,
+    export_yaml,
+    import_yaml,
+)
+
+
+def _record_n(index: ActionIndex, n: int, session: str = "S42") -> None:
+    sequences = load_sequences()
+    registry = load_param_registry()
+    for i in range(n):
+        record(index, sequences, registry,
+               session=session, verb=f"verb{i}", target=f"target{i}")
+
+
+class TestBackendSelection:
+    def test_yaml_is_default(self, tmp_path: Path):
+        assert isinstance(get_action_store(), YamlActionStore)
+
+    def test_journal_once_snapshot_exists(self, tmp_path: Path):
+        import_yaml(tmp_path / "actions.yaml", tmp_path)
+        assert isinstance(get_action_store(), JournalActionStore)
+
+
+class TestJournalStore:
+    def test_save_appends_only_new_actions(self, tmp_path: Path):
+        store = JournalActionStore(tmp_path)
+        store.compact(ActionIndex())
+
+        index = store.load()
+        _record_n(index, 2)
+        store.save(index)
+
+        index = store.load()
+        _record_n(index, 1)
+        store.save(index)
+
+        lines = (tmp_path / JOURNAL_NAME).read_text().splitlines()
+        assert len(lines) == 3
+        assert json.loads(lines[-1])["verb"] == "verb0"
+        assert len(store.load().actions) == 3
+
+    def test_foreign_index_is_written_as_snapshot(self, tmp_path: Path):
+        store = JournalActionStore(tmp_path)
+        index = ActionIndex()
+        _record_n(index, 2)
+        store.save(index)
+
+        assert (tmp_path / SNAPSHOT_NAME).exists()
+        assert not (tmp_path / JOURNAL_NAME).exists()
+        assert len(store.load().actions) == 2
+
+    def test_compacts_past_threshold(self, tmp_path: Path):
+        store = JournalActionStore(tmp_path, compact_threshold=1)
+        store.compact(ActionIndex())
+
+        index = store.load()
+        _record_n(index, 1)
+        store.save(index)
+
+        assert not (tmp_path / JOURNAL_NAME).exists()
+        snapshot = json.loads((tmp_path / SNAPSHOT_NAME).read_text())
+        assert len(snapshot["actions"]) == 1
+
+    def test_torn_final_line_is_skipped(self, tmp_path: Path):
+        store = JournalActionStore(tmp_path)
+        store.compact(ActionIndex())
+        index = store.load()
+        _record_n(index, 1)
+        store.save(index)
+
+        with open(tmp_path / JOURNAL_NAME, "a", encoding="utf-8") as f:
+            f.write('{"id": "act-S42-')
+
+        assert len(store.load().actions) == 1
+
+
+class TestImportExport:
+    def test_round_trip_through_journal(self, tmp_path: Path):
+        index = ActionIndex()
+        _record_n(index, 3)
+        save_actions(index, tmp_path / "seed.yaml")
+
+        import_yaml(tmp_path / "seed.yaml", tmp_path)
+        loaded = load_actions()
+        _record_n(loaded, 1, session="S43")
+        save_actions(loaded)
+
+        out = export_yaml(tmp_path, tmp_path / "out.yaml")
+        exported = load_actions(out)
+        assert [a.id for a in exported.actions] == [a.id for a in loaded.actions]
+        assert exported.actions[-1].session == "S43"
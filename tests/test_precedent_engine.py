@@ -0,0 +1,187 @@
+"""Tests for the precedent engine's store queries and search deadlines."""
+
+from __future__ import annotations
+
+import difflib
+import subprocess
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from action_ledger.ledger import (
+    load_actions,
+    load_param_registry,
+    load_sequences,
+    record,
+    save_actions,
+)
+from precedent_engine import search, stores
+from precedent_engine.corpus_index import CorpusIndex
+
+
+def _fake_git(monkeypatch, seconds: float) -> list[float]:
+    """Replace git with a call taking `seconds`; returns the timeouts passed."""
+    timeouts: list[float] = []
+
+    def run(cmd, capture_output, text, timeout):
+        timeouts.append(timeout)
+        time.sleep(min(seconds, timeout))
+        repo = Path(cmd[2]).name
+        return subprocess.CompletedProcess(
+            cmd, 0, stdout=f"{'a' * 40}|2026-03-01T00:00:00+00:00|built {repo}\n", stderr="",
+        )
+
+    monkeypatch.setattr(stores.subprocess, "run", run)
+    return timeouts
+
+
+class TestMatchVerbs:
+    VERBS = ["merge", "merged", "deploy", "classified", "re"]
+
+    def test_exact_and_prefix_both_ways(self):
+        found = stores._match_verbs(self.VERBS, "Merge")
+        assert found == {0: "exact", 1: "prefix"}
+        # The stored verb may be the shorter one; two-letter verbs are too short
+        assert stores._match_verbs(self.VERBS, "merges") == {0: "prefix", 1: "fuzzy"}
+        assert stores._match_verbs(self.VERBS, "rebase") == {}
+
+    def test_fuzzy_near_cutoff(self):
+        def ratio(a: str, b: str) -> float:
+            return difflib.SequenceMatcher(None, a, b).ratio()
+
+        assert stores.VERB_FUZZY_CUTOFF <= ratio("deplyo", "deploy") < 0.85
+        assert stores._match_verbs(self.VERBS, "deplyo") == {2: "fuzzy"}
+        assert 0.75 < ratio("deplyed", "deploy") < stores.VERB_FUZZY_CUTOFF
+        assert stores._match_verbs(self.VERBS, "deplyed") == {}
+
+    def test_empty_verb_matches_everything(self):
+        assert stores._match_verbs(self.VERBS, "") == {i: "any" for i in range(5)}
+
+
+class TestQueryActionLedger:
+    @pytest.fixture
+    def ledger(self, tmp_path, monkeypatch):
+        index, sequences, registry = load_actions(), load_sequences(), load_param_registry()
+        actions = [
+            record(index, sequences, registry, session="S1", verb=verb, target=target, params={})
+            for verb, target in [
+                ("merged", "PR-12"), ("classified", "intake_router"), ("merged", "pr-40"),
+            ]
+        ]
+        actions[2].timestamp = (datetime.now() - timedelta(days=40)).isoformat()
+        save_actions(index)
+        monkeypatch.setattr(stores, "LEDGER_FILE", tmp_path / "actions.yaml")
+        return actions
+
+    def test_prefix_hit_cited_by_action_id(self, ledger):
+        matches = stores.query_action_ledger("merge", "pr-")
+        assert [m.citation for m in matches] == [ledger[0].id, ledger[2].id]
+        assert {m.extras["verb_match"] for m in matches} == {"prefix"}
+        assert matches[0].target == "PR-12"
+        assert matches[0].excerpt.startswith("[merged] PR-12")
+
+    def test_fuzzy_hit(self, ledger):
+        matches = stores.query_action_ledger("clasified", "intake")
+        assert [(m.citation, m.extras["verb_match"]) for m in matches] == [
+            (ledger[1].id, "fuzzy"),
+        ]
+
+    def test_days_window(self, ledger):
+        assert [m.citation for m in stores.query_action_ledger("merged", "", days=30)] == [
+            ledger[0].id,
+        ]
+        assert len(stores.query_action_ledger("merged", "", days=60)) == 2
+
+    def test_missing_ledger(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(stores, "LEDGER_FILE", tmp_path / "absent" / "actions.yaml")
+        assert stores.query_action_ledger("merged", "") == []
+
+
+class TestCorpusIndex:
+    DOCS = {
+        "feedback_ledger.md": "Never rewrite action_ledger history by hand.",
+        "feedback_chain.md": "Chains live in chain-of-custody notes, see Action-Ledger.",
+        "feedback_git.md": "Run git log before filing; see precedent-engine.",
+        "project_artifact_x.md": "The LEDGER is append-only. ok.",
+        "notes.txt": "action_ledger outside the glob",
+    }
+    QUERIES = [
+        ["ledger"], ["action"], ["edge"], ["custody"], ["engine"],
+        ["action_ledger"], ["action-ledger"], ["ledger", "hand"], ["ok"],
+        ["ledger", "missing"], ["rewrite action"], [],
+    ]
+
+    @staticmethod
+    def _old_scan(root: Path, keywords: list[str], pattern: str = "*.md") -> list[Path]:
+        """The uncached scan the memory and plan stores used before indexing."""
+        return sorted(
+            path for path in root.glob(pattern)
+            if stores._matches_keywords(path.read_text(encoding="utf-8"), keywords)
+        )
+
+    def test_matches_old_substring_scan(self, tmp_path):
+        root = tmp_path / "memory"
+        root.mkdir()
+        for name, text in self.DOCS.items():
+            (root / name).write_text(text, encoding="utf-8")
+        index = CorpusIndex(root, tmp_path / "index" / "memory.db")
+
+        for keywords in self.QUERIES:
+            for pattern in ("*.md", "feedback_*.md"):
+                hits = [hit.path for hit in index.search(keywords, name_glob=pattern)]
+                assert hits == self._old_scan(root, keywords, pattern), (keywords, pattern)
+
+    def test_mid_identifier_keyword(self, tmp_path):
+        root = tmp_path / "memory"
+        root.mkdir()
+        (root / "feedback_a.md").write_text("see action_ledger", encoding="utf-8")
+        index = CorpusIndex(root, tmp_path / "memory.db")
+        assert [h.path.name for h in index.search(["ledger"])] == ["feedback_a.md"]
+        assert [h.path.name for h in index.search(["on_led"])] == ["feedback_a.md"]
+
+
+class TestGitLogDeadline:
+    def test_past_deadline_spawns_nothing(self, tmp_path, monkeypatch):
+        timeouts = _fake_git(monkeypatch, 0.0)
+        repos = [tmp_path / f"r{i}" for i in range(3)]
+        assert stores.query_git_log("built", "", repos, deadline=time.monotonic() - 1) == []
+        assert timeouts == []
+
+    def test_queued_repos_share_the_deadline(self, tmp_path, monkeypatch):
+        timeouts = _fake_git(monkeypatch, 0.2)
+        monkeypatch.setattr(stores, "GIT_LOG_WORKERS", 1)
+        repos = [tmp_path / f"r{i}" for i in range(10)]
+
+        start = time.monotonic()
+        matches = stores.query_git_log("built", "", repos, deadline=start + 0.5)
+        elapsed = time.monotonic() - start
+
+        assert elapsed < 0.9  # not 10 x 0.2s
+        assert 1 <= len(matches) < len(repos)
+        assert [m.excerpt for m in matches] == [f"built r{i}" for i in range(len(matches))]
+        assert all(t <= 0.5 for t in timeouts)
+
+
+class TestFanOutSearch:
+    @pytest.fixture
+    def quiet_stores(self, monkeypatch):
+        for name in ("query_action_ledger", "query_feedback_memories",
+                     "query_project_artifacts", "query_project_sessions",
+                     "query_originating_plans", "query_git_log"):
+            monkeypatch.setattr(stores, name, lambda *a, **k: [])
+
+    def test_slow_store_reported_as_timed_out(self, quiet_stores, monkeypatch):
+        def slow(keywords):
+            time.sleep(1.0)
+            return [stores.Match(store="feedback", citation="late", excerpt="late")]
+
+        monkeypatch.setattr(stores, "query_feedback_memories", slow)
+        start = time.monotonic()
+        report = search.fan_out_search("built", "ledger", store_timeout=0.2)
+
+        assert time.monotonic() - start < 0.8
+        assert report.timed_out == ["feedback"]
+        assert report.matches_by_store["feedback"] == []
+        assert len(report.stores_queried) == 6
@@ -0,0 +1,327 @@
+"""Tests for scripts/lib/progress.py — per-project gate evaluation."""
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "scripts"))
+
+from lib import progress, registry, snapshot_store, watch  # noqa: E402
+
+
+def _make_repo(root: Path) -> Path:
+    repo = root / "organvm-iv-taxis" / "demo"
+    (repo / ".github" / "workflows").mkdir(parents=True)
+    (repo / ".github" / "workflows" / "ci.yml").write_text("on: push\n")
+    (repo / "src" / "pkg").mkdir(parents=True)
+    (repo / "src" / "pkg" / "core.py").write_text("x = 1\n")
+    (repo / "tests").mkdir()
+    (repo / "tests" / "test_core.py").write_text("def test(): pass\n")
+    (repo / "web").mkdir()
+    (repo / "web" / "app.test.ts").write_text("")
+    (repo / "node_modules" / "dep").mkdir(parents=True)
+    (repo / "node_modules" / "dep" / "index.test.js").write_text("")
+    (repo / "README.md").write_text("word " * 120)
+    (repo / ".gitignore").write_text(".venv\n")
+    (repo / ".env").write_text("SECRET=1\n")
+    (repo / "seed.yaml").write_text("schema_version: 1\norgan: IV\nrepo: demo\n")
+    return repo
+
+
+class TestRepoFsSnapshot:
+    def test_single_pass_listing(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        fs = progress.RepoFsSnapshot.scan(repo)
+
+        assert fs.is_file("README.md")
+        assert fs.is_file(".github/workflows/ci.yml")
+        assert fs.is_dir("node_modules")
+        # Skipped directories are listed but not descended into
+        assert "node_modules/dep" not in fs.files
+        assert ("src/pkg", "core.py") in set(fs.walk("src"))
+
+    def test_probes_read_from_snapshot(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        fs = progress.RepoFsSnapshot.scan(repo)
+
+        assert progress.detect_languages(repo, fs)["Python"] == 2
+        assert progress.probe_security(repo, fs).exposed_secrets == [".env"]
+        assert progress.probe_scaffold(repo, fs).readme_words == 120
+        assert progress._has_code_files(repo, fs)
+
+    def test_tests_gate_ignores_skipped_dirs(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        cp = progress._eval_tests({}, repo, "standard")
+        assert cp.detail == "2 test file(s)"
+
+    def test_evaluate_project(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        entry = {"name": "demo", "org": "organvm-iv-taxis", "ci_workflow": "ci.yml"}
+        result = progress.evaluate_project(entry, "ORGAN-IV", repo)
+
+        gates = {c.name: c for c in result.checkpoints}
+        assert gates["SEED"].passed
+        assert gates["CI"].passed
+        assert gates["TESTS"].passed
+        assert result.primary_lang == "Python"
+
+
+class TestEvaluateAll:
+    def test_parallel_matches_serial_order(self, tmp_path):
+        _make_repo(tmp_path)
+        registry = {"organs": {"ORGAN-IV": {"repositories": [
+            {"name": name, "org": "organvm-iv-taxis"}
+            for name in ("demo", "missing-a", "missing-b", "missing-c")
+        ]}}}
+        serial = progress.evaluate_all(registry, tmp_path)
+        parallel = progress.evaluate_all(registry, tmp_path, workers=4)
+        assert [p.to_dict() for p in parallel] == [p.to_dict() for p in serial]
+        assert [p.repo for p in parallel] == ["demo", "missing-a", "missing-b", "missing-c"]
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=t", "-c", "user.email=t@t", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+class TestGitHealth:
+    def test_batched_probe(self, tmp_path):
+        repo = tmp_path / "repo"
+        repo.mkdir()
+        _git(repo, "init", "-q", "-b", "main")
+        for i in range(3):
+            _git(repo, "commit", "-q", "--allow-empty", "-m", f"c{i}")
+        _git(repo, "branch", "feature")
+        (repo / "new.txt").write_text("x")
+
+        counts = progress.CommitCountCache(tmp_path / "counts.json")
+        health = progress.probe_git_health(repo, counts)
+        assert health.branch_count == 2
+        assert health.has_uncommitted
+        assert health.last_commit_days == 0
+        assert health.total_commits == 3
+
+        counts.save()
+        _git(repo, "commit", "-q", "--allow-empty", "-m", "c3")
+        reloaded = progress.CommitCountCache(tmp_path / "counts.json")
+        assert progress.probe_git_health(repo, reloaded).total_commits == 4
+
+    def test_empty_repo(self, tmp_path):
+        _git(tmp_path, "init", "-q")
+        health = progress.probe_git_health(tmp_path)
+        assert health.branch_count == 0
+        assert health.total_commits == -1
+        assert health.last_commit_days == -1
+
+
+class TestEvaluationCache:
+    def test_round_trip(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        result = progress.evaluate_project({"name": "demo"}, "ORGAN-IV", repo)
+        assert progress.ProjectProgress.from_dict(result.to_dict()).to_dict() == result.to_dict()
+
+    def test_unchanged_repos_served_from_cache(self, tmp_path, monkeypatch):
+        repo = _make_repo(tmp_path / "ws")
+        _git(repo, "init", "-q")
+        _git(repo, "add", "-A")
+        _git(repo, "commit", "-q", "-m", "init")
+        registry = {"organs": {"ORGAN-IV": {"repositories": [
+            {"name": "demo", "org": "organvm-iv-taxis"},
+        ]}}}
+
+        calls = []
+        real = progress.evaluate_project
+        monkeypatch.setattr(
+            progress, "evaluate_project",
+            lambda *a, **kw: calls.append(a[0]["name"]) or real(*a, **kw),
+        )
+        cache = tmp_path / "cache"
+        first = progress.evaluate_all(registry, tmp_path / "ws", cache_dir=cache)
+        second = progress.evaluate_all(registry, tmp_path / "ws", cache_dir=cache)
+        assert calls == ["demo"]
+        assert [p.to_dict() for p in second] == [p.to_dict() for p in first]
+
+        (repo / "LICENSE").write_text("MIT\n")
+        third = progress.evaluate_all(registry, tmp_path / "ws", cache_dir=cache)
+        assert calls == ["demo", "demo"]
+        assert third[0].scaffold.has_license
+
+    def test_stamp_sees_files_inside_untracked_dirs(self, tmp_path):
+        repo = _make_repo(tmp_path)
+        _git(repo, "init", "-q")
+        _git(repo, "add", "README.md")
+        _git(repo, "commit", "-q", "-m", "init")
+        (repo / "tests" / "unit").mkdir()
+        (repo / "tests" / "unit" / "test_a.py").write_text("def test(): pass\n")
+        before = progress._repo_stamp(repo)
+
+        (repo / "tests" / "unit" / "test_b.py").write_text("def test(): pass\n")
+        assert progress._repo_stamp(repo) != before
+        after_add = progress._repo_stamp(repo)
+        (repo / "tests" / "unit" / "test_a.py").write_text("def test(): assert 1\n")
+        assert progress._repo_stamp(repo) != after_add
+
+
+def _snap(timestamp: str, passed: dict[str, list[str]]) -> dict:
+    projects = []
+    for repo, gates in passed.items():
+        checkpoints = [
+            {"name": g, "applicable": g != "DEPLOY", "passed": g in gates}
+            for g in progress.GATE_NAMES
+        ]
+        score = sum(c["applicable"] and c["passed"] for c in checkpoints)
+        projects.append({
+            "repo": repo, "organ": "ORGAN-IV", "profile": "code-full",
+            "score": score, "total": 9, "pct": int(score / 9 * 100),
+            "checkpoints": checkpoints,
+        })
+    return {"timestamp": timestamp, "label": "", "summary": {"sys_pct": 50.0},
+            "projects": projects}
+
+
+class TestSnapshotStore:
+    def test_history_queries(self, tmp_path):
+        snaps = [
+            _snap("2026-01-01T00:00:00", {"a": ["SEED", "CI"], "b": ["SEED"]}),
+            _snap("2026-01-02T00:00:00", {"a": ["SEED"], "b": ["SEED", "TESTS"]}),
+            _snap("2026-01-03T00:00:00", {"a": ["SEED", "CI", "DOCS"]}),
+        ]
+        store = snapshot_store.SnapshotStore(tmp_path)
+        for snap in snaps:
+            store.append_snapshot(snap)
+
+        reopened = snapshot_store.SnapshotStore(tmp_path)
+        assert len(reopened) == 3
+        assert [s for _, s, _, _ in reopened.score_history("a")] == [2, 1, 3]
+        assert [ts for ts, *_ in reopened.score_history("b", since="2026-01-02")] == [
+            "2026-01-02T00:00:00",
+        ]
+        assert reopened.gates_lost() == [("2026-01-02T00:00:00", "a", ["CI"])]
+        assert reopened.resolve("2026-01-02T12:00:00") == 1
+        assert reopened.resolve("-1") == 2
+
+    def test_compare_matches_json(self, tmp_path):
+        old = _snap("2026-01-01T00:00:00", {"a": ["SEED", "CI"], "b": ["SEED"]})
+        new = _snap("2026-01-02T00:00:00", {"a": ["SEED"], "c": ["SEED"]})
+        store = snapshot_store.SnapshotStore(tmp_path)
+        store.append_snapshot(old)
+        store.append_snapshot(new)
+
+        from_store = progress.compute_delta(store.load(0), store.load(1))
+        from_json = progress.compute_delta(old, new)
+        assert from_store.to_dict() == from_json.to_dict()
+
+    def test_truncated_append_is_repaired(self, tmp_path):
+        store = snapshot_store.SnapshotStore(tmp_path)
+        store.append_snapshot(_snap("2026-01-01T00:00:00", {"a": ["SEED"]}))
+        with open(tmp_path / "repo.col", "ab") as f:
+            f.write(b"\xff" * 12)  # rows from an append that never got indexed
+        store = snapshot_store.SnapshotStore(tmp_path)
+        store.append_snapshot(_snap("2026-01-02T00:00:00", {"a": ["SEED", "CI"]}))
+        reopened = snapshot_store.SnapshotStore(tmp_path)
+        assert [s for _, s, _, _ in reopened.score_history("a")] == [1, 2]
+
+    def test_torn_strings_line_is_dropped(self, tmp_path):
+        store = snapshot_store.SnapshotStore(tmp_path)
+        store.append_snapshot(_snap("2026-01-01T00:00:00", {"a": ["SEED"]}))
+        with open(tmp_path / "strings.jsonl", "a", encoding="utf-8") as f:
+            f.write('["repo", "ha')  # a string write cut off by a crash
+
+        store = snapshot_store.SnapshotStore(tmp_path)
+        assert len(store) == 1
+        store.append_snapshot(_snap("2026-01-02T00:00:00", {"a": ["SEED"], "héllo": ["CI"]}))
+        reopened = snapshot_store.SnapshotStore(tmp_path)
+        assert [s for _, s, _, _ in reopened.score_history("héllo")] == [1]
+        assert reopened.load(1)["projects"][1]["repo"] == "héllo"
+
+
+class TestWatch:
+    def _state(self, tmp_path):
+        _make_repo(tmp_path)
+        registry = {"organs": {"ORGAN-IV": {"repositories": [
+            {"name": "demo", "org": "organvm-iv-taxis"},
+            {"name": "missing", "org": "organvm-iv-taxis"},
+        ]}}}
+        return watch.ProgressWatch(registry, tmp_path)
+
+    def test_polling_watcher_reevaluates_changed_repo(self, tmp_path):
+        state = self._state(tmp_path)
+        (root,) = state.roots
+        watcher = watch.PollingWatcher(state.roots, interval=0.01)
+        assert watcher.wait(timeout=0.05) == set()
+
+        (root / "src" / "new").mkdir()
+        (root / "LICENSE").write_text("MIT\n")
+        updates = []
+        state.run(lambda results, updated: updates.append(updated), watcher, max_updates=1)
+
+        assert [p.repo for p in updates[0]] == ["demo"]
+        assert state.results[0].scaffold.has_license
+        assert [p.repo for p in state.results] == ["demo", "missing"]
+
+    def test_inotify_watcher_sees_edits_in_new_dirs(self, tmp_path):
+        state = self._state(tmp_path)
+        (root,) = state.roots
+        try:
+            watcher = watch.InotifyWatcher(state.roots)
+        except (OSError, AttributeError):
+            pytest.skip("inotify unavailable")
+        try:
+            (root / "lib").mkdir()
+            assert watcher.wait(timeout=2) == {root}
+            (root / "lib" / "mod.py").write_text("x = 1\n")
+            assert watcher.wait(timeout=2) == {root}
+            assert watcher.wait(timeout=0.05) == set()
+        finally:
+            watcher.close()
+
+
+class TestProgressMatrix:
+    def _projects(self):
+        def project(repo, organ, passed, status="LOCAL", staleness=-1):
+            checkpoints = [
+                progress.Checkpoint(g, g in passed, g != "DEPLOY", "full")
+                for g in progress.GATE_NAMES
+            ]
+            return progress.ProjectProgress(
+                repo=repo, organ=organ, tier="standard", profile=progress.Profile.CODE_FULL,
+                checkpoints=checkpoints, promotion_status=status, staleness_days=staleness,
+            )
+        return [
+            project("b", "ORGAN-IV", {"SEED", "SCAFFOLD", "CI"}),
+            project("a", "ORGAN-I", {"SEED"}, staleness=120),
+            project("c", "ORGAN-IV", set(progress.GATE_NAMES), status="CANDIDATE"),
+        ]
+
+    def test_columns_match_project_properties(self):
+        projects = self._projects()
+        m = progress.ProgressMatrix(projects)
+        assert m.score == [p.score for p in projects]
+        assert m.total == [p.total for p in projects]
+        assert m.pct == [p.pct for p in projects]
+        assert m.promotion_ready == [p.promotion_ready for p in projects]
+        assert m.stale == [p.is_stale for p in projects]
+
+    def test_filters_and_sort(self):
+        m = progress.ProgressMatrix(self._projects())
+        assert m.where(failing_gate="ci").repo == ["a"]
+        assert m.where(promo_ready=True).repo == ["b", "c"]
+        assert m.where(passing=True).repo == ["c"]
+        assert m.where(organ="ORGAN-IV", failing=True).repo == ["b"]
+        assert m.sorted("score").repo == ["c", "b", "a"]
+        assert m.sorted("stale").repo == ["a", "b", "c"]
+        assert list(m.by_organ()) == ["ORGAN-IV", "ORGAN-I"]
+
+
+class TestLoadRegistry:
+    def test_fallback_notice_goes_to_stderr(self, tmp_path, monkeypatch, capsys):
+        canonical = tmp_path / "registry-v2.json"
+        canonical.write_text('{"organs": {}}', encoding="utf-8")
+        monkeypatch.setattr(registry, "DEFAULT_REGISTRY_CANDIDATES", (canonical,))
+        assert progress.load_registry(tmp_path / "missing.json") == {"organs": {}}
+        out, err = capsys.readouterr()
+        assert out == ""
+        assert "Falling back to" in err
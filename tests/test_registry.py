@@ -0,0 +1,99 @@
+"""Tests for scripts/lib/registry.py — shared registry loading and parse cache."""
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+
+from lib import registry  # noqa: E402
+
+
+def _write(path: Path, data: dict) -> Path:
+    path.write_text(json.dumps(data), encoding="utf-8")
+    return path
+
+
+REGISTRY = {
+    "organs": {
+        "ORGAN-I": {
+            "repositories": [
+                {"org": "organvm-i-theoria", "name": "engine", "tier": "flagship",
+                 "promotion_status": "PUBLIC_PROCESS"},
+                {"org": "organvm-i-theoria", "name": "forge", "tier": "standard",
+                 "promotion_status": "LOCAL"},
+                {"org": "", "name": "unnamed"},
+            ],
+        },
+        "ORGAN-II": {
+            "repositories": [
+                {"org": "organvm-ii-poiesis", "name": "art", "tier": "flagship",
+                 "promotion_status": "LOCAL"},
+            ],
+        },
+    },
+}
+
+
+class TestRegistry:
+    def test_entries_and_indexes(self, tmp_path):
+        reg = registry.load_registry(_write(tmp_path / "r.json", REGISTRY), candidates=())
+        assert list(reg.entries) == [
+            "organvm-i-theoria/engine", "organvm-i-theoria/forge", "organvm-ii-poiesis/art",
+        ]
+        assert reg.entries["organvm-ii-poiesis/art"]["_organ_id"] == "ORGAN-II"
+        assert "_organ_id" not in reg.data["organs"]["ORGAN-II"]["repositories"][0]
+        assert reg.by_organ["ORGAN-I"] == ["organvm-i-theoria/engine", "organvm-i-theoria/forge"]
+        assert reg.select(tier="flagship", status="LOCAL") == ["organvm-ii-poiesis/art"]
+        assert reg.select(organ="ORGAN-III") == []
+
+    def test_cache_hit_skips_read_and_parse(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / "r.json", REGISTRY)
+        first = registry.load_registry(path, candidates=())
+        assert len(list(registry.REGISTRY_CACHE_DIR.glob("*.pickle"))) == 1
+
+        def _no_parse(*args, **kwargs):
+            raise AssertionError("registry parsed despite a cache hit")
+
+        with monkeypatch.context() as m:
+            m.setattr(registry.Registry, "build", _no_parse)
+            m.setattr(registry.json, "loads", _no_parse)
+            again = registry.load_registry(path, candidates=())
+        assert again.sha256 == first.sha256
+        assert again.entries == first.entries
+
+        _write(path, {"organs": {}})
+        assert registry.load_registry(path, candidates=()).entries == {}
+        # The entry for the old version was replaced, not kept alongside
+        assert len(list(registry.REGISTRY_CACHE_DIR.glob("*.pickle"))) == 1
+
+    def test_miss_parses_once(self, tmp_path, monkeypatch):
+        path = _write(tmp_path / "r.json", REGISTRY)
+        calls = []
+        loads = registry.json.loads
+        monkeypatch.setattr(registry.json, "loads", lambda raw: calls.append(raw) or loads(raw))
+        registry.load_registry(path, candidates=())
+        assert len(calls) == 1
+
+    def test_redirect_decision_cached(self, tmp_path, monkeypatch):
+        canonical = _write(tmp_path / "registry-v2.json", REGISTRY)
+        stub = _write(tmp_path / "registry.json", {"_redirect": "registry-v2.json"})
+        first = registry.load_registry(stub, candidates=(canonical,), log=None)
+        assert first.path == canonical
+        assert len(list(registry.REGISTRY_CACHE_DIR.glob("*.pickle"))) == 2
+
+        def _no_read(*args, **kwargs):
+            raise AssertionError("registry read despite a cache hit")
+
+        with monkeypatch.context() as m:
+            m.setattr(Path, "read_bytes", _no_read)
+            again = registry.load_registry(stub, candidates=(canonical,), log=None)
+        assert again.path == canonical
+        assert again.entries == first.entries
+
+    def test_redirect_to_itself_rejected(self, tmp_path):
+        stub = _write(tmp_path / "registry.json", {"_redirect": "registry-v2.json"})
+        other = _write(tmp_path / "old-registry.json", {"_redirect": "registry.json"})
+        with pytest.raises(FileNotFoundError, match="no alternate canonical"):
+            registry.load_registry(other, candidates=(stub,), log=None)